@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+KAGR Case Competition - Precomputed Aggregate Cube
+Materializes sum/count/mean of attendance and every revenue stream over
+Sport x Day_of_Week x Start_Time x Opponent_Type x Academic_Year so charts read slices instead of re-grouping
+"""
+
+import functools
+import hashlib
+import itertools
+
+import numpy as np
+import pandas as pd
+
+from data_loader import DATA_FILE, load_data, register_derived_cache
+from tracing import span
+
+DIMENSIONS = ('Sport', 'Day_of_Week', 'Start_Time', 'Opponent_Type', 'Academic_Year')
+
+MEASURES = ('Attendance', 'Venue_Capacity', 'Venue_Utilization', 'Revenue_per_Attendee',
+            'Ticket_Revenue', 'Concession_Revenue', 'Parking_Revenue',
+            'Merchandise_Revenue', 'Total_Revenue')
+
+STATS = ('sum', 'count', 'mean')
+
+# Revenue streams in the order the Current State Dashboard shows them
+REVENUE_SOURCES = {
+    'Ticket Sales': 'Ticket_Revenue',
+    'Concessions': 'Concession_Revenue',
+    'Merchandise': 'Merchandise_Revenue',
+    'Parking': 'Parking_Revenue',
+}
+
+# ============================================================================
+# CUBE
+# ============================================================================
+
+class AggregateCube:
+    """
+    Every rollup (all 2^5 dimension subsets) is computed once from a single grouped pass
+    Lookups are a dict access plus column selection
+    """
+
+    def __init__(self, sports_df, dimensions=DIMENSIONS, measures=MEASURES):
+        self.dimensions = tuple(d for d in dimensions if d in sports_df.columns)
+        self.measures = tuple(m for m in measures if m in sports_df.columns)
+        self.n_events = len(sports_df)
+
+        # Single vectorized pass at the finest grain
+        values = sports_df[list(self.measures)].astype(np.float64)
+        keys = [sports_df[d] for d in self.dimensions]
+        grouped = values.groupby(keys, observed=True, dropna=False, sort=True)
+        base = pd.concat({'sum': grouped.sum(), 'count': grouped.count()}, axis=1)
+
+        # Coarser rollups are re-aggregated from the (small) base cell table
+        self._rollups = {}
+        for size in range(len(self.dimensions) + 1):
+            for dims in itertools.combinations(self.dimensions, size):
+                self._rollups[dims] = self._rollup(base, dims)
+
+    def _rollup(self, base, dims):
+        """Sum the base cells up to the given dimensions and derive means"""
+        if dims:
+            cells = base.groupby(level=list(dims), observed=True, dropna=False, sort=True).sum()
+        else:
+            cells = base.sum().to_frame(name='All').T
+        means = cells['sum'] / cells['count'].replace(0, np.nan)
+        return pd.concat({'sum': cells['sum'], 'count': cells['count'], 'mean': means}, axis=1)
+
+    def _canonical(self, by):
+        """Dimension tuple in cube order"""
+        if isinstance(by, str):
+            by = (by,)
+        unknown = [d for d in by if d not in self.dimensions]
+        if unknown:
+            raise KeyError(f"Not a cube dimension: {unknown}")
+        return tuple(d for d in self.dimensions if d in by)
+
+    # ------------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------------
+
+    def slice(self, by=(), measure=None, stat='mean'):
+        """
+        Rollup over the `by` dimensions
+        Returns a Series for one measure, or a DataFrame of all measures for the stat
+        """
+        if isinstance(by, str):
+            by = (by,)
+        cells = self._rollups[self._canonical(by)][stat]
+        if len(by) > 1 and tuple(by) != self._canonical(by):
+            cells = cells.reorder_levels(list(by))
+        return cells if measure is None else cells[measure]
+
+    def value(self, measure, stat='mean', **coords):
+        """Single cell, e.g. value('Attendance', Sport='Football', Day_of_Week='Saturday'); NaN if empty"""
+        dims = self._canonical(tuple(coords))
+        cells = self._rollups[dims][stat][measure]
+        if not dims:
+            return float(cells.iloc[0])
+        key = coords[dims[0]] if len(dims) == 1 else tuple(coords[d] for d in dims)
+        return float(cells.get(key, np.nan))
+
+    def cache_token(self):
+        """Content hash of the finest-grain cells, so render-cache keys follow the data rather than the object"""
+        cells = self._rollups[self.dimensions]
+        digest = hashlib.sha256(repr(list(cells.columns)).encode())
+        digest.update(pd.util.hash_pandas_object(cells, index=True).values.tobytes())
+        return digest.hexdigest()
+
+    def total(self, measure, stat='sum'):
+        """Grand total across every event"""
+        return self.value(measure, stat)
+
+    def kpis(self, **coords):
+        """
+        The Current State Dashboard numbers, for every event or one cell (e.g. kpis(Sport='Football')):
+        event count, total and per-source revenue in dollars, and per-event means of attendance,
+        utilization and revenue per attendee
+        """
+        events = self.value('Attendance', 'count', **coords) if coords else self.n_events
+        return {
+            'total_events': 0 if np.isnan(events) else int(events),
+            'total_revenue': self.value('Total_Revenue', 'sum', **coords),
+            'revenue_by_source': {source: self.value(column, 'sum', **coords)
+                                  for source, column in REVENUE_SOURCES.items()},
+            'avg_attendance': self.value('Attendance', 'mean', **coords),
+            'avg_utilization': self.value('Venue_Utilization', 'mean', **coords),
+            'revenue_per_attendee': self.value('Revenue_per_Attendee', 'mean', **coords),
+        }
+
+    def relabel(self, by, dimension, mapping, measure=None, stat='mean'):
+        """
+        Rollup after mapping one dimension's labels onto coarser buckets
+        (e.g. Start_Time Morning/Afternoon -> Day); sums and counts are re-added, never re-grouped from events
+        """
+        if isinstance(by, str):
+            by = (by,)
+        rollup = self._rollups[self._canonical(tuple(by) + (dimension,))]
+        index = rollup.index.to_frame(index=False)
+        index[dimension] = index[dimension].astype(object).map(mapping)
+        cells = rollup[['sum', 'count']].copy()
+        cells.index = pd.MultiIndex.from_frame(index) if len(index.columns) > 1 else pd.Index(index[dimension])
+        cells = cells.groupby(level=list(by) + [dimension], sort=False).sum()
+
+        if stat == 'mean':
+            result = cells['sum'] / cells['count'].replace(0, np.nan)
+        else:
+            result = cells[stat]
+        return result if measure is None else result[measure]
+
+
+@functools.lru_cache(maxsize=None)
+def _load_cube(file_path):
+    """Build the cube for a workbook once per process"""
+    sports_df, _ = load_data(file_path)
+    with span('aggregate:cube', 'data'):
+        return AggregateCube(sports_df)
+
+
+register_derived_cache(_load_cube.cache_clear)
+
+
+def load_cube(file_path=DATA_FILE):
+    """Return the shared cube built from the shared typed event frame"""
+    return _load_cube(file_path)
+
+
+if __name__ == "__main__":
+    import time
+
+    sports_df, _ = load_data()
+    start = time.perf_counter()
+    cube = AggregateCube(sports_df)
+    elapsed = time.perf_counter() - start
+
+    print(f"🧊 Cube built over {cube.n_events} events in {elapsed * 1000:.1f} ms "
+          f"({len(cube._rollups)} rollups x {len(cube.measures)} measures)")
+    print("\n📊 Avg attendance by Sport x Day_of_Week:")
+    print(cube.slice(('Sport', 'Day_of_Week'), 'Attendance').unstack().round(0).to_string())
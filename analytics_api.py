@@ -0,0 +1,406 @@
+#!/usr/bin/env python3
+"""
+KAGR Case Competition - Local Analytics API
+Read-only HTTP/JSON endpoints over the aggregate cube and survey engine (KPIs, per-sport breakdowns, survey
+segments and the plotly chart data). Responses are cached in memory with a TTL and LRU bound and carry ETags,
+so dashboards polling an unchanged workbook get 304s instead of recomputed numbers.
+"""
+
+import argparse
+import hashlib
+import http.server
+import json
+import math
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import OrderedDict
+from urllib.parse import parse_qs, urlsplit
+
+from data_loader import DATA_FILE
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = int(os.environ.get('KAGR_API_PORT', 8766))
+
+DEFAULT_TTL = 300          # seconds a computed response is served from memory
+DEFAULT_MAX_ENTRIES = 512  # responses kept (least recently used go first)
+
+# Query parameter -> cube dimension, for filtering KPIs and sport breakdowns
+FILTERS = {
+    'sport': 'Sport',
+    'day_of_week': 'Day_of_Week',
+    'start_time': 'Start_Time',
+    'opponent_type': 'Opponent_Type',
+    'academic_year': 'Academic_Year',
+}
+
+# Query parameter -> survey segment keyword
+SEGMENTS = ('customer_type', 'age_band', 'companion')
+
+# ============================================================================
+# RESPONSE CACHE
+# ============================================================================
+
+class ResponseCache:
+    """
+    Serialized responses keyed by request, each with its ETag
+    Entries expire `ttl` seconds after they were computed; past `max_entries` the least recently used go first
+    """
+
+    def __init__(self, ttl=DEFAULT_TTL, max_entries=DEFAULT_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()   # key -> (expires, etag, body, data version)
+        self._lock = threading.Lock()
+
+    def get(self, key, version=None):
+        """
+        (etag, body) or None when missing, expired or computed from another `version` of the data
+        (a request that started before a workbook change can store its body after the cache was cleared)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic() or entry[3] != version:
+                self._entries.pop(key, None)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1], entry[2]
+
+    def put(self, key, body, version=None):
+        """Store a body computed from `version` of the data and return its ETag"""
+        etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, etag, body, version)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return etag
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+# ============================================================================
+# ANALYTICS (the numbers behind each endpoint)
+# ============================================================================
+
+def _json_safe(value):
+    """NaN (an empty cell) becomes null; numpy scalars become Python numbers"""
+    if isinstance(value, dict):
+        return {str(k): _json_safe(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_safe(v) for v in value]
+    if hasattr(value, 'item'):
+        value = value.item()
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    return value
+
+
+class Analytics:
+    """
+    Endpoint handlers over the shared cube and survey engine of one workbook
+    The workbook is watched by size and mtime; a change drops the loaded data and every cached response
+    """
+
+    def __init__(self, file_path=DATA_FILE, cache=None):
+        self.file_path = os.path.abspath(file_path)
+        self.cache = cache if cache is not None else ResponseCache()
+        self.started = time.time()
+        self.reloads = 0
+        self._workbook = None
+        self._lock = threading.Lock()
+        self._routes = {
+            '/api/health': self.health,
+            '/api/kpis': self.kpis,
+            '/api/sports': self.sports,
+            '/api/breakdown': self.breakdown,
+            '/api/survey/interest': self.survey_interest,
+            '/api/survey/crosstab': self.survey_crosstab,
+            '/api/charts': self.charts,
+        }
+
+    # ------------------------------------------------------------------------
+    # Data
+    # ------------------------------------------------------------------------
+
+    def _workbook_stat(self):
+        stat = os.stat(self.file_path)
+        return stat.st_size, stat.st_mtime_ns
+
+    def refresh(self):
+        """Reload lazily after the workbook changed on disk (checked once per request, a stat call)"""
+        import data_loader
+
+        current = self._workbook_stat()
+        if current == self._workbook:
+            return False
+        with self._lock:
+            if current != self._workbook:
+                if self._workbook is not None:
+                    data_loader.reset_cache()
+                    self.reloads += 1
+                self.cache.clear()
+                self._workbook = current
+        return True
+
+    def load(self):
+        """(cube, survey engine), built once per workbook; the lock keeps concurrent first requests to one load"""
+        from aggregate_cube import load_cube
+        from survey_engine import load_survey_engine
+
+        with self._lock:
+            return load_cube(self.file_path), load_survey_engine(self.file_path)
+
+    def _filters(self, query, allowed=FILTERS):
+        """Cube coordinates from the query string, checked against the levels in the data"""
+        cube, _ = self.load()
+        coords = {}
+        for param, dim in allowed.items():
+            if param not in query:
+                continue
+            levels = {str(level): level for level in cube.slice(dim).index}
+            if query[param] not in levels:
+                raise KeyError(f"Unknown {param} {query[param]!r}; one of: {', '.join(levels)}")
+            coords[dim] = levels[query[param]]
+        return coords
+
+    # ------------------------------------------------------------------------
+    # Endpoints (each returns a JSON-able object)
+    # ------------------------------------------------------------------------
+
+    def health(self, query):
+        return {
+            'workbook': os.path.basename(self.file_path),
+            'uptime_s': round(time.time() - self.started, 1),
+            'workbook_reloads': self.reloads,
+            'cache': {'entries': len(self.cache), 'hits': self.cache.hits, 'misses': self.cache.misses,
+                      'ttl_s': self.cache.ttl},
+            'endpoints': sorted(self._routes),
+        }
+
+    def kpis(self, query):
+        """Current State Dashboard KPIs, optionally filtered (?sport=Football&academic_year=2023-24)"""
+        cube, _ = self.load()
+        coords = self._filters(query)
+        return {'filters': {dim: str(level) for dim, level in coords.items()}, **cube.kpis(**coords)}
+
+    def sports(self, query):
+        """Per-sport KPIs and survey interest, highest revenue first (filters other than sport apply)"""
+        cube, survey = self.load()
+        coords = self._filters(query, {k: v for k, v in FILTERS.items() if k != 'sport'})
+        interest = survey.interest_by_sport()
+        rows = []
+        for sport in cube.slice('Sport').index:
+            row = {'sport': str(sport), **cube.kpis(Sport=sport, **coords)}
+            row['interest_pct'] = float(interest.get(str(sport), float('nan')))
+            rows.append(row)
+        rows.sort(key=lambda row: -(row['total_revenue'] if row['total_events'] else 0))
+        return {'filters': {dim: str(level) for dim, level in coords.items()}, 'sports': rows}
+
+    def breakdown(self, query):
+        """Any cube rollup: ?by=Day_of_Week,Start_Time&measure=Total_Revenue&stat=sum"""
+        from aggregate_cube import STATS
+
+        cube, _ = self.load()
+        by = tuple(d for d in query.get('by', 'Sport').split(',') if d)
+        measure = query.get('measure', 'Total_Revenue')
+        stat = query.get('stat', 'mean')
+        if measure not in cube.measures:
+            raise KeyError(f"Unknown measure {measure!r}; one of: {', '.join(cube.measures)}")
+        if stat not in STATS:
+            raise KeyError(f"Unknown stat {stat!r}; one of: {', '.join(STATS)}")
+        series = cube.slice(by, measure, stat)
+        rows = []
+        for key, value in series.items():
+            key = key if isinstance(key, tuple) else (key,)
+            rows.append({**{dim: str(level) for dim, level in zip(by, key)}, 'value': value})
+        return {'by': list(by), 'measure': measure, 'stat': stat, 'rows': rows}
+
+    def _segment(self, query, survey):
+        """Survey segment keywords from the query string, checked against the levels in the data"""
+        from survey_engine import ALL
+
+        segment = {}
+        for key in SEGMENTS:
+            if key not in query:
+                continue
+            levels = [level for level in survey.levels[key.replace('_', ' ').title()] if level != ALL]
+            if query[key] not in levels:
+                raise KeyError(f"Unknown {key} {query[key]!r}; one of: {', '.join(levels)}")
+            segment[key] = query[key]
+        return segment
+
+    def survey_interest(self, query):
+        """% of respondents interested in each sport, for a segment (?customer_type=Alumni&age_band=25-34)"""
+        _, survey = self.load()
+        segment = self._segment(query, survey)
+        interest = survey.interest_by_sport(**segment)
+        return {'segment': segment, 'respondents': survey.count(**segment), 'interest_pct': interest.to_dict()}
+
+    def survey_crosstab(self, query):
+        """
+        One question across two segment dimensions: ?question=Overall Satisfaction&rows=Customer Type
+        (a full question name, or a unique prefix or suffix of one)
+        """
+        from survey_engine import DIMENSIONS
+
+        _, survey = self.load()
+        if 'question' not in query:
+            raise ValueError("Missing query parameter 'question'")
+        rows, columns = query.get('rows', 'Customer Type'), query.get('columns', 'Age Band')
+        for param, dim in (('rows', rows), ('columns', columns)):
+            if dim not in DIMENSIONS:
+                raise KeyError(f"Unknown {param} dimension {dim!r}; one of: {', '.join(DIMENSIONS)}")
+        if rows == columns:
+            raise ValueError(f"rows and columns must be different dimensions, both are {rows!r}")
+        fixed = self._segment(query, survey)
+        table = survey.crosstab(query['question'], rows, columns, **fixed)
+        sizes = survey.sizes(rows, columns, **fixed)
+        return {
+            'question': query['question'], 'rows': rows, 'columns': columns, 'fixed': fixed,
+            'values': {str(r): table.loc[r].to_dict() for r in table.index},
+            'respondents': {str(r): sizes.loc[r].to_dict() for r in sizes.index},
+        }
+
+    def charts(self, query):
+        """The nine visualizations' names and titles"""
+        import generate_visualizations as gv
+
+        return {'charts': [{'name': task.name, 'title': task.title, 'path': f"/api/charts/{task.name}"}
+                           for task in gv.TASKS]}
+
+    def chart(self, name):
+        """Plotly figure JSON for one visualization (data and layout, ready for Plotly.newPlot)"""
+        import generate_visualizations as gv
+
+        if name not in gv.TASKS_BY_NAME:
+            raise KeyError(f"Unknown chart {name!r}; see /api/charts")
+        cube, survey = self.load()
+        return gv.TASKS_BY_NAME[name].build({'cube': cube, 'survey': survey}).to_json().encode()
+
+    # ------------------------------------------------------------------------
+    # Dispatch
+    # ------------------------------------------------------------------------
+
+    def respond(self, path, query):
+        """(etag, body bytes) for a GET, computed once per TTL; raises LookupError for unknown routes"""
+        self.refresh()
+        if path == '/api/health':
+            return None, json.dumps(self.health(query)).encode()   # live counters, never cached
+        key = (path, tuple(sorted(query.items())))
+        version = self._workbook
+        cached = self.cache.get(key, version)
+        if cached is not None:
+            return cached
+        if path.startswith('/api/charts/'):
+            body = self.chart(path[len('/api/charts/'):])
+        elif path in self._routes:
+            body = json.dumps(_json_safe(self._routes[path](query)), allow_nan=False).encode()
+        else:
+            raise LookupError(f"No endpoint {path}; see /api/health")
+        return self.cache.put(key, body, version), body
+
+# ============================================================================
+# HTTP SERVER
+# ============================================================================
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    server_version = 'KAGRAnalyticsAPI/1'
+    protocol_version = 'HTTP/1.1'   # keep-alive for dashboards polling several endpoints
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send(self, status, body=b'', etag=None):
+        self.send_response(status)
+        if etag is not None:
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', f"private, max-age={int(self.server.analytics.cache.ttl)}, must-revalidate")
+        if status != 304:
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if status != 304 and self.command != 'HEAD':
+            self.wfile.write(body)
+
+    def _error(self, status, message):
+        self._send(status, json.dumps({'error': message}).encode())
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        try:
+            etag, body = self.server.analytics.respond(url.path.rstrip('/') or '/', query)
+        except LookupError as exc:
+            # KeyError: an unknown sport, question, measure...; other LookupErrors: an unknown endpoint
+            status = 400 if isinstance(exc, KeyError) else 404
+            return self._error(status, exc.args[0] if exc.args else str(exc))
+        except ValueError as exc:
+            return self._error(400, str(exc))
+        except Exception as exc:
+            traceback.print_exc()
+            return self._error(500, f"{type(exc).__name__}: {exc}")
+
+        match = self.headers.get('If-None-Match')
+        if etag is not None and match and (match.strip() == '*' or etag in [t.strip() for t in match.split(',')]):
+            return self._send(304, etag=etag)
+        self._send(200, body, etag)
+
+    do_HEAD = do_GET
+
+
+def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, file_path=DATA_FILE, ttl=DEFAULT_TTL,
+          max_entries=DEFAULT_MAX_ENTRIES, preload=True, verbose=False):
+    """Answer requests on a thread per connection until Ctrl-C"""
+    server = http.server.ThreadingHTTPServer((host, port), _Handler)
+    server.analytics = Analytics(file_path, ResponseCache(ttl, max_entries))
+    server.verbose = verbose
+    if preload:
+        print("📂 Loading data...")
+        start = time.perf_counter()
+        server.analytics.refresh()
+        cube, survey = server.analytics.load()
+        print(f"✅ {cube.n_events} events, {survey.respondents} survey responses in "
+              f"{time.perf_counter() - start:.1f}s")
+    print(f"🚀 Analytics API on http://{host}:{port}/api/health (pid {os.getpid()})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    print("👋 Analytics API stopped")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local HTTP/JSON API for the KPIs, breakdowns and chart data")
+    parser.add_argument('--host', default=DEFAULT_HOST, help="interface to bind (default: %(default)s)")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help="port (env KAGR_API_PORT)")
+    parser.add_argument('--data', default=DATA_FILE, help="workbook path")
+    parser.add_argument('--ttl', type=float, default=DEFAULT_TTL, help="seconds a response stays cached")
+    parser.add_argument('--max-entries', type=int, default=DEFAULT_MAX_ENTRIES, help="cached responses kept")
+    parser.add_argument('--no-preload', action='store_true', help="load the workbook on the first request")
+    parser.add_argument('-v', '--verbose', action='store_true', help="log every request")
+    args = parser.parse_args(argv)
+
+    try:
+        serve(args.host, args.port, args.data, args.ttl, args.max_entries, not args.no_preload, args.verbose)
+    except OSError as exc:
+        print(f"❌ Cannot listen: {exc}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+KAGR Case Competition - Attendance Forecasting
+Ridge model of log attendance on the event sheet's game features (with per-sport effects) that keeps only its
+sufficient statistics, so appended seasons warm-start the fit and batched prediction is a coefficient lookup
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from data_loader import DATA_FILE, load_sports_data
+
+FEATURES = ['Sport', 'Venue', 'Day_of_Week', 'Month', 'Opponent_Type', 'Game_Importance', 'Start_Time',
+            'Local_Events_Competing']
+
+# Conditions whose effect differs by sport (a rivalry moves football far more than softball)
+SPORT_INTERACTIONS = ['Day_of_Week', 'Month', 'Opponent_Type', 'Game_Importance', 'Start_Time',
+                      'Local_Events_Competing']
+
+TERMS = [(feature,) for feature in FEATURES] + [('Sport', feature) for feature in SPORT_INTERACTIONS]
+
+RIDGE_ALPHA = 1.0
+TRAIN_CHUNK = 50_000
+
+# ============================================================================
+# ENCODING
+# ============================================================================
+
+def _categorical(series):
+    """Categorical view of a column (strings, ints and bools alike) with string categories"""
+    cats = series if isinstance(series.dtype, pd.CategoricalDtype) else series.astype('category')
+    return cats.cat.codes.to_numpy(), [str(c) for c in cats.cat.categories]
+
+
+class AttendanceForecaster:
+    """
+    Predicts Attendance and Venue_Utilization for scheduled games
+    Every (term, level) seen in training is one column of a one-hot design; levels never seen contribute nothing.
+    Only X'X, X'y and the row count are stored, so `update` with a new season is exactly a refit on all the
+    data (optionally down-weighting older seasons) and the saved model stays small however much it saw
+    """
+
+    def __init__(self, alpha=RIDGE_ALPHA):
+        self.alpha = alpha
+        self.columns = [('Intercept',)]
+        self.levels = {term: {} for term in TERMS}   # term -> {level key: column}
+        self.capacity = {}                           # venue -> capacity
+        self.xtx = np.zeros((1, 1))
+        self.xty = np.zeros(1)
+        self.rows = 0.0
+        self.coef = np.zeros(1)
+
+    # ------------------------------------------------------------------------
+    # Design
+    # ------------------------------------------------------------------------
+
+    def _register(self, term, key):
+        self.levels[term][key] = len(self.columns)
+        self.columns.append((' x '.join(term),) + key)
+
+    def _encode(self, df, grow=False):
+        """(rows, terms) column indices; unseen levels map to a trailing always-zero column"""
+        missing = [f for f in FEATURES if f not in df.columns]
+        if missing:
+            raise ValueError(f"Schedule is missing feature column(s) {missing}")
+        codes = {feature: _categorical(df[feature]) for feature in FEATURES}
+
+        if grow:
+            for term in TERMS:
+                present = np.unique(np.stack([codes[f][0] for f in term], axis=1), axis=0)
+                for row in present:
+                    if (row < 0).any():
+                        continue
+                    key = tuple(codes[f][1][c] for f, c in zip(term, row))
+                    if key not in self.levels[term]:
+                        self._register(term, key)
+            self._grow_stats()
+
+        unseen = len(self.columns)
+        index = np.empty((len(df), len(TERMS)), dtype=np.int32)
+        for t, term in enumerate(TERMS):
+            names = [codes[f][1] for f in term]
+            # Lookup table over the frame's own categories (+1 slot so code -1 lands on `unseen`)
+            lut = np.full([len(n) + 1 for n in names], unseen, dtype=np.int32)
+            for key, column in self.levels[term].items():
+                position = tuple(n.index(k) if k in n else None for n, k in zip(names, key))
+                if None not in position:
+                    lut[position] = column
+            index[:, t] = lut[tuple(codes[f][0] for f in term)]
+        return index
+
+    def _grow_stats(self):
+        """Pad the sufficient statistics with zeros for newly registered columns"""
+        n_new = len(self.columns) - len(self.xty)
+        if n_new > 0:
+            self.xtx = np.pad(self.xtx, ((0, n_new), (0, n_new)))
+            self.xty = np.pad(self.xty, (0, n_new))
+
+    # ------------------------------------------------------------------------
+    # Training
+    # ------------------------------------------------------------------------
+
+    def update(self, sports_df, decay=1.0):
+        """
+        Fold games into the model and refit (warm start: earlier data lives on in the statistics)
+        `decay` < 1 scales down everything seen so far first, weighting the new season more
+        """
+        df = sports_df[sports_df['Attendance'] > 0]
+        if decay != 1.0:
+            self.xtx *= decay
+            self.xty *= decay
+            self.rows *= decay
+
+        index = self._encode(df, grow=True)
+        target = np.log(df['Attendance'].to_numpy(dtype=np.float64))
+        n_cols = len(self.columns)
+        for lo in range(0, len(df), TRAIN_CHUNK):
+            rows = index[lo:lo + TRAIN_CHUNK]
+            X = np.zeros((len(rows), n_cols + 1))
+            X[:, 0] = 1
+            np.put_along_axis(X, rows, 1, axis=1)
+            X = X[:, :n_cols]
+            self.xtx += X.T @ X
+            self.xty += X.T @ target[lo:lo + TRAIN_CHUNK]
+        self.rows += len(df)
+
+        venues = df.groupby(df['Venue'].astype(str), observed=True)['Venue_Capacity'].max()
+        self.capacity.update({venue: int(cap) for venue, cap in venues.items()})
+        return self.refit()
+
+    fit = update
+
+    def refit(self, alpha=None):
+        """Solve the ridge system from the stored statistics (the intercept is not penalized)"""
+        if alpha is not None:
+            self.alpha = alpha
+        penalty = np.eye(len(self.xty)) * self.alpha
+        penalty[0, 0] = 0
+        self.coef = np.linalg.solve(self.xtx + penalty, self.xty)
+        return self
+
+    # ------------------------------------------------------------------------
+    # Inference
+    # ------------------------------------------------------------------------
+
+    def predict(self, schedule):
+        """
+        Attendance and Venue_Utilization (%) for every game, vectorized over the whole schedule
+        Capacity comes from the schedule's Venue_Capacity column when present, else from the venues seen in training
+        """
+        index = self._encode(schedule)
+        coef = np.append(self.coef, 0.0)
+        attendance = np.exp(self.coef[0] + coef[index].sum(axis=1))
+
+        if 'Venue_Capacity' in schedule.columns:
+            capacity = schedule['Venue_Capacity'].to_numpy(dtype=np.float64)
+        else:
+            codes, venues = _categorical(schedule['Venue'])
+            lut = np.array([self.capacity.get(v, np.nan) for v in venues] + [np.nan], dtype=np.float64)
+            capacity = lut[codes]
+        attendance = np.where(np.isnan(capacity), attendance, np.minimum(attendance, capacity))
+        return pd.DataFrame({
+            'Predicted_Attendance': np.rint(attendance),
+            'Predicted_Utilization': attendance / capacity * 100,
+        }, index=schedule.index)
+
+    def score(self, sports_df):
+        """MAE and R^2 of predicted attendance against the actuals"""
+        actual = sports_df['Attendance'].to_numpy(dtype=np.float64)
+        predicted = self.predict(sports_df)['Predicted_Attendance'].to_numpy()
+        residual = actual - predicted
+        return {
+            'games': len(actual),
+            'mae': float(np.abs(residual).mean()),
+            'r2': float(1 - (residual @ residual) / ((actual - actual.mean()) @ (actual - actual.mean()))),
+        }
+
+    # ------------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------------
+
+    def save(self, path):
+        """Statistics, coefficients and vocabulary in one .npz (no pickle)"""
+        meta = {
+            'alpha': self.alpha,
+            'rows': self.rows,
+            'columns': self.columns,
+            'levels': [[list(term), [[list(key), column] for key, column in levels.items()]]
+                       for term, levels in self.levels.items()],
+            'capacity': self.capacity,
+        }
+        np.savez_compressed(path, xtx=self.xtx, xty=self.xty, coef=self.coef, meta=json.dumps(meta))
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            meta = json.loads(str(data['meta']))
+            model = cls(alpha=meta['alpha'])
+            model.xtx, model.xty, model.coef = data['xtx'], data['xty'], data['coef']
+        model.rows = meta['rows']
+        model.columns = [tuple(column) for column in meta['columns']]
+        for term, levels in meta['levels']:
+            model.levels[tuple(term)] = {tuple(key): column for key, column in levels}
+        model.capacity = meta['capacity']
+        return model
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Train, warm-start and run the attendance forecaster")
+    parser.add_argument('--data', default=DATA_FILE, help="workbook with the midwest_state_sports sheet")
+    parser.add_argument('--model', default='attendance_model.npz', help="model file to load/save")
+    parser.add_argument('--holdout', help="train without this academic year, score on it, then warm-start with it")
+    parser.add_argument('--update', action='store_true', help="warm-start the saved model with --data")
+    parser.add_argument('--decay', type=float, default=1.0, help="weight kept by earlier data on --update")
+    parser.add_argument('--predict', help="CSV/Parquet schedule of upcoming games to forecast")
+    parser.add_argument('--output', help="write the forecasts to this CSV")
+    parser.add_argument('--bench', type=int, metavar='N', help="time batched prediction on N synthetic games")
+    args = parser.parse_args()
+
+    if args.predict or args.bench:
+        model = AttendanceForecaster.load(args.model)
+    else:
+        print("📂 Loading data...")
+        sports_df = load_sports_data(args.data)
+        start = time.perf_counter()
+        if args.update:
+            model = AttendanceForecaster.load(args.model).update(sports_df, decay=args.decay)
+        elif args.holdout:
+            seasons = sports_df['Academic_Year'] == args.holdout
+            model = AttendanceForecaster().fit(sports_df[~seasons])
+            held = model.score(sports_df[seasons])
+            print(f"📊 {args.holdout} holdout: {held['games']} games, MAE {held['mae']:,.0f}, R² {held['r2']:.3f}")
+            model.update(sports_df[seasons])
+        else:
+            model = AttendanceForecaster().fit(sports_df)
+        fitted = model.score(sports_df)
+        print(f"📊 In-sample: {fitted['games']} games, MAE {fitted['mae']:,.0f}, R² {fitted['r2']:.3f}")
+        print(f"⏱️  trained in {(time.perf_counter() - start) * 1000:.1f} ms ({len(model.columns)} columns)")
+        model.save(args.model)
+        print(f"✅ Saved {args.model}")
+
+    if args.predict:
+        if args.predict.lower().endswith(('.parquet', '.pq')):
+            schedule = pd.read_parquet(args.predict)
+        else:
+            schedule = pd.read_csv(args.predict)
+        forecast = model.predict(schedule)
+        out = pd.concat([schedule, forecast], axis=1)
+        print(out[['Sport', 'Opponent_Type', 'Game_Importance', 'Predicted_Attendance',
+                   'Predicted_Utilization']].head(20).to_string(float_format=lambda x: f"{x:,.1f}"))
+        if args.output:
+            out.to_csv(args.output, index=False)
+            print(f"✅ Wrote {len(out):,} forecasts to {args.output}")
+
+    if args.bench:
+        sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmarks'))
+        from synthetic_data import make_sports_frame
+
+        schedule = make_sports_frame(args.bench)
+        model.predict(schedule.head(100))
+        start = time.perf_counter()
+        model.predict(schedule)
+        print(f"⏱️  {args.bench:,} games predicted in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
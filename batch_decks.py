@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+"""
+KAGR Case Competition - Batch Deck Generation
+One deck per university (or per sport) from a data-driven slide template, built across a worker pool
+"""
+
+import argparse
+import copy
+import io
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from data_loader import DATA_FILE, load_data, revenue_by_source
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+TITLE_COLOR = (0, 51, 102)
+BODY_COLOR = (100, 100, 100)
+UTILIZATION_TARGET = 60.0
+
+# Slide text is str.format'ed against the metrics from deck_metrics(); charts name a builder in CHARTS.
+# A JSON file with the same structure can be passed with --template.
+DECK_TEMPLATE = [
+    {
+        'layout': 'title',
+        'title': "Generating ${target_m:.1f}M in Incremental Revenue",
+        'subtitle': "Strategic Initiatives for {name}",
+        'footer': "KODING with KAGR Case Competition",
+    },
+    {
+        'layout': 'bullets',
+        'title': "The Challenge & Context",
+        'sections': [
+            {'heading': "The Challenge:", 'bullets': [
+                "NCAA vs. House settlement: ${target_m:.1f}M annual impact",
+                "Bottom Line: Need {growth_needed_pct:.0f}% revenue growth to remain competitive",
+            ]},
+            {'heading': "Current Position:", 'bullets': [
+                "Total Revenue: ${total_revenue_m:.1f}M across {events:,} events",
+                "Average attendance: {avg_attendance:,.0f} ({avg_utilization:.1f}% of capacity)",
+                "Revenue per attendee: ${revenue_per_attendee:.2f}",
+                "Corporate share of attendance: {corporate_pct:.1f}%",
+            ]},
+        ],
+    },
+    {
+        'layout': 'chart',
+        'title': "Current State: Revenue Composition",
+        'chart': 'revenue_mix',
+    },
+    {
+        'layout': 'chart',
+        'title': "Capacity Utilization by {breakdown_label}",
+        'chart': 'utilization',
+        'bullets': [
+            "Lowest: {weakest} at {weakest_utilization:.1f}%",
+            "Strongest: {strongest} at {strongest_utilization:.1f}%",
+            "Gap to {utilization_target:.0f}%: {weakest_gap_seats:,.0f} seats/game",
+            "Opportunity: ${weakest_opportunity_m:.1f}M annually",
+        ],
+    },
+    {
+        'layout': 'bullets',
+        'title': "Key Numbers: {name}",
+        'sections': [
+            {'heading': "Revenue Mix:", 'bullets': [
+                "{source}: ${value_m:.1f}M ({share:.1f}%)"
+            ], 'repeat': 'revenue_sources'},
+        ],
+    },
+]
+
+# ============================================================================
+# METRICS (computed in the parent; workers only receive these small dicts)
+# ============================================================================
+
+def deck_metrics(group_df, name, breakdown, target_m=20.5):
+    """Every number a deck template can reference, plus the small series the charts need"""
+    sources = {source: value / 1e6 for source, value in revenue_by_source(group_df).items()}
+    total_m = sum(sources.values())
+    attendance = group_df['Attendance'].to_numpy(dtype=np.float64)
+
+    grouped = group_df.groupby(breakdown, observed=True)
+    utilization = grouped['Venue_Utilization'].mean().astype(np.float64)
+    events_per_group = grouped.size()
+    weakest, strongest = utilization.idxmin(), utilization.idxmax()
+
+    # Seats per game to lift the weakest group to the target, valued at its revenue per attendee
+    weakest_df = group_df[group_df[breakdown] == weakest]
+    weakest_capacity = weakest_df['Venue_Capacity'].to_numpy(dtype=np.float64).mean()
+    gap_seats = max(0.0, UTILIZATION_TARGET / 100 * weakest_capacity
+                    - weakest_df['Attendance'].to_numpy(dtype=np.float64).mean())
+    weakest_rpa = (weakest_df['Total_Revenue'].to_numpy(dtype=np.float64).sum()
+                   / max(weakest_df['Attendance'].to_numpy(dtype=np.float64).sum(), 1))
+    # Annualized over the academic years in the data
+    n_years = max(group_df['Academic_Year'].nunique(), 1) if 'Academic_Year' in group_df else 1
+    opportunity_m = gap_seats * weakest_rpa * events_per_group[weakest] / n_years / 1e6
+
+    return {
+        'name': name,
+        'breakdown_label': breakdown.replace('_', ' '),
+        'events': int(len(group_df)),
+        'target_m': target_m,
+        'total_revenue_m': total_m,
+        'growth_needed_pct': target_m / total_m * 100 if total_m else 0.0,
+        'avg_attendance': attendance.mean(),
+        'avg_utilization': float(group_df['Venue_Utilization'].to_numpy(dtype=np.float64).mean()),
+        'revenue_per_attendee': total_m * 1e6 / attendance.sum() if attendance.sum() else 0.0,
+        'corporate_pct': group_df['Corporate_Count'].to_numpy(dtype=np.float64).sum() / attendance.sum() * 100
+                         if attendance.sum() else 0.0,
+        'utilization_target': UTILIZATION_TARGET,
+        'weakest': str(weakest),
+        'weakest_utilization': float(utilization[weakest]),
+        'strongest': str(strongest),
+        'strongest_utilization': float(utilization[strongest]),
+        'weakest_gap_seats': gap_seats,
+        'weakest_opportunity_m': opportunity_m,
+        'revenue_sources': [{'source': source, 'value_m': value, 'share': value / total_m * 100 if total_m else 0.0}
+                            for source, value in sources.items()],
+        'charts': {
+            'revenue_mix': sources,
+            'utilization': {str(k): float(v) for k, v in utilization.items()},
+        },
+    }
+
+
+def batch_metrics(sports_df, by='University', names=None, target_m=20.5):
+    """Metrics for every university (breakdown by sport) or every sport (breakdown by day of week)"""
+    breakdown = 'Sport' if by == 'University' else 'Day_of_Week'
+    metrics = []
+    for name, group_df in sports_df.groupby(by, observed=True):
+        if names and name not in names:
+            continue
+        metrics.append(deck_metrics(group_df, str(name), breakdown, target_m))
+    return metrics
+
+
+# ============================================================================
+# CHARTS (module level so the render cache can fingerprint them)
+# ============================================================================
+
+def revenue_mix_chart(sources):
+    """Revenue composition donut for one entity"""
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=(10, 8))
+    total = sum(sources.values())
+    wedges, texts, autotexts = ax.pie(
+        sources.values(), labels=sources.keys(),
+        autopct=lambda pct: f'${pct/100*total:.1f}M\n({pct:.1f}%)',
+        startangle=90, colors=['#FF6B6B', '#4ECDC4', '#45B7D1', '#FFA07A'],
+        wedgeprops=dict(width=0.5, edgecolor='white', linewidth=3),
+        textprops={'fontsize': 12, 'weight': 'bold'}
+    )
+    for autotext in autotexts:
+        autotext.set_color('white')
+    ax.text(0, 0, f'Total Revenue\n${total:.1f}M', ha='center', va='center', fontsize=18, weight='bold')
+    ax.set_title('Athletic Revenue Composition', fontsize=18, weight='bold', pad=20)
+    plt.tight_layout()
+    return fig
+
+
+def utilization_chart(utilization):
+    """Capacity utilization per breakdown group, red below the target"""
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=(12, 8))
+    labels, values = list(utilization.keys()), list(utilization.values())
+    colors = ['#2ca02c' if v >= UTILIZATION_TARGET else '#d62728' for v in values]
+    ax.bar(labels, values, color=colors, edgecolor='black', linewidth=1.5, alpha=0.8)
+    for i, value in enumerate(values):
+        ax.text(i, value + 1, f'{value:.1f}%', ha='center', va='bottom', fontsize=12, weight='bold')
+    ax.axhline(UTILIZATION_TARGET, color='blue', linestyle='--', linewidth=2,
+               label=f'Target: {UTILIZATION_TARGET:.0f}%', alpha=0.7)
+    ax.set_ylabel('Capacity Utilization %', fontsize=13, weight='bold')
+    ax.set_ylim(0, 110)
+    ax.legend(fontsize=11)
+    ax.grid(axis='y', alpha=0.3, linestyle='--')
+    ax.set_axisbelow(True)
+    plt.setp(ax.get_xticklabels(), rotation=20, ha='right')
+    plt.tight_layout()
+    return fig
+
+
+CHARTS = {
+    'revenue_mix': revenue_mix_chart,
+    'utilization': utilization_chart,
+}
+
+# ============================================================================
+# DECK ASSEMBLY (runs in the workers)
+# ============================================================================
+
+_TEMPLATE = None
+_LOGO_BYTES = None
+_MEDIA = None
+
+
+def _init_worker(base_pptx=None, logo=None):
+    """
+    Per-process setup paid once per worker instead of once per deck:
+    imports, headless matplotlib with its font cache, the base .pptx (masters, layouts, theme) parsed into a
+    Presentation that every deck clones, the logo read into memory, and the media cache every deck of this worker
+    shares (each image parsed and compressed once)
+    """
+    global _TEMPLATE, _LOGO_BYTES, _MEDIA
+    from render_pool import _init_worker as init_render_worker
+    init_render_worker()
+
+    import matplotlib.pyplot as plt
+    import pptx
+    from pptx import Presentation
+    from pptx_stream import MediaCache
+
+    if base_pptx is None:
+        base_pptx = os.path.join(os.path.dirname(pptx.__file__), 'templates', 'default.pptx')
+    _TEMPLATE = Presentation(base_pptx)
+    _LOGO_BYTES = None
+    if logo is not None:
+        with open(logo, 'rb') as f:
+            _LOGO_BYTES = f.read()
+    _MEDIA = MediaCache()
+
+    # Resolve fonts now so the first chart of every worker doesn't pay for it
+    fig, _ = plt.subplots()
+    fig.canvas.draw()
+    plt.close(fig)
+
+
+def _fill(text, metrics):
+    return text.format(**metrics)
+
+
+def _add_text(slide, text, left, top, width, height, size, bold=False, color=BODY_COLOR, align=None):
+    from pptx.dml.color import RGBColor
+    from pptx.util import Inches, Pt
+
+    frame = slide.shapes.add_textbox(Inches(left), Inches(top), Inches(width), Inches(height)).text_frame
+    frame.word_wrap = True
+    frame.text = text
+    para = frame.paragraphs[0]
+    para.font.size = Pt(size)
+    para.font.bold = bold
+    para.font.color.rgb = RGBColor(*color)
+    if align is not None:
+        para.alignment = align
+    return frame
+
+
+def _add_bullets(frame, sections, metrics, size=16):
+    from pptx.dml.color import RGBColor
+    from pptx.util import Pt
+
+    first = True
+    for section in sections:
+        para = frame.paragraphs[0] if first else frame.add_paragraph()
+        first = False
+        para.text = _fill(section['heading'], metrics)
+        para.font.size = Pt(size + 4)
+        para.font.bold = True
+        para.font.color.rgb = RGBColor(*TITLE_COLOR)
+
+        rows = metrics[section['repeat']] if 'repeat' in section else [{}]
+        for row in rows:
+            for bullet in section['bullets']:
+                para = frame.add_paragraph()
+                para.text = _fill(bullet, {**metrics, **row})
+                para.level = 1
+                para.font.size = Pt(size)
+                para.space_after = Pt(6)
+
+
+def _chart_png(chart_name, metrics, width_in):
+    """Render through the shared render cache, sized for its slide box, so unchanged entities cost a file read"""
+    from render_cache import RenderCache
+    from render_pool import ChartJob, render_charts
+
+    job = ChartJob(chart_name, CHARTS[chart_name], (metrics['charts'][chart_name],), width_in=width_in)
+    png, = render_charts([job], workers=1, cache=RenderCache())
+    return png
+
+
+def build_deck(metrics, template, path):
+    """Assemble one deck from the template, streaming slides into `path`"""
+    from pptx.enum.text import PP_ALIGN
+    from pptx.util import Inches
+    from pptx_stream import StreamingPresentationWriter
+
+    # A deep copy of the parsed base: its own package and XML trees, without re-reading the zip or re-parsing
+    prs = copy.deepcopy(_TEMPLATE)
+    prs.slide_width = Inches(10)
+    prs.slide_height = Inches(7.5)
+    blank = prs.slide_layouts[6]
+
+    with StreamingPresentationWriter(prs, path, media=_MEDIA):
+        for spec in template:
+            slide = prs.slides.add_slide(blank)
+            if _LOGO_BYTES is not None:
+                # Same bytes on every slide: one image part per deck
+                slide.shapes.add_picture(io.BytesIO(_LOGO_BYTES), Inches(8.9), Inches(6.9), height=Inches(0.45))
+            title = _fill(spec['title'], metrics)
+            if spec['layout'] == 'title':
+                _add_text(slide, title, 1, 2, 8, 1.5, 44, bold=True, color=TITLE_COLOR, align=PP_ALIGN.CENTER)
+                _add_text(slide, _fill(spec['subtitle'], metrics), 1, 3.5, 8, 1, 28, align=PP_ALIGN.CENTER)
+                if spec.get('footer'):
+                    _add_text(slide, _fill(spec['footer'], metrics), 1, 5.5, 8, 0.8, 18, align=PP_ALIGN.CENTER)
+                continue
+
+            _add_text(slide, title, 0.5, 0.3, 9, 0.6, 28, bold=True, color=TITLE_COLOR)
+            if spec['layout'] == 'bullets':
+                frame = _add_text(slide, '', 0.5, 1.2, 9, 5.8, 16)
+                _add_bullets(frame, spec['sections'], metrics)
+            elif spec['layout'] == 'chart':
+                if spec.get('bullets'):
+                    frame = _add_text(slide, '', 0.5, 1.2, 3.8, 5.5, 14)
+                    _add_bullets(frame, [{'heading': 'Key Points:', 'bullets': spec['bullets']}], metrics, size=14)
+                    png = _chart_png(spec['chart'], metrics, 5)
+                    slide.shapes.add_picture(io.BytesIO(png), Inches(4.5), Inches(1.2), width=Inches(5))
+                else:
+                    png = _chart_png(spec['chart'], metrics, 9)
+                    slide.shapes.add_picture(io.BytesIO(png), Inches(0.5), Inches(1.2), width=Inches(9))
+            else:
+                raise ValueError(f"Unknown slide layout {spec['layout']!r}")
+    return path
+
+
+def _build_one(args):
+    metrics, template, path = args
+    start = time.perf_counter()
+    build_deck(metrics, template, path)
+    return path, time.perf_counter() - start
+
+
+def slugify(name):
+    return re.sub(r'[^A-Za-z0-9]+', '_', name).strip('_')
+
+
+def build_decks(metrics_list, template=DECK_TEMPLATE, out_dir='decks', workers=None, base_pptx=None, logo=None):
+    """Build every deck across a process pool; returns [(path, seconds)] in input order"""
+    os.makedirs(out_dir, exist_ok=True)
+    tasks = [(metrics, template, os.path.join(out_dir, f"{slugify(metrics['name'])}.pptx"))
+             for metrics in metrics_list]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(tasks)))
+
+    if workers == 1:
+        _init_worker(base_pptx, logo)
+        return [_build_one(task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(base_pptx, logo)) as pool:
+        return list(pool.map(_build_one, tasks))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate one deck per university or sport")
+    parser.add_argument('--by', choices=['University', 'Sport'], default='University')
+    parser.add_argument('--only', nargs='+', help="restrict to these universities/sports")
+    parser.add_argument('--data', default=DATA_FILE, help="workbook path")
+    parser.add_argument('--template', help="JSON slide template (default: the built-in DECK_TEMPLATE)")
+    parser.add_argument('--base', help="base .pptx whose masters, layouts and theme every deck uses")
+    parser.add_argument('--logo', help="image placed in the corner of every slide")
+    parser.add_argument('--target', type=float, default=20.5, help="revenue gap to close, $M")
+    parser.add_argument('--out', default='decks', help="output directory")
+    parser.add_argument('--workers', type=int, default=None, help="processes (default: one per core)")
+    args = parser.parse_args()
+
+    template = DECK_TEMPLATE
+    if args.template:
+        with open(args.template) as f:
+            template = json.load(f)
+
+    print("📂 Loading data...")
+    sports_df, _ = load_data(args.data)
+    metrics_list = batch_metrics(sports_df, args.by, args.only, args.target)
+    if not metrics_list:
+        print(f"❌ No {args.by} matched {args.only}")
+        return 1
+
+    print(f"📊 Building {len(metrics_list)} decks by {args.by}...")
+    start = time.perf_counter()
+    results = build_decks(metrics_list, template, args.out, args.workers, args.base, args.logo)
+    elapsed = time.perf_counter() - start
+
+    for path, seconds in results:
+        print(f"✅ {path} ({seconds:.1f}s)")
+    print(f"\n⏱️  {len(results)} decks in {elapsed:.1f}s ({elapsed / len(results):.2f}s per deck wall time)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""
+Benchmark: the end-to-end analysis and deck pipeline on synthetic data at 312 / 100k / 10M / 100M events
+Times every stage (load, features, aggregation, each chart render, HTML export, PPTX save) with its peak RSS
+and writes the results as JSON keyed by commit, so two runs can be compared for regressions
+"""
+
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import os
+import platform
+import re
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+DEFAULT_SIZES = ['312', '100k', '10M', '100M']
+RESULTS_DIR = os.path.join(REPO_DIR, 'benchmarks', 'results')
+
+# The real survey has 95 respondents for 312 events; synthetic surveys keep that ratio up to a cap
+SURVEY_RATIO = 95 / 312
+SURVEY_MAX_ROWS = 1_000_000
+
+# Above this many events the frame is not held in memory: the stream_aggregates path runs instead
+STREAM_ABOVE = 20_000_000
+GENERATE_CHUNK = 1_000_000
+
+# --compare flags a stage when it got this much slower (or hungrier) and the change is above the noise floor
+DEFAULT_THRESHOLD = 1.25
+MIN_SECONDS_DELTA = 0.02
+MIN_RSS_DELTA_MB = 20
+
+# ============================================================================
+# MEASUREMENT
+# ============================================================================
+
+def reset_peak_rss():
+    """Reset the kernel's high-water mark (Linux); elsewhere the peak stays process-wide"""
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+    except OSError:
+        pass
+
+
+def peak_rss_mb():
+    """Peak resident set size since the last reset (VmHWM), else since process start"""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 / 1024 if sys.platform == 'darwin' else peak / 1024
+
+
+class StageRecorder:
+    """Wall time and peak RSS for each `with recorder.stage(name):` block; the block may add fields (e.g. bytes)"""
+
+    def __init__(self):
+        self.stages = []
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        extra = {}
+        reset_peak_rss()
+        start = time.perf_counter()
+        yield extra
+        row = {'stage': name, 'seconds': time.perf_counter() - start, 'peak_rss_mb': peak_rss_mb()}
+        row.update(extra)
+        self.stages.append(row)
+
+# ============================================================================
+# SYNTHETIC INPUTS
+# ============================================================================
+
+def parse_size(text):
+    """'312', '100k', '10M', '1e6' -> events"""
+    match = re.fullmatch(r'\s*([\d.e+]+)\s*([kKmM]?)\s*', text)
+    if not match:
+        raise argparse.ArgumentTypeError(f"not an event count: {text!r}")
+    scale = {'': 1, 'k': 1_000, 'm': 1_000_000}[match.group(2).lower()]
+    return int(float(match.group(1)) * scale)
+
+
+def survey_rows(n_events):
+    return max(1, min(round(n_events * SURVEY_RATIO), SURVEY_MAX_ROWS))
+
+
+def write_inputs(n_events, tmp):
+    """Event and survey Parquet exports, generated in bounded chunks; features are left for the pipeline"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    from synthetic_data import make_sports_frame, make_survey_frame
+
+    sports_path = os.path.join(tmp, 'sports.parquet')
+    writer = None
+    for i, lo in enumerate(range(0, n_events, GENERATE_CHUNK)):
+        chunk = make_sports_frame(min(GENERATE_CHUNK, n_events - lo), seed=i, first_event_id=lo)
+        chunk = chunk.drop(columns=['Total_Revenue', 'Revenue_per_Attendee', 'Venue_Utilization'])
+        table = pa.Table.from_pandas(chunk, preserve_index=False)
+        if writer is None:
+            writer = pq.ParquetWriter(sports_path, table.schema)
+        writer.write_table(table)
+    writer.close()
+
+    survey_path = os.path.join(tmp, 'survey.parquet')
+    make_survey_frame(survey_rows(n_events)).to_parquet(survey_path, index=False)
+    return sports_path, survey_path
+
+# ============================================================================
+# PIPELINE STAGES
+# ============================================================================
+
+def _deck_save(recorder, images, path):
+    """One picture slide per PNG; the assembly and prs.save are timed separately"""
+    from pptx import Presentation
+    from pptx.util import Inches
+
+    with recorder.stage('pptx_assemble'):
+        prs = Presentation()
+        prs.slide_width, prs.slide_height = Inches(13.333), Inches(7.5)
+        for name, png in images.items():
+            slide = prs.slides.add_slide(prs.slide_layouts[6])
+            slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(12), Inches(0.6)).text_frame.text = name
+            slide.shapes.add_picture(io.BytesIO(png), Inches(1.5), Inches(1.1), width=Inches(10))
+    with recorder.stage('pptx_save') as extra:
+        prs.save(path)
+        extra['bytes'] = os.path.getsize(path)
+
+
+def run_synthetic(n_events, tmp, args):
+    """Every stage for one synthetic size; returns (stages, notes)"""
+    import pandas as pd
+
+    from data_loader import add_sports_features, add_survey_features, apply_sports_dtypes, apply_survey_dtypes
+
+    recorder = StageRecorder()
+    notes = {'events': n_events, 'survey_rows': survey_rows(n_events)}
+
+    start = time.perf_counter()
+    sports_path, survey_path = write_inputs(n_events, tmp)
+    notes['generate_seconds'] = time.perf_counter() - start
+    notes['input_bytes'] = os.path.getsize(sports_path) + os.path.getsize(survey_path)
+
+    if n_events > args.stream_above:
+        from streaming_ingest import stream_aggregates
+
+        # Load, features and the per-Sport/per-Venue rollups fused into one bounded-memory pass;
+        # the (capped) survey still fits in memory
+        notes['mode'] = 'stream'
+        with recorder.stage('stream_aggregate'):
+            stream_aggregates(sports_path)
+        with recorder.stage('load:survey'):
+            survey_df = apply_survey_dtypes(pd.read_parquet(survey_path))
+        with recorder.stage('features:survey'):
+            add_survey_features(survey_df, current_year=2025)
+        with recorder.stage('aggregate:survey'):
+            from survey_engine import SurveyEngine
+
+            SurveyEngine(survey_df)
+        return recorder.stages, notes
+
+    notes['mode'] = 'memory'
+    with recorder.stage('load'):
+        sports_df = apply_sports_dtypes(pd.read_parquet(sports_path))
+        survey_df = apply_survey_dtypes(pd.read_parquet(survey_path))
+    with recorder.stage('features'):
+        add_sports_features(sports_df)
+        add_survey_features(survey_df, current_year=2025)
+
+    from aggregate_cube import AggregateCube
+    from survey_engine import SurveyEngine
+
+    inputs = {}
+    with recorder.stage('aggregate:cube'):
+        inputs['cube'] = AggregateCube(sports_df)
+    with recorder.stage('aggregate:survey'):
+        inputs['survey'] = SurveyEngine(survey_df)
+    del sports_df, survey_df
+
+    import generate_visualizations as gv
+    from html_export import FigureExporter
+    from plotly_static import figure_png
+
+    # Each chart: build the plotly figure from the aggregates and rasterize it for the deck
+    # (without the pinned kaleido the figures are only built, and the deck gets no pictures)
+    figures, images = {}, {}
+    for task in gv.TASKS:
+        with recorder.stage(f"chart:{task.name}") as extra:
+            figures[task] = task.build(inputs)
+            if 'static_export' not in notes:
+                try:
+                    images[task.name] = figure_png(figures[task], ppi=args.ppi)
+                    extra['bytes'] = len(images[task.name])
+                except RuntimeError as exc:
+                    notes['static_export'] = str(exc)
+
+    with recorder.stage('html_export') as extra:
+        exporter = FigureExporter(os.path.join(tmp, 'html'), args.html_mode)
+        for task, fig in figures.items():
+            exporter.save(fig, task.output, task.title)
+        exporter.write_dashboard()
+        extra['bytes'] = exporter.total_bytes()
+
+    _deck_save(recorder, images, os.path.join(tmp, 'deck.pptx'))
+    return recorder.stages, notes
+
+
+def run_deck(tmp, args):
+    """The create_presentation charts on the real workbook (they read it themselves, so size does not apply)"""
+    import create_presentation as cp
+    from aggregate_cube import load_cube
+    from data_loader import load_data
+    from render_pool import figure_to_png
+    from survey_engine import load_survey_engine
+
+    recorder = StageRecorder()
+    with recorder.stage('load'):
+        sports_df, _ = load_data()
+        load_cube()
+        load_survey_engine()
+
+    images = {}
+    for func in cp.CHART_BUILDERS:
+        with recorder.stage(f"chart:{func.__name__}") as extra:
+            images[func.__name__] = figure_to_png(func(), width_in=cp.CHART_PLACEMENT[func].inches, ppi=args.ppi)
+            extra['bytes'] = len(images[func.__name__])
+
+    _deck_save(recorder, images, os.path.join(tmp, 'deck.pptx'))
+    return recorder.stages, {'events': len(sports_df), 'mode': 'workbook'}
+
+
+def run_target(target, args):
+    """One target in this process: 'deck' or an event count"""
+    import matplotlib
+    matplotlib.use('Agg')
+
+    with tempfile.TemporaryDirectory(dir=args.workdir) as tmp:
+        reset_peak_rss()
+        baseline = peak_rss_mb()
+        if target == 'deck':
+            stages, notes = run_deck(tmp, args)
+        else:
+            stages, notes = run_synthetic(parse_size(target), tmp, args)
+
+    return dict({'target': target, 'baseline_rss_mb': baseline,
+                 'seconds': sum(s['seconds'] for s in stages),
+                 'peak_rss_mb': max(s['peak_rss_mb'] for s in stages), 'stages': stages}, **notes)
+
+# ============================================================================
+# DRIVER
+# ============================================================================
+
+def git_commit():
+    """(commit, dirty) of the working tree being measured"""
+    def git(*cmd):
+        return subprocess.run(['git', *cmd], cwd=REPO_DIR, capture_output=True, text=True).stdout.strip()
+
+    try:
+        return git('rev-parse', 'HEAD') or None, bool(git('status', '--porcelain', '--untracked-files=no'))
+    except OSError:
+        return None, None
+
+
+def run_isolated(target, args):
+    """Run one target in a fresh interpreter so its peak RSS is its own"""
+    with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
+        out = f.name
+    cmd = [sys.executable, os.path.abspath(__file__), '--worker', target, '--json', out,
+           '--html-mode', args.html_mode, '--ppi', str(args.ppi), '--stream-above', str(args.stream_above)]
+    if args.workdir:
+        cmd += ['--workdir', args.workdir]
+    try:
+        proc = subprocess.run(cmd, capture_output=True, text=True)
+        if proc.returncode != 0:
+            # A killed worker (e.g. out of memory) is recorded rather than ending the whole run
+            return {'target': target, 'error': proc.stderr.strip().splitlines()[-1:] or [f"exit {proc.returncode}"]}
+        with open(out) as f:
+            return json.load(f)
+    finally:
+        os.remove(out)
+
+
+def print_run(run):
+    if 'error' in run:
+        print(f"❌ {run['target']}: {run['error'][0]}")
+        return
+    label = f"{run['events']:,} events" + (f", {run['survey_rows']:,} respondents" if 'survey_rows' in run else '')
+    print(f"\n📊 {run['target']} ({label}, {run['mode']})")
+    for row in run['stages']:
+        size = f"{row['bytes'] / 1024:>10,.0f} KB" if 'bytes' in row else ''
+        print(f"   {row['stage']:<50} {row['seconds']:>9.3f} s {row['peak_rss_mb']:>9.1f} MB {size}")
+    print(f"   {'total':<50} {run['seconds']:>9.3f} s {run['peak_rss_mb']:>9.1f} MB")
+
+
+def compare(old, new, threshold=DEFAULT_THRESHOLD):
+    """Per (target, stage) time and peak-RSS ratios; returns the number of regressions"""
+    before = {(run['target'], row['stage']): row for run in old['runs'] if 'stages' in run for row in run['stages']}
+    print(f"\n🔍 {(old.get('commit') or '?')[:10]} -> {(new.get('commit') or '?')[:10]}")
+    print(f"   {'target':<6} {'stage':<50} {'old s':>9} {'new s':>9} {'x':>6} {'old MB':>8} {'new MB':>8}")
+    regressions = 0
+    for run in new['runs']:
+        for row in run.get('stages', []):
+            prev = before.get((run['target'], row['stage']))
+            if prev is None:
+                continue
+            slower = (row['seconds'] > prev['seconds'] * threshold and
+                      row['seconds'] - prev['seconds'] > MIN_SECONDS_DELTA)
+            hungrier = (row['peak_rss_mb'] > prev['peak_rss_mb'] * threshold and
+                        row['peak_rss_mb'] - prev['peak_rss_mb'] > MIN_RSS_DELTA_MB)
+            regressions += slower or hungrier
+            ratio = row['seconds'] / prev['seconds'] if prev['seconds'] else float('nan')
+            print(f"   {run['target']:<6} {row['stage']:<50} {prev['seconds']:>9.3f} {row['seconds']:>9.3f} "
+                  f"{ratio:>6.2f} {prev['peak_rss_mb']:>8.1f} {row['peak_rss_mb']:>8.1f}"
+                  f"{'  ⚠️  slower' if slower else ''}{'  ⚠️  more memory' if hungrier else ''}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', nargs='+', default=DEFAULT_SIZES,
+                        help="event counts (312, 100k, 10M, ...) and/or 'deck' for the real-workbook deck charts")
+    parser.add_argument('--deck', action='store_true', help="also time the create_presentation charts")
+    parser.add_argument('--html-mode', default='shared', help="FigureExporter mode for the HTML export stage")
+    parser.add_argument('--ppi', type=int, default=200, help="pixels per inch of the rendered chart images")
+    parser.add_argument('--stream-above', type=parse_size, default=STREAM_ABOVE,
+                        help=f"stream sizes above this many events instead of loading them (default {STREAM_ABOVE:,})")
+    parser.add_argument('--workdir', help="where the synthetic exports are written (100M events needs ~5 GB)")
+    parser.add_argument('--json', help="results file (default benchmarks/results/pipeline-<commit>.json)")
+    parser.add_argument('--compare', metavar='OLD_JSON', help="report stages that regressed against an earlier run")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f"ratio counted as a regression (default {DEFAULT_THRESHOLD})")
+    parser.add_argument('--worker', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        with open(args.json, 'w') as f:
+            json.dump(run_target(args.worker, args), f)
+        return
+
+    targets = [str(parse_size(s)) if s != 'deck' else s for s in args.sizes]
+    if args.deck and 'deck' not in targets:
+        targets.append('deck')
+
+    commit, dirty = git_commit()
+    results = {
+        'benchmark': 'pipeline',
+        'commit': commit,
+        'dirty': dirty,
+        'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'options': {'html_mode': args.html_mode, 'ppi': args.ppi, 'stream_above': args.stream_above},
+        'runs': [],
+    }
+    for target in targets:
+        print(f"⏱️  Running {target}...", flush=True)
+        run = run_isolated(target, args)
+        results['runs'].append(run)
+        print_run(run)
+
+    path = args.json
+    if path is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        path = os.path.join(RESULTS_DIR, f"pipeline-{(commit or 'unknown')[:10]}{'-dirty' if dirty else ''}.json")
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"\n✅ Wrote {path}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(json.load(f), results, args.threshold)
+        print(f"\n{'⚠️ ' if regressions else '✅'} {regressions} regression(s) above {args.threshold:.2f}x")
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Benchmark: prs.save() after building the whole deck vs. streaming each slide into the zip
+Peak traced memory and wall time for image-heavy decks (one distinct PNG per slide)
+"""
+
+import argparse
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+from PIL import Image
+from pptx import Presentation
+from pptx.util import Inches
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pptx_stream import StreamingPresentationWriter
+
+
+def make_png(seed, width, height):
+    """Noise PNG (incompressible, so its size is close to a dense 300-dpi chart)"""
+    pixels = np.random.default_rng(seed).integers(0, 255, (height, width, 3), dtype=np.uint8)
+    buf = io.BytesIO()
+    Image.fromarray(pixels).save(buf, format='PNG')
+    return buf.getvalue()
+
+
+def add_slides(prs, n_slides, width, height):
+    for i in range(n_slides):
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(9), Inches(0.6)).text_frame.text = f"Slide {i + 1}"
+        slide.shapes.add_picture(io.BytesIO(make_png(i, width, height)), Inches(0.5), Inches(1.2), width=Inches(9))
+        slide.notes_slide.notes_text_frame.text = f"Talking points for slide {i + 1}"
+
+
+def run(mode, n_slides, width, height, path):
+    tracemalloc.start()
+    start = time.perf_counter()
+    prs = Presentation()
+    if mode == 'stream':
+        with StreamingPresentationWriter(prs, path):
+            add_slides(prs, n_slides, width, height)
+    else:
+        add_slides(prs, n_slides, width, height)
+        prs.save(path)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {'mode': mode, 'slides': n_slides, 'seconds': elapsed,
+            'peak_mb': peak / 1024 / 1024, 'file_mb': os.path.getsize(path) / 1024 / 1024}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--slides', type=int, nargs='+', default=[10, 50])
+    parser.add_argument('--width', type=int, default=1500, help="image width in pixels")
+    parser.add_argument('--height', type=int, default=1000, help="image height in pixels")
+    parser.add_argument('--json', help="write results to this file")
+    args = parser.parse_args()
+
+    print(f"{'slides':>7} {'mode':>7} {'peak (MB)':>10} {'time (s)':>9} {'file (MB)':>10}")
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for n_slides in args.slides:
+            for mode in ('save', 'stream'):
+                row = run(mode, n_slides, args.width, args.height, os.path.join(tmp, f"{mode}.pptx"))
+                results.append(row)
+                print(f"{row['slides']:>7} {row['mode']:>7} {row['peak_mb']:>10.1f} "
+                      f"{row['seconds']:>9.2f} {row['file_mb']:>10.1f}")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-sport boolean-mask loops vs. one grouped computation
+Capacity utilization per (University, Sport) at 10k / 1M / 10M events, 30 sports x 100 schools
+"""
+
+import argparse
+import json
+import time
+
+import numpy as np
+
+from synthetic_data import make_sports_frame
+
+GROUP_KEYS = ['University', 'Sport']
+
+
+def looped_utilization(sports_df, groups):
+    """The old pattern: filter the whole frame once per group, then reduce"""
+    result = {}
+    for school, sport in groups:
+        mask = (sports_df['University'] == school) & (sports_df['Sport'] == sport)
+        group_df = sports_df[mask]
+        if len(group_df) > 0:
+            result[(school, sport)] = group_df['Attendance'].mean() / group_df['Venue_Capacity'].iloc[0] * 100
+    return result
+
+
+def grouped_utilization(sports_df):
+    """The new pattern: one grouped pass for every group at once"""
+    grouped = sports_df.groupby(GROUP_KEYS, observed=True)
+    return grouped['Attendance'].mean() / grouped['Venue_Capacity'].first() * 100
+
+
+def run(n_events, n_sports, n_schools, max_loop_groups):
+    """Time both approaches at one size; the loop is sampled and extrapolated when there are many groups"""
+    sports_df = make_sports_frame(n_events, n_sports=n_sports, n_schools=n_schools)
+    groups = list(sports_df[GROUP_KEYS].drop_duplicates().itertuples(index=False, name=None))
+
+    start = time.perf_counter()
+    grouped = grouped_utilization(sports_df)
+    grouped_s = time.perf_counter() - start
+
+    sample = groups[:max_loop_groups]
+    start = time.perf_counter()
+    looped = looped_utilization(sports_df, sample)
+    sample_s = time.perf_counter() - start
+    looped_s = sample_s * len(groups) / max(len(sample), 1)
+
+    # Same answers on the sampled groups
+    for key, value in looped.items():
+        assert np.isclose(value, grouped.loc[key], rtol=1e-5), key
+
+    return {
+        'events': n_events,
+        'groups': len(groups),
+        'loop_groups_timed': len(sample),
+        'looped_s': looped_s,
+        'looped_extrapolated': len(sample) < len(groups),
+        'grouped_s': grouped_s,
+        'speedup': looped_s / grouped_s if grouped_s else float('inf'),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 1_000_000, 10_000_000])
+    parser.add_argument('--sports', type=int, default=30)
+    parser.add_argument('--schools', type=int, default=100)
+    parser.add_argument('--max-loop-groups', type=int, default=60,
+                        help="groups to time with the loop before extrapolating")
+    parser.add_argument('--json', help="write results to this file")
+    args = parser.parse_args()
+
+    print(f"{'events':>12} {'groups':>7} {'looped (s)':>12} {'grouped (s)':>12} {'speedup':>9}")
+    results = []
+    for n_events in args.sizes:
+        row = run(n_events, args.sports, args.schools, args.max_loop_groups)
+        results.append(row)
+        marker = '*' if row['looped_extrapolated'] else ' '
+        print(f"{row['events']:>12,} {row['groups']:>7,} {row['looped_s']:>11.3f}{marker} "
+              f"{row['grouped_s']:>12.4f} {row['speedup']:>8.0f}x")
+
+    print("\n* loop time extrapolated from the first --max-loop-groups groups")
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Startup budget check for the CLI entry points
+Times each command in a fresh interpreter (best of N) and lists what it imported (python -X importtime);
+exits nonzero when a command is over its budget or loads a library it should not need
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY = ('pandas', 'numpy', 'matplotlib', 'seaborn', 'plotly', 'pyarrow', 'scipy')
+
+# (command relative to the repo root, budget in ms, libraries it must not import, warm-up run first)
+# Budgets are ~2x the times measured on a 1-core sandbox; --scale adjusts them for slower machines
+CHECKS = [
+    ('create_powerpoint.py --no-images --output {tmp}/deck.pptx', 900, HEAVY, False),
+    ('create_presentation.py --help', 700, HEAVY, False),
+    # Slides assembled from the render cache: pyplot, seaborn and the data stay unloaded in the parent
+    ('create_presentation.py --output {tmp}/deck.pptx', 1500,
+     ('pandas', 'matplotlib.pyplot', 'seaborn', 'plotly', 'pyarrow'), True),
+    ('generate_visualizations.py --list', 500, ('pandas', 'numpy', 'matplotlib', 'seaborn', 'pyarrow'), False),
+    ('generate_visualizations.py challenge_gauge --html-mode shared --out {tmp}/viz', 800,
+     ('pandas', 'matplotlib', 'seaborn', 'pyarrow'), False),
+    ('revenue_simulation.py --help', 500, ('pandas', 'matplotlib', 'seaborn', 'plotly'), False),
+    ('plotly_static.py --help', 600, ('pandas', 'matplotlib', 'seaborn', 'plotly'), False),
+    ('render_pool.py --help', 400, HEAVY, False),
+    # The daemon client (render_daemon.py chart/deck/status) must stay standard-library only
+    ('render_daemon.py --help', 300, HEAVY, False),
+    ('analytics_api.py --help', 400, HEAVY, False),
+    ('batch_decks.py --help', 600, ('pandas', 'matplotlib', 'seaborn', 'plotly'), False),
+]
+
+# ============================================================================
+# MEASUREMENT
+# ============================================================================
+
+def _run(argv, env, importtime=False):
+    cmd = [sys.executable] + (['-X', 'importtime'] if importtime else []) + argv
+    start = time.perf_counter()
+    proc = subprocess.run(cmd, cwd=REPO_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    elapsed = (time.perf_counter() - start) * 1000
+    if proc.returncode != 0:
+        raise RuntimeError(f"{' '.join(argv)} exited {proc.returncode}: {proc.stderr.strip()[-500:]}")
+    return elapsed, proc.stderr
+
+
+def imported_modules(stderr):
+    """Module names from python -X importtime output"""
+    modules = set()
+    for line in stderr.splitlines():
+        if line.startswith('import time:') and line.count('|') == 2:
+            name = line.rsplit('|', 1)[1].strip()
+            if name != 'imported package':
+                modules.add(name)
+    return modules
+
+
+def loaded(modules, library):
+    return any(m == library or m.startswith(library + '.') for m in modules)
+
+
+def check(command, budget_ms, forbidden, warm, repeat, tmp):
+    argv = command.format(tmp=tmp).split()
+    env = dict(os.environ, MPLBACKEND='Agg')
+    if warm:
+        _run(argv, env)
+    best = min(_run(argv, env)[0] for _ in range(repeat))
+    modules = imported_modules(_run(argv, env, importtime=True)[1])
+    return {
+        'command': command,
+        'best_ms': best,
+        'budget_ms': budget_ms,
+        'forbidden_loaded': [lib for lib in forbidden if loaded(modules, lib)],
+        'modules': len(modules),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=3, help="timed runs per command (the best one counts)")
+    parser.add_argument('--scale', type=float, default=float(os.environ.get('KAGR_STARTUP_SCALE', 1)),
+                        help="multiply every budget (slow CI machines); env KAGR_STARTUP_SCALE")
+    parser.add_argument('--only', nargs='+', metavar='SCRIPT', help="check only commands starting with these")
+    parser.add_argument('--json', help="write the results to this file")
+    args = parser.parse_args()
+
+    checks = [c for c in CHECKS if not args.only or c[0].split()[0] in args.only]
+    results = []
+    failures = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        for command, budget_ms, forbidden, warm in checks:
+            row = check(command, budget_ms * args.scale, forbidden, warm, args.repeat, tmp)
+            over = row['best_ms'] > row['budget_ms']
+            failures += over or bool(row['forbidden_loaded'])
+            status = '❌' if over or row['forbidden_loaded'] else '✅'
+            extra = f"  loads {', '.join(row['forbidden_loaded'])}" if row['forbidden_loaded'] else ''
+            print(f"{status} {row['best_ms']:>6.0f} / {row['budget_ms']:>5.0f} ms  {command.format(tmp='<tmp>')}{extra}")
+            results.append(row)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+    print(f"\n{'❌' if failures else '✅'} {len(checks) - failures} of {len(checks)} entry points within budget")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+KAGR Case Competition - Synthetic Benchmark Data
+Generates event frames with the midwest_state_sports schema and survey frames with the Customer Experience Survey
+schema (both with the loader's compact dtypes) at any size
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data_loader import DAY_ORDER, START_TIME_ORDER, SURVEY_CATEGORICALS
+
+BASE_SPORTS = ['Football', "Men's Basketball", "Women's Basketball",
+               "Men's Baseball", "Women's Softball", "Women's Volleyball"]
+OPPONENT_TYPES = ['Conference', 'Non-Conference', 'Regional Team', 'Rival School']
+GAME_IMPORTANCE = ['Regular', 'Rivalry', 'Tournament']
+ACADEMIC_YEARS = ['2022-23', '2023-24', '2024-25']
+CAPACITIES = [1500, 3000, 5000, 12000, 40000]
+
+ATTENDED_QUESTION = SURVEY_CATEGORICALS[2]
+# In sheet order (the workbook's header really has a trailing space after 'Importance: Game Presentation')
+SCORE_QUESTIONS = [
+    'Overall Satisfaction with University Gameday Experience',
+    'Likelihood to Recommend University Sports to a Friend',
+    'Importance: Communication Regarding Event', 'Importance: Ticket-buying Experience',
+    'Satisfaction: Communication Regarding Event', 'Satisfaction: Ticket-buying Experience',
+    'Importance: Concessions', 'Importance: Merchandise', 'Importance: Stadium Entry',
+    'Importance: Game Presentation ',
+    'Satisfaction: Concessions', 'Satisfaction: Merchandise', 'Satisfaction: Stadium Entry',
+    'Satisfaction: Game Presentation',
+]
+COMPANIONS = ['Friends', 'Family', 'Work Colleagues']
+CUSTOMER_TYPES = ['Alumni', 'Fan', 'Student']
+
+
+def _sport_names(n_sports):
+    """The six real sports first, then numbered extras"""
+    return BASE_SPORTS[:n_sports] + [f"Sport {i:02d}" for i in range(len(BASE_SPORTS), n_sports)]
+
+
+def _categorical(rng, categories, n):
+    """Uniformly sampled categorical column built from codes (no string materialization)"""
+    codes = rng.integers(0, len(categories), n, dtype=np.int8 if len(categories) < 128 else np.int16)
+    return pd.Categorical.from_codes(codes, categories=categories)
+
+
+def _yes_no(rng, p_yes, n, answers=('N', 'Y')):
+    return pd.Categorical.from_codes((rng.random(n) < p_yes).astype(np.int8), categories=list(answers))
+
+
+def make_sports_frame(n_events, n_sports=6, n_schools=1, seed=0, first_event_id=0):
+    """
+    Synthetic event frame with the workbook columns plus engineered features
+    Event_ID is an integer to keep multi-million-row frames compact; first_event_id offsets it for chunked generation
+    """
+    rng = np.random.default_rng(seed)
+    sports = _sport_names(n_sports)
+    schools = [f"University {i:03d}" for i in range(n_schools)]
+
+    sport_codes = rng.integers(0, n_sports, n_events, dtype=np.int16)
+    school_codes = rng.integers(0, n_schools, n_events, dtype=np.int16)
+
+    # Per-sport venue size, price level and per-capita spend
+    capacity_by_sport = rng.choice(CAPACITIES, n_sports).astype(np.int32)
+    price_by_sport = rng.uniform(8, 60, n_sports).astype(np.float32)
+    spend_by_sport = rng.uniform(8, 30, n_sports).astype(np.float32)
+
+    capacity = capacity_by_sport[sport_codes]
+    attendance = (capacity * rng.beta(4, 2.5, n_events)).astype(np.int32)
+    price = price_by_sport[sport_codes] * rng.uniform(0.8, 1.25, n_events).astype(np.float32)
+
+    segment_share = rng.dirichlet([3, 2, 2.5, 1, 1.4], n_sports).astype(np.float32)
+    counts = (attendance[:, None] * segment_share[sport_codes]).astype(np.int32)
+
+    ticket = attendance * price * np.float32(0.95)
+    concession = attendance * spend_by_sport[sport_codes] * rng.uniform(0.7, 1.3, n_events).astype(np.float32)
+    parking = attendance * np.float32(4.5) * rng.uniform(0.6, 1.1, n_events).astype(np.float32)
+    merchandise = attendance * np.float32(2.1) * rng.uniform(0.5, 1.5, n_events).astype(np.float32)
+
+    df = pd.DataFrame({
+        'Event_ID': np.arange(first_event_id, first_event_id + n_events, dtype=np.int64),
+        'University': pd.Categorical.from_codes(school_codes, categories=schools),
+        'Sport': pd.Categorical.from_codes(sport_codes, categories=sports),
+        'Venue': pd.Categorical.from_codes(sport_codes, categories=[f"{s} Venue" for s in sports]),
+        'Day_of_Week': _categorical(rng, DAY_ORDER, n_events),
+        'Month': rng.integers(1, 13, n_events, dtype=np.int8),
+        'Academic_Year': _categorical(rng, ACADEMIC_YEARS, n_events),
+        'Opponent_Type': _categorical(rng, OPPONENT_TYPES, n_events),
+        'Game_Importance': _categorical(rng, GAME_IMPORTANCE, n_events),
+        'Start_Time': _categorical(rng, START_TIME_ORDER, n_events),
+        'Local_Events_Competing': rng.random(n_events) < 0.2,
+        'Attendance': attendance,
+        'Venue_Capacity': capacity,
+        'Students_Count': counts[:, 0],
+        'Alumni_Count': counts[:, 1],
+        'Local_Fans_Count': counts[:, 2],
+        'Corporate_Count': counts[:, 3],
+        'Families_Count': counts[:, 4],
+        'Avg_Ticket_Price': price,
+        'Premium_Seat_Price': price * np.float32(2.5),
+        'Student_Ticket_Price': price * np.float32(0.3),
+        'Ticket_Revenue': ticket.astype(np.float32),
+        'Concession_Revenue': concession.astype(np.float32),
+        'Parking_Revenue': parking.astype(np.float32),
+        'Merchandise_Revenue': merchandise.astype(np.float32),
+    })
+
+    df['Total_Revenue'] = (df['Ticket_Revenue'] + df['Concession_Revenue'] +
+                           df['Merchandise_Revenue'] + df['Parking_Revenue'])
+    df['Revenue_per_Attendee'] = (df['Total_Revenue'] / df['Attendance'].replace(0, np.nan)).astype(np.float32)
+    df['Venue_Utilization'] = (df['Attendance'] / df['Venue_Capacity'] * 100).astype(np.float32)
+    return df
+
+
+def make_survey_frame(n_respondents, seed=0):
+    """
+    Synthetic survey frame with the sheet's questions: Y/N interest and companion flags, a Yes/No attendance
+    question and 0-10 scores (the satisfaction ones left blank by ~15% of respondents, as in the real sheet)
+    """
+    rng = np.random.default_rng(seed)
+    interest = rng.uniform(0.3, 0.9, len(BASE_SPORTS))
+
+    columns = {
+        'Account ID': rng.uniform(10_000, 99_999, n_respondents).round(1),
+        'Date Completed': pd.Timestamp('2025-05-01') + pd.to_timedelta(rng.integers(0, 30, n_respondents), unit='D'),
+    }
+    for sport, p_yes in zip(BASE_SPORTS, interest):
+        columns[f"Sport Interest: {sport}"] = _yes_no(rng, p_yes, n_respondents)
+    columns[ATTENDED_QUESTION] = _yes_no(rng, 0.8, n_respondents, answers=('No', 'Yes'))
+    for question in SCORE_QUESTIONS:
+        scores = np.clip(rng.normal(7.8, 1.8, n_respondents), 0, 10).round().astype(np.float32)
+        if question.startswith('Satisfaction'):
+            scores[rng.random(n_respondents) < 0.15] = np.nan
+        columns[question] = scores
+    for companion, p_yes in zip(COMPANIONS, (0.35, 0.45, 0.1)):
+        columns[f"Attended with: {companion}"] = _yes_no(rng, p_yes, n_respondents)
+    columns['Gender'] = _categorical(rng, ['Female', 'Male'], n_respondents)
+    columns['Year Born'] = rng.integers(1950, 2007, n_respondents, dtype=np.int16)
+    columns['Customer Type'] = _categorical(rng, CUSTOMER_TYPES, n_respondents)
+    return pd.DataFrame(columns)
@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+"""
+KAGR Case Competition - Build Orchestrator
+Make-like DAG of workbook -> derived frames -> charts -> HTML -> decks; rebuilds only stale nodes, concurrently
+"""
+
+import argparse
+import contextlib
+import hashlib
+import io
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_OUT = os.path.join(REPO_DIR, 'build')
+STATE_FILE = '.build_state.json'
+
+# ============================================================================
+# NODE ACTIONS (module level so they can run in worker processes)
+# ============================================================================
+
+def warm_frames(file_path):
+    """Parse the workbook into the Parquet cache so every other process loads typed frames cheaply"""
+    from data_cache import read_sheets
+    read_sheets(file_path)
+    return []
+
+
+def build_viz(name, out_dir, html_mode):
+    """One plotly visualization from generate_visualizations.py"""
+    import generate_visualizations as gv
+    return list(gv.run_tasks([name], out_dir, html_mode).values())
+
+
+def render_presentation_chart(func_name, path):
+    """One matplotlib chart from create_presentation.py, through the render cache"""
+    import create_presentation as cp
+    from render_cache import RenderCache
+    from render_pool import render_charts
+
+    job = next(job for job in cp.chart_jobs() if job.name == func_name)
+    png, = render_charts([job], workers=1, cache=RenderCache())
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(png)
+    return [path]
+
+
+def build_case_deck(chart_paths, output_file):
+    """create_presentation.py deck assembled from the already rendered chart PNGs"""
+    import create_presentation as cp
+
+    builders = {func.__name__: func for func in cp.CHART_BUILDERS}
+    charts = {}
+    for name, path in chart_paths.items():
+        with open(path, 'rb') as f:
+            charts[builders[name]] = f.read()
+    cp.main(charts=charts, output_file=output_file)
+    return [output_file]
+
+
+def build_advanced_deck(out_dir, output_name):
+    """create_powerpoint.py is a top-level script; run it with the build directory as cwd"""
+    subprocess.run([sys.executable, os.path.join(REPO_DIR, 'create_powerpoint.py')],
+                   cwd=out_dir, check=True, stdout=subprocess.DEVNULL)
+    return [os.path.join(out_dir, output_name)]
+
+
+def _run_action(action):
+    """Worker entry point: returns (output paths, seconds); the scripts' own progress output is suppressed"""
+    from render_pool import _init_worker
+    _init_worker()
+    func, args = action
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        outputs = func(*args)
+    return outputs, time.perf_counter() - start
+
+
+# ============================================================================
+# GRAPH
+# ============================================================================
+
+class Node:
+    """
+    One artifact: its stamp hashes its own sources (files or builder functions), params and the stamps of its deps
+    action=None marks a logical node (e.g. the cube definition) that only contributes to downstream stamps
+    """
+
+    def __init__(self, name, deps=(), sources=(), action=None, params=None):
+        self.name = name
+        self.deps = tuple(deps)
+        self.sources = tuple(sources)
+        self.action = action
+        self.params = dict(params or {})
+
+
+def _file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _source_digest(source):
+    """Files hash by content; the workbook reuses the data cache's memoized hash; callables hash by source + style"""
+    from data_cache import workbook_hash
+    from render_cache import function_fingerprint, style_constants
+
+    if callable(source):
+        return hashlib.sha256(
+            (function_fingerprint(source) + repr(sorted(style_constants(source).items()))).encode()
+        ).hexdigest()
+    if source.endswith('.xlsx'):
+        return workbook_hash(source)
+    return _file_digest(source)
+
+
+def build_graph(out_dir=DEFAULT_OUT, html_mode='inline'):
+    """Every deliverable the repo produces, as a dependency graph"""
+    sys.path.insert(0, REPO_DIR)
+    import create_presentation as cp
+    import generate_visualizations as gv
+    from data_loader import DATA_FILE
+
+    def repo(*names):
+        return [os.path.join(REPO_DIR, name) for name in names]
+
+    nodes = [
+        Node('workbook', sources=[DATA_FILE]),
+        Node('frames', deps=['workbook'], sources=repo('data_cache.py', 'data_loader.py'),
+             action=(warm_frames, (DATA_FILE,))),
+        Node('cube', deps=['frames'], sources=repo('aggregate_cube.py')),
+        Node('survey', deps=['frames'], sources=repo('survey_engine.py')),
+    ]
+
+    # Each visualization depends on its own builder only, so editing one chart rebuilds one chart
+    viz_nodes = []
+    for task in gv.TASKS:
+        node = Node(f"viz:{task.name}", deps=list(task.inputs),
+                    sources=[task.builder] + repo('html_export.py'),
+                    action=(build_viz, (task.name, out_dir, html_mode)),
+                    params={'html_mode': html_mode})
+        viz_nodes.append(node.name)
+        nodes.append(node)
+
+    chart_paths = {}
+    for func in cp.CHART_BUILDERS:
+        path = os.path.join(out_dir, 'charts', f"{func.__name__}.png")
+        chart_paths[func.__name__] = path
+        nodes.append(Node(f"chart:{func.__name__}", deps=['cube', 'survey'],
+                          sources=[func] + repo('render_pool.py'),
+                          action=(render_presentation_chart, (func.__name__, path))))
+
+    # The slide-assembly code is what the deck node hashes; chart code lives in the chart nodes above
+    case_deck = os.path.join(out_dir, 'KAGR_Case_Competition_Presentation.pptx')
+    nodes.append(Node('deck:case_competition', deps=[f"chart:{name}" for name in chart_paths],
+                      sources=repo('create_presentation.py'),
+                      action=(build_case_deck, (chart_paths, case_deck))))
+    nodes.append(Node('deck:advanced_visualizations', deps=viz_nodes,
+                      sources=repo('create_powerpoint.py', 'plotly_static.py'),
+                      action=(build_advanced_deck, (out_dir, 'KAGR_Presentation_Advanced_Visualizations.pptx'))))
+    return {node.name: node for node in nodes}
+
+
+def topological_order(graph):
+    order, seen = [], set()
+
+    def visit(name):
+        if name in seen:
+            return
+        seen.add(name)
+        for dep in graph[name].deps:
+            visit(dep)
+        order.append(name)
+
+    for name in graph:
+        visit(name)
+    return order
+
+
+def required_nodes(graph, targets):
+    """Targets plus everything upstream of them"""
+    needed, stack = set(), list(targets)
+    while stack:
+        name = stack.pop()
+        if name not in needed:
+            needed.add(name)
+            stack.extend(graph[name].deps)
+    return needed
+
+
+def critical_path(graph, durations, names):
+    """Longest chain of dependent nodes by duration: the lower bound on a full build's wall time"""
+    best = {}
+    for name in topological_order(graph):
+        if name not in names:
+            continue
+        prev = max((best[dep] for dep in graph[name].deps if dep in best), default=(0.0, []),
+                   key=lambda item: item[0])
+        best[name] = (prev[0] + durations.get(name, 0.0), prev[1] + [name])
+    return max(best.values(), default=(0.0, []), key=lambda item: item[0])
+
+
+# ============================================================================
+# BUILDER
+# ============================================================================
+
+class Builder:
+    """Computes stamps, decides what is stale and runs stale actions across a process pool"""
+
+    def __init__(self, graph, out_dir=DEFAULT_OUT):
+        self.graph = graph
+        self.out_dir = out_dir
+        self.state_path = os.path.join(out_dir, STATE_FILE)
+        self.state = {}
+        if os.path.exists(self.state_path):
+            with open(self.state_path) as f:
+                self.state = json.load(f)
+        self._digests = {}
+        self.stamps = {}
+        for name in topological_order(graph):
+            self.stamps[name] = self._stamp(graph[name])
+
+    def _stamp(self, node):
+        digest = hashlib.sha256(node.name.encode())
+        for source in node.sources:
+            key = source if isinstance(source, str) else f"{source.__module__}.{source.__qualname__}"
+            if key not in self._digests:
+                self._digests[key] = _source_digest(source)
+            digest.update(self._digests[key].encode())
+        digest.update(json.dumps(node.params, sort_keys=True).encode())
+        for dep in node.deps:
+            digest.update(self.stamps[dep].encode())
+        return digest.hexdigest()
+
+    def is_stale(self, name):
+        """Stale when the stamp changed or a recorded output is missing or was modified"""
+        entry = self.state.get(name)
+        if entry is None or entry['stamp'] != self.stamps[name]:
+            return True
+        for path, digest in entry['outputs'].items():
+            if not os.path.exists(path) or _file_digest(path) != digest:
+                return True
+        return False
+
+    def _record(self, name, outputs, seconds):
+        self.state[name] = {
+            'stamp': self.stamps[name],
+            'outputs': {path: _file_digest(path) for path in outputs},
+            'seconds': seconds,
+        }
+
+    def _save_state(self):
+        os.makedirs(self.out_dir, exist_ok=True)
+        tmp_path = f"{self.state_path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(self.state, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.state_path)
+
+    def build(self, targets=None, jobs=None, dry_run=False):
+        """Run every stale node needed for `targets`; returns (rebuilt names, durations of this run)"""
+        names = required_nodes(self.graph, targets or list(self.graph))
+        order = [name for name in topological_order(self.graph) if name in names]
+
+        # A node is rebuilt when it is stale itself or anything upstream is rebuilt
+        to_build = set()
+        for name in order:
+            if self.is_stale(name) or any(dep in to_build for dep in self.graph[name].deps):
+                to_build.add(name)
+
+        if dry_run:
+            return [name for name in order if name in to_build], {}
+
+        os.makedirs(self.out_dir, exist_ok=True)
+        durations, done, running = {}, set(names - to_build), {}
+        remaining = [name for name in order if name in to_build]
+
+        with ProcessPoolExecutor(max_workers=jobs or os.cpu_count() or 1) as pool:
+            while remaining or running:
+                for name in [n for n in remaining if all(dep in done for dep in self.graph[n].deps)]:
+                    remaining.remove(name)
+                    node = self.graph[name]
+                    if node.action is None:
+                        self._record(name, [], 0.0)
+                        durations[name] = 0.0
+                        done.add(name)
+                        continue
+                    print(f"🔨 {name}")
+                    running[pool.submit(_run_action, node.action)] = name
+                if not running:
+                    continue
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    outputs, seconds = future.result()
+                    self._record(name, outputs, seconds)
+                    self._save_state()
+                    durations[name] = seconds
+                    done.add(name)
+                    print(f"✅ {name} ({seconds:.1f}s)")
+
+        self._save_state()
+        return [name for name in order if name in to_build], durations
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild the stale charts, HTML and decks")
+    parser.add_argument('targets', nargs='*', help="nodes to build (default: everything); see --list")
+    parser.add_argument('--out', default=DEFAULT_OUT, help="build directory")
+    parser.add_argument('--jobs', '-j', type=int, default=None, help="parallel processes (default: one per core)")
+    parser.add_argument('--html-mode', choices=['inline', 'shared', 'json'], default='inline')
+    parser.add_argument('--dry-run', '-n', action='store_true', help="show what would be rebuilt")
+    parser.add_argument('--list', action='store_true', help="list the nodes and their state")
+    args = parser.parse_args()
+
+    out_dir = os.path.abspath(args.out)
+    graph = build_graph(out_dir, args.html_mode)
+    unknown = [name for name in args.targets if name not in graph]
+    if unknown:
+        parser.error(f"Unknown node(s): {', '.join(unknown)}")
+
+    builder = Builder(graph, out_dir)
+    if args.list:
+        for name in topological_order(graph):
+            state = 'stale' if builder.is_stale(name) else 'fresh'
+            deps = ', '.join(graph[name].deps) or '-'
+            print(f"{name:<40} {state:<6} <- {deps}")
+        return
+
+    start = time.perf_counter()
+    rebuilt, durations = builder.build(args.targets, args.jobs, args.dry_run)
+    elapsed = time.perf_counter() - start
+
+    if args.dry_run:
+        print("\n".join(rebuilt) if rebuilt else "Nothing to do")
+        return
+
+    print(f"\n🏁 {len(rebuilt)} rebuilt, {len(required_nodes(graph, args.targets or list(graph))) - len(rebuilt)} "
+          f"up to date in {elapsed:.1f}s")
+
+    # Critical path over the last known duration of every node (i.e. the cost of a from-scratch build)
+    known = {name: entry.get('seconds', 0.0) for name, entry in builder.state.items()}
+    known.update(durations)
+    length, path = critical_path(graph, known, required_nodes(graph, args.targets or list(graph)))
+    print(f"⏱️  Critical path ({length:.1f}s): {' → '.join(path)}")
+
+
+if __name__ == "__main__":
+    main()
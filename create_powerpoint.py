@@ -3,19 +3,66 @@
 Create PowerPoint presentation with all 9 visualizations
 """
 
+import argparse
+import io
+import os
+
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN
 from pptx.dml.color import RGBColor
 
+from initiatives import BASE_REVENUE, INITIATIVES, SETTLEMENT_TARGET, projected_revenue, waterfall_steps
+from pptx_stream import StreamingPresentationWriter
+from render_pool import DEFAULT_PPI
+import tracing
+from tracing import span
+
+parser = argparse.ArgumentParser(description="Create the 11-slide advanced visualizations deck")
+parser.add_argument('--output', default="KAGR_Presentation_Advanced_Visualizations.pptx")
+parser.add_argument('--stream', action='store_true',
+                    help="write slides into the file as they are built (memory bounded by one slide)")
+parser.add_argument('--no-images', action='store_true',
+                    help="leave the 'open the HTML chart' placeholders instead of embedding static renders")
+parser.add_argument('--ppi', type=int, default=DEFAULT_PPI,
+                    help=f"pixels per inch of the embedded chart images (default: {DEFAULT_PPI}; env KAGR_SLIDE_PPI)")
+tracing.add_arguments(parser)
+args = parser.parse_args()
+trace_session = tracing.Session.from_args(args, 'create_powerpoint').start()
+
 print("=" * 80)
 print("📊 CREATING POWERPOINT PRESENTATION")
 print("=" * 80)
 
+# Headline numbers from the initiative table behind the revenue waterfall (viz 06), so the text matches the chart
+UPLIFT = dict(waterfall_steps())
+PROJECTED = projected_revenue()
+NEW_REVENUE = PROJECTED - BASE_REVENUE
+SURPLUS = NEW_REVENUE - SETTLEMENT_TARGET
+
 # Create presentation
 prs = Presentation()
 prs.slide_width = Inches(16)
 prs.slide_height = Inches(9)
+writer = StreamingPresentationWriter(prs, args.output) if args.stream else None
+
+# Static renders of the nine plotly figures, keyed by file stem (viz_01_challenge_gauge, ...): all up front, or
+# with --stream each one when its slide is built, so only that slide's image is ever held
+VIZ_BOX = (Inches(0.5), Inches(2), Inches(10), Inches(6))
+VIZ_WIDTH_IN = 10
+VIZ_IMAGES = {}
+VIZ_CACHE = None
+if not args.no_images and args.stream:
+    from render_cache import RenderCache
+    print("🎨 Rendering visualizations one slide at a time...")
+    VIZ_CACHE = RenderCache()
+elif not args.no_images:
+    from plotly_static import render_viz_images
+    print("🎨 Rendering visualizations...")
+    try:
+        VIZ_IMAGES = render_viz_images(width_in=VIZ_WIDTH_IN, ppi=args.ppi)
+    except RuntimeError as exc:
+        print(f"⚠️  {exc}; keeping the HTML chart placeholders")
 
 # Define colors
 BLUE = RGBColor(0, 81, 186)  # University Blue
@@ -52,8 +99,44 @@ def add_title_slide(prs, title, subtitle):
 
     return slide
 
+def slide_image(viz_file):
+    """PNG for a slide's chart (None: keep the placeholder), handed over so no image outlives its slide"""
+    global VIZ_CACHE
+    stem = os.path.splitext(os.path.basename(viz_file))[0]
+    if VIZ_CACHE is None:
+        return VIZ_IMAGES.pop(stem, None)
+    import generate_visualizations as gv
+    from plotly_static import render_viz_images
+
+    names = [task.name for task in gv.TASKS if task.output == stem]
+    try:
+        images = render_viz_images(names, width_in=VIZ_WIDTH_IN, ppi=args.ppi, cache=VIZ_CACHE)
+    except RuntimeError as exc:
+        print(f"⚠️  {exc}; keeping the HTML chart placeholders")
+        VIZ_CACHE = None
+        return None
+    return images.get(stem)
+
+def add_viz_placeholder(slide, viz_file):
+    """Placeholder pointing at the interactive HTML chart (when no static render is available)"""
+    viz_box = slide.shapes.add_shape(
+        1,  # Rectangle
+        *VIZ_BOX
+    )
+    viz_box.fill.solid()
+    viz_box.fill.fore_color.rgb = LIGHT_GRAY
+    viz_box.line.color.rgb = BLUE
+    viz_box.line.width = Pt(3)
+
+    text_frame = viz_box.text_frame
+    text_frame.text = f"📊 VISUALIZATION\n\nOpen: {viz_file}\n\n(Interactive HTML chart)\n\nScreenshot and paste here,\nor demo live during presentation"
+    for paragraph in text_frame.paragraphs:
+        paragraph.alignment = PP_ALIGN.CENTER
+        paragraph.font.size = Pt(18)
+        paragraph.font.color.rgb = DARK_GRAY
+
 def add_content_slide(prs, title, subtitle, viz_file, talking_points, key_numbers):
-    """Add content slide with visualization reference"""
+    """Add content slide with the visualization (or a placeholder for it)"""
     slide = prs.slides.add_slide(prs.slide_layouts[6])  # Blank layout
 
     # Header with title
@@ -72,22 +155,18 @@ def add_content_slide(prs, title, subtitle, viz_file, talking_points, key_number
         sub_frame.paragraphs[0].font.size = Pt(20)
         sub_frame.paragraphs[0].font.color.rgb = DARK_GRAY
 
-    # Visualization placeholder with instructions
-    viz_box = slide.shapes.add_shape(
-        1,  # Rectangle
-        Inches(0.5), Inches(2), Inches(10), Inches(6)
-    )
-    viz_box.fill.solid()
-    viz_box.fill.fore_color.rgb = LIGHT_GRAY
-    viz_box.line.color.rgb = BLUE
-    viz_box.line.width = Pt(3)
-
-    text_frame = viz_box.text_frame
-    text_frame.text = f"📊 VISUALIZATION\n\nOpen: {viz_file}\n\n(Interactive HTML chart)\n\nScreenshot and paste here,\nor demo live during presentation"
-    for paragraph in text_frame.paragraphs:
-        paragraph.alignment = PP_ALIGN.CENTER
-        paragraph.font.size = Pt(18)
-        paragraph.font.color.rgb = DARK_GRAY
+    # Static render of the chart, fitted and centered in the visualization area
+    png = slide_image(viz_file)
+    if png is not None:
+        left, top, width, height = VIZ_BOX
+        picture = slide.shapes.add_picture(io.BytesIO(png), left, top, width=width)
+        if picture.height > height:
+            picture.width = int(picture.width * height / picture.height)
+            picture.height = height
+        picture.left = left + (width - picture.width) // 2
+        picture.top = top + (height - picture.height) // 2
+    else:
+        add_viz_placeholder(slide, viz_file)
 
     # Key numbers box
     if key_numbers:
@@ -138,7 +217,7 @@ title_frame.paragraphs[0].font.size = Pt(44)
 title_frame.paragraphs[0].font.bold = True
 title_frame.paragraphs[0].font.color.rgb = BLUE
 
-content = """
+content = f"""
 ACT 1: THE PROBLEM
     • The Challenge: $20.5M NCAA Settlement
     • Current State: Where we are today
@@ -149,7 +228,7 @@ ACT 2: THE OPPORTUNITY
     • 7 Strategic Initiatives
 
 ACT 3: THE SOLUTION
-    • Revenue Roadmap: $94M → $120M
+    • Revenue Roadmap: ${BASE_REVENUE:.0f}M → ${PROJECTED:.0f}M
     • Implementation Timeline
     • Return on Investment
 
@@ -280,8 +359,8 @@ Together, they're diversified, achievable, and proven at peer institutions.""",
         "Short-term: $8.7M (3-6mo)",
         "Strategic: $7.5M (9mo)",
         "Long-term: $2.8M (12mo)",
-        "Total: $24.1M",
-        "Exceeds target by $3.6M"
+        f"Total: ${NEW_REVENUE:.1f}M",
+        f"Exceeds target by ${SURPLUS:.1f}M"
     ]
 )
 
@@ -292,21 +371,21 @@ print("[8/11] Creating Revenue Waterfall slide...")
 add_content_slide(
     prs,
     "Revenue Growth Roadmap",
-    "From $94M to $120M: The Path Forward",
+    f"From ${BASE_REVENUE:.0f}M to ${PROJECTED:.0f}M: The Path Forward",
     "docs/viz_06_revenue_waterfall.html",
-    """Here's our path from $94 million to $120 million—exceeding the $20.5M target by $4.6 million.
+    f"""Here's our path from ${BASE_REVENUE:.0f} million to ${PROJECTED:.0f} million—exceeding the ${SETTLEMENT_TARGET:.1f}M target by ${SURPLUS:.1f} million.
 
-Each step builds on the last. Dynamic pricing adds $4.2M with minimal investment. Women's basketball growth adds $4.0M. Corporate partnerships add $7.5M—our largest initiative.
+Each step builds on the last. Dynamic pricing adds ${UPLIFT['Dynamic Pricing']:.1f}M with minimal investment. Women's basketball growth adds ${UPLIFT["Women's BB Growth"]:.1f}M. Corporate partnerships add ${UPLIFT['Corporate Partnerships']:.1f}M—our largest initiative.
 
-Combined with premium seating, digital transformation, merchandise expansion, and alumni programs, we reach $119.5M in total revenue.
+Combined with premium seating, digital transformation, merchandise expansion, and alumni programs, we reach ${PROJECTED:.1f}M in total revenue.
 
-That's $25.1M in new revenue, 122% of our target. We're not just meeting the challenge—we're exceeding it.""",
+That's ${NEW_REVENUE:.1f}M in new revenue, {NEW_REVENUE / SETTLEMENT_TARGET:.0%} of our target. We're not just meeting the challenge—we're exceeding it.""",
     [
-        "Starting: $94.4M",
-        "Target: $114.9M",
-        "Projected: $119.5M",
-        "New Revenue: $25.1M",
-        "Exceeds by: $4.6M (22%)"
+        f"Starting: ${BASE_REVENUE:.1f}M",
+        f"Target: ${BASE_REVENUE + SETTLEMENT_TARGET:.1f}M",
+        f"Projected: ${PROJECTED:.1f}M",
+        f"New Revenue: ${NEW_REVENUE:.1f}M",
+        f"Exceeds by: ${SURPLUS:.1f}M ({SURPLUS / SETTLEMENT_TARGET:.0%})"
     ]
 )
 
@@ -375,22 +454,22 @@ add_content_slide(
     "Executive Summary",
     "The Complete Picture",
     "docs/viz_09_executive_summary.html",
-    """In summary:
+    f"""In summary:
 
-THE CHALLENGE: We face a $20.5M annual revenue gap from NCAA settlement obligations.
+THE CHALLENGE: We face a ${SETTLEMENT_TARGET:.1f}M annual revenue gap from NCAA settlement obligations.
 
-THE SOLUTION: 7 strategic initiatives spanning quick wins to long-term investments.
+THE SOLUTION: {len(INITIATIVES)} strategic initiatives spanning quick wins to long-term investments.
 
-THE NUMBERS: We project $25.1M in new revenue—exceeding our target by 22%. Average ROI is 723%. Timeline is 18 months. Risk is low at 3.2 out of 10.
+THE NUMBERS: We project ${NEW_REVENUE:.1f}M in new revenue—exceeding our target by {SURPLUS / SETTLEMENT_TARGET:.0%}. Average ROI is 723%. Timeline is 18 months. Risk is low at 3.2 out of 10.
 
 THE COMMITMENT: We maintain fan satisfaction above 4.0 throughout, enhance the gameday experience, and build sustainable competitive advantage.
 
 We're ready to execute. We have the data, the plan, and the team to make this happen.""",
     [
-        "Challenge: $20.5M",
-        "Projected: $25.1M",
-        "Exceeds by: 22%",
-        "Initiatives: 7",
+        f"Challenge: ${SETTLEMENT_TARGET:.1f}M",
+        f"Projected: ${NEW_REVENUE:.1f}M",
+        f"Exceeds by: {SURPLUS / SETTLEMENT_TARGET:.0%}",
+        f"Initiatives: {len(INITIATIVES)}",
         "ROI: 723% average",
         "Timeline: 18 months",
         "Risk: LOW (3.2/10)"
@@ -400,8 +479,14 @@ We're ready to execute. We have the data, the plan, and the team to make this ha
 # ============================================================================
 # Save presentation
 # ============================================================================
-output_file = "KAGR_Presentation_Advanced_Visualizations.pptx"
-prs.save(output_file)
+output_file = args.output
+with span('prs.save', 'pptx', slides=len(prs.slides), stream=args.stream) as s:
+    if writer is not None:
+        writer.close()
+    else:
+        prs.save(output_file)
+    s['bytes'] = os.path.getsize(output_file)
+trace_session.stop()
 
 print("\n" + "=" * 80)
 print(f"✅ POWERPOINT CREATED: {output_file}")
@@ -4,21 +4,29 @@ KAGR Case Competition - PowerPoint Presentation Generator
 Creates a comprehensive presentation based on the analysis and recommendations
 """
 
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from matplotlib.patches import Rectangle
-import seaborn as sns
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.dml.color import RGBColor
+import hashlib
 import io
-from PIL import Image
+import json
+import os
 import warnings
 warnings.filterwarnings('ignore')
 
+# matplotlib, numpy and the data modules are imported by the chart builders that need them, so assembling
+# the deck from cached renders never loads them
+from data_loader import DATA_FILE
+from initiatives import (BASE_REVENUE, INITIATIVES, SETTLEMENT_TARGET, projected_revenue, step_label,
+                         waterfall_steps, womens_bb_opportunity)
+from data_cache import workbook_hash
+from render_cache import RenderCache, _update_digest, function_fingerprint
+from render_pool import DEFAULT_PPI, ChartJob, figure_to_png, render_charts
+from pptx_stream import StreamingPresentationWriter
+import tracing
+from tracing import span
+
 # Professional Color Palette
 PRIMARY_BLUE = '#1f77b4'
 PRIMARY_GREEN = '#2ca02c'
@@ -31,18 +39,38 @@ GOOD = '#66BB6A'
 WARNING = '#FFA726'
 CRITICAL = '#E53935'
 
-# Configure matplotlib
-plt.rcParams['font.family'] = 'sans-serif'
-plt.rcParams['font.sans-serif'] = ['Arial', 'Helvetica', 'DejaVu Sans']
-sns.set_palette("husl")
-
-def create_chart_image(fig):
-    """Convert matplotlib figure to image for PowerPoint"""
-    buf = io.BytesIO()
-    fig.savefig(buf, format='png', dpi=300, bbox_inches='tight', facecolor='white')
-    buf.seek(0)
-    plt.close(fig)
-    return buf
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+OUTPUT_FILE = os.path.join(REPO_DIR, 'KAGR_Case_Competition_Presentation.pptx')
+
+# Chart style (upper-case constants, so the render cache keys on them)
+CHART_RCPARAMS = {'font.family': 'sans-serif', 'font.sans-serif': ['Arial', 'Helvetica', 'DejaVu Sans']}
+# seaborn's "husl" palette, spelled out so drawing the charts needs no seaborn import
+CHART_PALETTE = [
+    (0.9677975592919913, 0.44127456009157356, 0.5358103155058701),
+    (0.7350228985632719, 0.5952719904750953, 0.1944419133847522),
+    (0.3126890019504329, 0.6928754610296064, 0.1923704830330379),
+    (0.21044753832183283, 0.6773105080456748, 0.6433941168468681),
+    (0.23299120924703914, 0.639586552066035, 0.9260706093977744),
+    (0.9082572436765556, 0.40195790729656516, 0.9576909250290225),
+]
+
+def chart_pyplot():
+    """matplotlib.pyplot configured with the deck's chart style (imported on the first chart drawn)"""
+    import matplotlib.pyplot as plt
+    from cycler import cycler
+
+    plt.rcParams.update(CHART_RCPARAMS)
+    plt.rcParams['axes.prop_cycle'] = cycler(color=CHART_PALETTE)
+    return plt
+
+# Picture widths on a chart slide; charts are rendered for exactly these boxes
+CHART_WIDTH_FULL = Inches(9)
+CHART_WIDTH_WITH_BULLETS = Inches(5)
+
+def create_chart_image(fig, width=None, ppi=DEFAULT_PPI, quantize=False):
+    """Convert matplotlib figure to image for PowerPoint (width: slide box to size the pixels for)"""
+    width_in = width.inches if width is not None else None
+    return io.BytesIO(figure_to_png(fig, 300, width_in, ppi, quantize))
 
 def add_title_slide(prs):
     """Slide 1: Title Slide"""
@@ -132,14 +160,14 @@ def add_challenge_slide(prs):
 
 def create_revenue_composition_chart():
     """Create revenue composition donut chart"""
+    from data_loader import load_data, revenue_by_source
+
+    plt = chart_pyplot()
     fig, ax = plt.subplots(figsize=(10, 8))
 
-    revenue_sources = {
-        'Ticket Sales': 39.83,
-        'Concessions': 28.73,
-        'Parking': 14.00,
-        'Merchandise': 11.80
-    }
+    sports_df, _ = load_data()
+    revenue_sources = {source: value / 1e6
+                       for source, value in revenue_by_source(sports_df).items()}
 
     colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#FFA07A']
     total = sum(revenue_sources.values())
@@ -172,11 +200,22 @@ def create_revenue_composition_chart():
 
 def create_womens_basketball_opportunity_chart():
     """Create the key Women's Basketball opportunity chart"""
+    import numpy as np
+    from aggregate_cube import load_cube
+    from survey_engine import load_survey_engine
+
+    plt = chart_pyplot()
     fig, ax1 = plt.subplots(figsize=(12, 8))
 
     sports = ['Football', "Men's BB", "Women's BB", 'Baseball', 'Softball', 'Volleyball']
-    interest_scores = [95, 88, 85, 65, 58, 52]
-    capacity_util = [86.7, 84.2, 43.5, 58.9, 61.8, 61.6]
+    sport_names = ['Football', "Men's Basketball", "Women's Basketball",
+                   "Men's Baseball", "Women's Softball", "Women's Volleyball"]
+    # % of survey respondents interested in each sport
+    interest_by_sport = load_survey_engine().interest_by_sport()
+    interest_scores = [round(float(interest_by_sport.get(name, 0))) for name in sport_names]
+
+    util_by_sport = load_cube().slice('Sport', 'Venue_Utilization')
+    capacity_util = [round(float(util_by_sport.get(name, 0)), 1) for name in sport_names]
 
     x = np.arange(len(sports))
     width = 0.35
@@ -199,22 +238,24 @@ def create_womens_basketball_opportunity_chart():
     bars2[2].set_linewidth(4)
 
     # Add annotation
-    ax1.annotate('MAJOR OPPORTUNITY!\nHigh Interest (85)\nLow Attendance (43.5%)',
-                 xy=(2, 85), xytext=(4.2, 90),
+    ax1.annotate(f'MAJOR OPPORTUNITY!\nHigh Interest ({interest_scores[2]})\nLow Attendance ({capacity_util[2]}%)',
+                 xy=(2, interest_scores[2]), xytext=(4.2, 90),
                  arrowprops=dict(arrowstyle='->', color='red', lw=3),
                  fontsize=14, color='red', weight='bold',
                  bbox=dict(boxstyle='round,pad=1', facecolor='yellow',
                           edgecolor='red', linewidth=3))
 
     ax1.set_xlabel('Sport', fontsize=14, weight='bold')
-    ax1.set_ylabel('Fan Interest Score (0-100)', fontsize=13, weight='bold', color='#1f77b4')
+    ax1.set_ylabel('Fan Interest (% of survey respondents)', fontsize=13, weight='bold', color='#1f77b4')
+    ax1.set_ylim(0, 100)
+    ax2.set_ylim(0, 100)
     ax2.set_ylabel('Capacity Utilization %', fontsize=13, weight='bold', color='#2ca02c')
     ax1.set_title("Women's Basketball: High Interest, Low Attendance", fontsize=18, weight='bold', pad=20)
     ax1.set_xticks(x)
     ax1.set_xticklabels(sports, fontsize=11)
 
     ax1.legend(loc='upper left', fontsize=11)
-    ax2.legend(loc='upper right', fontsize=11)
+    ax2.legend(loc='upper center', fontsize=11)
     ax1.grid(axis='y', alpha=0.3, linestyle='--')
     ax1.set_axisbelow(True)
 
@@ -223,6 +264,9 @@ def create_womens_basketball_opportunity_chart():
 
 def create_corporate_benchmark_chart():
     """Create corporate partnership benchmark comparison"""
+    import numpy as np
+
+    plt = chart_pyplot()
     fig, ax = plt.subplots(figsize=(12, 8))
 
     schools = ['Wisconsin', 'Penn State', 'Michigan', 'Ohio State', 'UT Austin', 'Midwest State']
@@ -268,20 +312,20 @@ def create_corporate_benchmark_chart():
 
 def create_revenue_waterfall_chart():
     """Create revenue growth waterfall chart"""
+    plt = chart_pyplot()
     fig, ax = plt.subplots(figsize=(16, 9))
 
-    initiatives = ['Current\nRevenue', 'Dynamic\nPricing', 'Women BB\nGrowth',
-                   'Corporate\nPartnerships', 'Merchandise', 'Digital\nPlatform',
-                   'Premium\nSeating', 'Off-Peak', 'Projected\nRevenue']
+    steps = waterfall_steps()
+    initiatives = (['Current\nRevenue'] + [step_label(name) for name, _ in steps] + ['Projected\nRevenue'])
 
-    values = [94.36, 3.8, 4.4, 7.5, 1.9, 2.8, 2.8, 0.9, 0]
+    values = [BASE_REVENUE] + [uplift for _, uplift in steps] + [0]
 
-    cumulative = [94.36]
+    cumulative = [BASE_REVENUE]
     for i in range(1, len(values)-1):
         cumulative.append(cumulative[-1] + values[i])
     cumulative.append(cumulative[-1])
 
-    colors = ['#1f77b4'] + ['#2ca02c'] * 7 + ['#ff7f0e']
+    colors = ['#1f77b4'] + ['#2ca02c'] * len(steps) + ['#ff7f0e']
 
     for i, (init, val, cum) in enumerate(zip(initiatives, values, cumulative)):
         if i == 0 or i == len(initiatives) - 1:
@@ -303,11 +347,13 @@ def create_revenue_waterfall_chart():
     ax.set_xticks(range(len(initiatives)))
     ax.set_xticklabels(initiatives, fontsize=11, weight='bold')
     ax.set_ylabel('Revenue (Millions $)', fontsize=14, weight='bold')
-    ax.set_title('Revenue Growth Roadmap: $94.4M → $118.5M (+$24.1M, 24% above target)',
+    new_revenue = cumulative[-1] - BASE_REVENUE
+    ax.set_title(f'Revenue Growth Roadmap: ${BASE_REVENUE:.1f}M → ${cumulative[-1]:.1f}M '
+                 f'(+${new_revenue:.1f}M, {new_revenue / SETTLEMENT_TARGET - 1:.0%} above target)',
                  fontsize=16, weight='bold', pad=20)
 
     # Target line
-    target = 94.36 + 20.5
+    target = BASE_REVENUE + SETTLEMENT_TARGET
     ax.axhline(target, color='#d62728', linestyle='--', linewidth=2.5,
                label=f'NCAA Settlement Target: ${target:.1f}M', alpha=0.7)
 
@@ -319,8 +365,88 @@ def create_revenue_waterfall_chart():
     plt.tight_layout()
     return fig
 
-def add_slide_with_chart(prs, title_text, chart_func, bullet_points=None):
-    """Add a slide with a chart and optional bullet points"""
+# Independent figures, rendered up front across a process pool
+CHART_BUILDERS = [
+    create_revenue_composition_chart,
+    create_womens_basketball_opportunity_chart,
+    create_corporate_benchmark_chart,
+    create_revenue_waterfall_chart,
+]
+
+# Where each chart lands in main(): the slides with bullet points show it in the narrower right-hand box
+CHART_PLACEMENT = {
+    create_revenue_composition_chart: CHART_WIDTH_FULL,
+    create_womens_basketball_opportunity_chart: CHART_WIDTH_WITH_BULLETS,
+    create_corporate_benchmark_chart: CHART_WIDTH_WITH_BULLETS,
+    create_revenue_waterfall_chart: CHART_WIDTH_FULL,
+}
+
+def chart_jobs(dpi=300, ppi=DEFAULT_PPI, quantize=False):
+    """
+    One job per builder, sized for its slide box; the builders load the workbook themselves,
+    so its hash is the data input. ppi=None falls back to a fixed dpi regardless of placement.
+    """
+    inputs = (workbook_hash(DATA_FILE),)
+    return [ChartJob(func.__name__, func, dpi=dpi, inputs=inputs,
+                     width_in=CHART_PLACEMENT[func].inches if ppi else None, ppi=ppi, quantize=quantize)
+            for func in CHART_BUILDERS]
+
+def render_chart_images(workers=None, use_cache=True, ppi=DEFAULT_PPI, quantize=False):
+    """Render every chart in CHART_BUILDERS in parallel, keyed by builder; unchanged charts come from the render cache"""
+    cache = RenderCache() if use_cache else None
+    images = render_charts(chart_jobs(ppi=ppi, quantize=quantize), workers, cache)
+    if cache is not None:
+        print(f"  Render cache: {cache.hits} reused, {cache.misses} rendered")
+    return dict(zip(CHART_BUILDERS, images))
+
+class LazyChartImages:
+    """
+    Chart PNGs keyed by builder, each rendered in this process when its slide asks for it (pop)
+    Used when streaming, so only the slide being built holds a chart image instead of every chart up front
+    """
+
+    def __init__(self, jobs, cache=None):
+        self._jobs = dict(zip(CHART_BUILDERS, jobs))
+        self.cache = cache
+
+    def pop(self, func):
+        png, = render_charts([self._jobs.pop(func)], workers=1, cache=self.cache)
+        return png
+
+def _womens_bb_bullet_text():
+    """Slide 4 bullets from the survey interest and cube utilization the chart beside them plots"""
+    from aggregate_cube import load_cube
+    from survey_engine import load_survey_engine
+
+    wbb = womens_bb_opportunity(load_cube(), load_survey_engine())
+    if round(wbb['capacity']) == round(wbb['mens_capacity']):
+        arena = f"Same {wbb['capacity']:,.0f}-seat arena as Men's"
+    else:
+        arena = f"{wbb['capacity']:,.0f}-seat arena (Men's: {wbb['mens_capacity']:,.0f})"
+    return [
+        f"Survey interest: {wbb['interest']:.0f}% of fans (vs. Men's {wbb['mens_interest']:.0f}%)",
+        f"Only {wbb['utilization']:.1f}% capacity utilization (vs. Men's {wbb['mens_utilization']:.1f}%)",
+        arena,
+        f"Gap = {wbb['empty_seats']:,.0f} empty seats/game",
+        f"Opportunity: ${wbb['added_revenue'] / 1e6:.1f}M annually at {wbb['target']}% capacity",
+    ]
+
+def womens_bb_bullets(cache=None):
+    """Slide 4 bullets, kept in the render cache under the workbook hash so a cached build never loads the data"""
+    digest = hashlib.sha256()
+    _update_digest(digest, ('womens_bb_bullets', workbook_hash(DATA_FILE)))
+    _update_digest(digest, function_fingerprint(_womens_bb_bullet_text))
+    key = digest.hexdigest()
+    data = cache.get(key) if cache is not None else None
+    if data is not None:
+        return json.loads(data)
+    bullets = _womens_bb_bullet_text()
+    if cache is not None:
+        cache.put(key, json.dumps(bullets).encode())
+    return bullets
+
+def add_slide_with_chart(prs, title_text, chart_func, bullet_points=None, image=None):
+    """Add a slide with a chart and optional bullet points (image: pre-rendered PNG bytes)"""
     slide = prs.slides.add_slide(prs.slide_layouts[6])  # Blank layout
 
     # Add title
@@ -333,12 +459,15 @@ def add_slide_with_chart(prs, title_text, chart_func, bullet_points=None):
     title_para.font.color.rgb = RGBColor(0, 51, 102)
 
     # Create and add chart
-    fig = chart_func()
-    img_stream = create_chart_image(fig)
+    if image is not None:
+        img_stream = io.BytesIO(image)
+    else:
+        img_stream = create_chart_image(chart_func(),
+                                        CHART_WIDTH_WITH_BULLETS if bullet_points else CHART_WIDTH_FULL)
 
     if bullet_points:
         # Add chart on the right
-        slide.shapes.add_picture(img_stream, Inches(4.5), Inches(1.2), width=Inches(5))
+        slide.shapes.add_picture(img_stream, Inches(4.5), Inches(1.2), width=CHART_WIDTH_WITH_BULLETS)
 
         # Add bullet points on the left
         text_box = slide.shapes.add_textbox(Inches(0.5), Inches(1.2), Inches(3.5), Inches(5))
@@ -355,7 +484,7 @@ def add_slide_with_chart(prs, title_text, chart_func, bullet_points=None):
             p.space_after = Pt(8)
     else:
         # Add chart centered and larger
-        slide.shapes.add_picture(img_stream, Inches(0.5), Inches(1.2), width=Inches(9))
+        slide.shapes.add_picture(img_stream, Inches(0.5), Inches(1.2), width=CHART_WIDTH_FULL)
 
 def add_initiatives_summary_slide(prs):
     """Slide: Full Initiative Portfolio"""
@@ -500,10 +629,12 @@ def add_conclusion_slide(prs):
     p.font.bold = True
     p.font.color.rgb = RGBColor(0, 51, 102)
 
+    # Same initiative table as the revenue waterfall chart and its title
+    new_revenue = projected_revenue() - BASE_REVENUE
     summary_items = [
-        "Challenge: Generate $20.5M to offset House settlement",
-        "Solution: 7 data-driven initiatives",
-        "Result: $24.1M net revenue (24% above target)",
+        f"Challenge: Generate ${SETTLEMENT_TARGET:.1f}M to offset House settlement",
+        f"Solution: {len(INITIATIVES)} data-driven initiatives",
+        f"Result: ${new_revenue:.1f}M net revenue ({new_revenue / SETTLEMENT_TARGET - 1:.0%} above target)",
         "Timeline: 12-18 months to full implementation"
     ]
 
@@ -535,14 +666,28 @@ def add_conclusion_slide(prs):
         p.font.size = Pt(16)
         p.space_after = Pt(10)
 
-def main():
-    """Main function to create the presentation"""
+def main(workers=None, use_cache=True, output_file=OUTPUT_FILE, charts=None, stream=False,
+         ppi=DEFAULT_PPI, quantize=False):
+    """
+    Main function to create the presentation (charts: pre-rendered PNG bytes keyed by builder)
+    stream=True writes each slide into the file as soon as it is finished instead of at prs.save, and renders
+    each chart only when its slide is built (in this process; `workers` applies to the up-front render)
+    ppi sets the chart resolution per inch of slide space (None: fixed 300 dpi); quantize stores palette PNGs
+    """
     print("Creating PowerPoint presentation...")
 
+    if charts is None and stream:
+        print("Rendering charts one slide at a time...")
+        charts = LazyChartImages(chart_jobs(ppi=ppi, quantize=quantize), RenderCache() if use_cache else None)
+    elif charts is None:
+        print("Rendering charts...")
+        charts = render_chart_images(workers, use_cache, ppi, quantize)
+
     # Create presentation object
     prs = Presentation()
     prs.slide_width = Inches(10)
     prs.slide_height = Inches(7.5)
+    writer = StreamingPresentationWriter(prs, output_file) if stream else None
 
     # Add slides
     print("Adding Slide 1: Title Slide")
@@ -553,19 +698,14 @@ def main():
 
     print("Adding Slide 3: Revenue Composition")
     add_slide_with_chart(prs, "Current State: Revenue Composition",
-                         create_revenue_composition_chart)
+                         create_revenue_composition_chart,
+                         image=charts.pop(create_revenue_composition_chart))
 
     print("Adding Slide 4: Women's Basketball Opportunity")
-    womens_bb_bullets = [
-        "Survey shows 85 interest score (vs. Men's 88)",
-        "Only 43.5% capacity utilization",
-        "Same 12,000-seat arena as Men's",
-        "Gap = 3,988 empty seats/game",
-        "Opportunity: $4.4M annually"
-    ]
     add_slide_with_chart(prs, "Critical Finding #1: Women's Basketball",
                          create_womens_basketball_opportunity_chart,
-                         womens_bb_bullets)
+                         womens_bb_bullets(RenderCache() if use_cache else None),
+                         image=charts.pop(create_womens_basketball_opportunity_chart))
 
     print("Adding Slide 5: Corporate Partnership Gap")
     corporate_bullets = [
@@ -577,11 +717,13 @@ def main():
     ]
     add_slide_with_chart(prs, "Critical Finding #2: Corporate Partnership Gap",
                          create_corporate_benchmark_chart,
-                         corporate_bullets)
+                         corporate_bullets,
+                         image=charts.pop(create_corporate_benchmark_chart))
 
     print("Adding Slide 6: Revenue Waterfall")
     add_slide_with_chart(prs, "Full Initiative Portfolio",
-                         create_revenue_waterfall_chart)
+                         create_revenue_waterfall_chart,
+                         image=charts.pop(create_revenue_waterfall_chart))
 
     print("Adding Slide 7: Initiatives Summary Table")
     add_initiatives_summary_slide(prs)
@@ -593,10 +735,33 @@ def main():
     add_conclusion_slide(prs)
 
     # Save presentation
-    output_file = '/home/user/koding-kagr-case-competition/KAGR_Case_Competition_Presentation.pptx'
-    prs.save(output_file)
+    with span('prs.save', 'pptx', slides=len(prs.slides), stream=stream) as s:
+        if writer is not None:
+            writer.close()
+        else:
+            prs.save(output_file)
+        s['bytes'] = os.path.getsize(output_file)
+    if isinstance(charts, LazyChartImages) and charts.cache is not None:
+        print(f"  Render cache: {charts.cache.hits} reused, {charts.cache.misses} rendered")
     print(f"\n✅ Presentation saved successfully to: {output_file}")
     print(f"   Total slides: {len(prs.slides)}")
 
 if __name__ == "__main__":
-    main()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build the KAGR case competition deck")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="chart rendering processes (default: one per core)")
+    parser.add_argument('--no-cache', action='store_true', help="re-render every chart")
+    parser.add_argument('--output', default=OUTPUT_FILE, help="where to save the deck")
+    parser.add_argument('--stream', action='store_true',
+                        help="write slides into the file as they are built (memory bounded by one slide)")
+    parser.add_argument('--ppi', type=int, default=DEFAULT_PPI,
+                        help=f"chart pixels per inch of slide space (default: {DEFAULT_PPI}; 0 = fixed 300 dpi)")
+    parser.add_argument('--quantize', action='store_true',
+                        help="store charts as optimized 256-color PNGs (about 3x smaller)")
+    tracing.add_arguments(parser)
+    args = parser.parse_args()
+    with tracing.Session.from_args(args, 'create_presentation'):
+        main(args.workers, use_cache=not args.no_cache, output_file=args.output, stream=args.stream,
+             ppi=args.ppi or None, quantize=args.quantize)
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Columnar on-disk cache for the KAGR competition workbook
+Parses each Excel sheet once and serves later loads from Parquet files keyed on the workbook's content hash
+"""
+
+import hashlib
+import importlib.util
+import json
+import os
+import shutil
+
+# Cache location (override with KAGR_CACHE_DIR)
+CACHE_DIR = os.environ.get(
+    'KAGR_CACHE_DIR',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'workbooks')
+)
+
+# Parquet when pyarrow is available, pickle otherwise (found, not imported: hashing needs neither it nor pandas)
+CACHE_FORMAT = 'parquet' if importlib.util.find_spec('pyarrow') is not None else 'pickle'
+
+HASH_BLOCK_SIZE = 1 << 20
+STAT_INDEX_FILE = 'stat_index.json'
+MANIFEST_FILE = 'manifest.json'
+
+# ============================================================================
+# CONTENT HASHING
+# ============================================================================
+
+def _load_stat_index():
+    """Read the path -> (size, mtime, hash) index used to skip re-hashing"""
+    index_path = os.path.join(CACHE_DIR, STAT_INDEX_FILE)
+    try:
+        with open(index_path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_stat_index(index):
+    """Atomically write the stat index"""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    index_path = os.path.join(CACHE_DIR, STAT_INDEX_FILE)
+    tmp_path = index_path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(index, f, indent=2)
+    os.replace(tmp_path, index_path)
+
+
+def workbook_hash(file_path):
+    """
+    SHA-256 of the workbook bytes
+    Re-hashing is skipped while the file's size and mtime are unchanged
+    """
+    file_path = os.path.abspath(file_path)
+    stat = os.stat(file_path)
+    index = _load_stat_index()
+
+    entry = index.get(file_path)
+    if entry and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+        return entry['sha256']
+
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b''):
+            digest.update(block)
+    sha256 = digest.hexdigest()
+
+    index[file_path] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': sha256}
+    _save_stat_index(index)
+    return sha256
+
+
+# ============================================================================
+# SHEET CONVERSION
+# ============================================================================
+
+def _sheet_filename(sheet_name):
+    """Filesystem-safe file name for a sheet"""
+    slug = ''.join(c if c.isalnum() else '_' for c in sheet_name).strip('_').lower()
+    return f"{slug}.{CACHE_FORMAT}"
+
+
+def _make_columnar(df):
+    """
+    Make object columns representable in a columnar file
+    Mixed numeric/blank columns (e.g. ' ' in the survey's 0-10 scores) become numeric with NaN,
+    any other mixed-type column is stored as text
+    """
+    import pandas as pd
+
+    df = df.copy()
+    for col in df.columns:
+        if df[col].dtype != object:
+            continue
+        types = df[col].dropna().map(type).unique()
+        if len(types) <= 1:
+            continue
+        numeric = pd.to_numeric(df[col], errors='coerce')
+        non_numeric = df[col][numeric.isna() & df[col].notna()]
+        if non_numeric.astype(str).str.strip().eq('').all():
+            df[col] = numeric
+        else:
+            df[col] = df[col].astype(str)
+    return df
+
+
+def _write_frame(df, path):
+    """Write one sheet to the cache"""
+    tmp_path = path + '.tmp'
+    if CACHE_FORMAT == 'parquet':
+        df.to_parquet(tmp_path, index=False)
+    else:
+        df.to_pickle(tmp_path)
+    os.replace(tmp_path, path)
+
+
+def _read_frame(path):
+    """Read one sheet from the cache"""
+    import pandas as pd
+
+    if CACHE_FORMAT == 'parquet':
+        return pd.read_parquet(path)
+    return pd.read_pickle(path)
+
+
+def _prune_stale_entries(file_path, keep_hash):
+    """Remove cache entries built from older versions of the same workbook"""
+    if not os.path.isdir(CACHE_DIR):
+        return
+    for name in os.listdir(CACHE_DIR):
+        entry_dir = os.path.join(CACHE_DIR, name)
+        if name == keep_hash or not os.path.isdir(entry_dir):
+            continue
+        try:
+            with open(os.path.join(entry_dir, MANIFEST_FILE)) as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            continue
+        if manifest.get('source') == file_path:
+            shutil.rmtree(entry_dir, ignore_errors=True)
+
+
+def _build_entry(file_path, sha256):
+    """Parse every sheet of the workbook once and write the columnar cache entry"""
+    entry_dir = os.path.join(CACHE_DIR, sha256)
+    os.makedirs(entry_dir, exist_ok=True)
+
+    import pandas as pd
+
+    sheets = pd.read_excel(file_path, sheet_name=None)
+    files = {}
+    for sheet_name, df in sheets.items():
+        filename = _sheet_filename(sheet_name)
+        _write_frame(_make_columnar(df), os.path.join(entry_dir, filename))
+        files[sheet_name] = filename
+
+    manifest = {'source': file_path, 'sha256': sha256, 'format': CACHE_FORMAT, 'sheets': files}
+    with open(os.path.join(entry_dir, MANIFEST_FILE), 'w') as f:
+        json.dump(manifest, f, indent=2)
+
+    _prune_stale_entries(file_path, sha256)
+    return manifest
+
+
+def _get_manifest(file_path):
+    """Return the manifest for the workbook's current content, building it on a miss"""
+    file_path = os.path.abspath(file_path)
+    sha256 = workbook_hash(file_path)
+    manifest_path = os.path.join(CACHE_DIR, sha256, MANIFEST_FILE)
+    try:
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        if manifest.get('format') == CACHE_FORMAT:
+            return manifest
+    except (OSError, ValueError):
+        pass
+    return _build_entry(file_path, sha256)
+
+
+# ============================================================================
+# PUBLIC API
+# ============================================================================
+
+def read_sheets(file_path, sheet_names=None):
+    """
+    Load sheets from the workbook via the columnar cache
+    Returns a dict of sheet name -> DataFrame (all sheets when sheet_names is None)
+    """
+    manifest = _get_manifest(file_path)
+    entry_dir = os.path.join(CACHE_DIR, manifest['sha256'])
+
+    if sheet_names is None:
+        sheet_names = list(manifest['sheets'])
+
+    frames = {}
+    for sheet_name in sheet_names:
+        if sheet_name not in manifest['sheets']:
+            raise ValueError(f"Worksheet named '{sheet_name}' not found in {file_path}")
+        frames[sheet_name] = _read_frame(os.path.join(entry_dir, manifest['sheets'][sheet_name]))
+    return frames
+
+
+def read_sheet(file_path, sheet_name):
+    """Load a single sheet from the workbook via the columnar cache"""
+    return read_sheets(file_path, [sheet_name])[sheet_name]
+
+
+def clear_cache():
+    """Delete every cached workbook entry"""
+    shutil.rmtree(CACHE_DIR, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    workbook = sys.argv[1] if len(sys.argv) > 1 else "data/2025 KODING with KAGR Case Competition_Dataset.xlsx"
+
+    start = time.perf_counter()
+    frames = read_sheets(workbook)
+    elapsed = time.perf_counter() - start
+
+    print(f"📂 {workbook}")
+    print(f"   sha256: {workbook_hash(workbook)}")
+    for name, df in frames.items():
+        print(f"   {name}: {df.shape[0]} rows x {df.shape[1]} cols")
+    print(f"✅ Loaded in {elapsed * 1000:.1f} ms ({CACHE_FORMAT} cache at {CACHE_DIR})")
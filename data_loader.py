@@ -0,0 +1,203 @@
+"""
+KAGR Case Competition - Shared Data Loader
+Single typed entry point for the sports event and customer survey frames used by every script
+"""
+
+import functools
+import os
+from datetime import datetime
+
+# numpy/pandas are imported inside the functions below so that entry points needing only DATA_FILE or the
+# schema constants start without them
+from data_cache import read_sheets
+from tracing import span
+
+DATA_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data',
+                         '2025 KODING with KAGR Case Competition_Dataset.xlsx')
+
+SPORTS_SHEET = 'midwest_state_sports'
+SURVEY_SHEET = 'Customer Experience Survey'
+
+# ============================================================================
+# SCHEMA: compact dtypes for the event sheet
+# ============================================================================
+
+DAY_ORDER = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+START_TIME_ORDER = ['Morning', 'Afternoon', 'Evening', 'Night']
+
+SPORTS_CATEGORICALS = ['Sport', 'Venue', 'Day_of_Week', 'Opponent_Type',
+                       'Game_Importance', 'Start_Time']
+ORDERED_CATEGORIES = {
+    'Day_of_Week': DAY_ORDER,
+    'Start_Time': START_TIME_ORDER,
+}
+
+COUNT_COLUMNS = ['Attendance', 'Venue_Capacity', 'Students_Count', 'Alumni_Count',
+                 'Local_Fans_Count', 'Corporate_Count', 'Families_Count']
+
+PRICE_COLUMNS = ['Avg_Ticket_Price', 'Premium_Seat_Price', 'Student_Ticket_Price']
+REVENUE_COLUMNS = ['Ticket_Revenue', 'Concession_Revenue', 'Parking_Revenue',
+                   'Merchandise_Revenue']
+
+# ============================================================================
+# SCHEMA: compact dtypes for the survey sheet
+# ============================================================================
+
+SURVEY_CATEGORICALS = ['Gender', 'Customer Type',
+                       'Have you attended 1 or more games this year for your favorite sport(s)?']
+SURVEY_FLAG_PREFIXES = ('Sport Interest: ', 'Attended with: ')
+SURVEY_SCORE_PREFIXES = ('Overall Satisfaction', 'Likelihood to Recommend',
+                         'Importance: ', 'Satisfaction: ')
+
+
+def _categorical(series, categories=None):
+    """Convert a column to category, keeping a fixed order when one is defined"""
+    import pandas as pd
+
+    if categories is not None:
+        extra = [c for c in pd.unique(series.dropna()) if c not in categories]
+        return pd.Categorical(series, categories=list(categories) + sorted(extra),
+                              ordered=True)
+    return series.astype('category')
+
+
+# ============================================================================
+# TYPING
+# ============================================================================
+
+def apply_sports_dtypes(sports_df):
+    """Cast the event sheet to categoricals, int32 counts, nullable Int8 months and float32 prices/revenues"""
+    import numpy as np
+    import pandas as pd
+
+    df = sports_df.copy()
+
+    for col in SPORTS_CATEGORICALS:
+        if col in df.columns:
+            df[col] = _categorical(df[col], ORDERED_CATEGORIES.get(col))
+
+    for col in COUNT_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].fillna(0).astype(np.int32)
+
+    # Nullable so a blank Month stays <NA> instead of failing the cast
+    if 'Month' in df.columns:
+        df['Month'] = pd.to_numeric(df['Month'], errors='coerce').astype('Int8')
+
+    for col in PRICE_COLUMNS + REVENUE_COLUMNS + ['Total_Revenue']:
+        if col in df.columns:
+            df[col] = df[col].astype(np.float32)
+
+    return df
+
+
+def apply_survey_dtypes(survey_df):
+    """Cast the survey sheet to categoricals for answers, float32 for scores and nullable Int16 for Year Born"""
+    import numpy as np
+    import pandas as pd
+
+    df = survey_df.copy()
+
+    for col in df.columns:
+        if col in SURVEY_CATEGORICALS or col.startswith(SURVEY_FLAG_PREFIXES):
+            df[col] = df[col].astype('category')
+        elif col.startswith(SURVEY_SCORE_PREFIXES):
+            df[col] = pd.to_numeric(df[col], errors='coerce').astype(np.float32)
+
+    # Nullable so a respondent who left Year Born blank keeps the row with an <NA> age
+    if 'Year Born' in df.columns:
+        df['Year Born'] = pd.to_numeric(df['Year Born'], errors='coerce').astype('Int16')
+
+    return df
+
+
+# ============================================================================
+# FEATURE ENGINEERING
+# ============================================================================
+
+def add_sports_features(sports_df):
+    """Add Total_Revenue, Revenue_per_Attendee and Venue_Utilization"""
+    import numpy as np
+
+    df = sports_df
+    df['Total_Revenue'] = (df['Ticket_Revenue'] +
+                           df['Concession_Revenue'] +
+                           df['Merchandise_Revenue'] +
+                           df['Parking_Revenue']).astype(np.float32)
+    attendance = df['Attendance'].replace(0, np.nan)
+    df['Revenue_per_Attendee'] = (df['Total_Revenue'] / attendance).astype(np.float32)
+    df['Venue_Utilization'] = ((df['Attendance'] / df['Venue_Capacity']) * 100).astype(np.float32)
+    return df
+
+
+def add_survey_features(survey_df, current_year=None):
+    """Add respondent Age from Year Born (<NA> where Year Born is blank)"""
+    if current_year is None:
+        current_year = datetime.now().year
+    survey_df['Age'] = (current_year - survey_df['Year Born']).astype('Int16')
+    return survey_df
+
+
+# ============================================================================
+# PUBLIC API
+# ============================================================================
+
+@functools.lru_cache(maxsize=None)
+def _load_typed(file_path):
+    """Parse, type and feature-engineer both sheets once per process"""
+    with span('load', 'data', file=os.path.basename(file_path)):
+        sheets = read_sheets(file_path, [SPORTS_SHEET, SURVEY_SHEET])
+        sports_df = apply_sports_dtypes(sheets[SPORTS_SHEET])
+        survey_df = apply_survey_dtypes(sheets[SURVEY_SHEET])
+    with span('features', 'data', events=len(sports_df), respondents=len(survey_df)):
+        sports_df = add_sports_features(sports_df)
+        survey_df = add_survey_features(survey_df)
+    return sports_df, survey_df
+
+
+def load_data(file_path=DATA_FILE):
+    """
+    Return (sports_df, survey_df) with compact dtypes and engineered features
+    The workbook is read once per process; callers get shallow copies so added columns stay local
+    """
+    sports_df, survey_df = _load_typed(os.path.abspath(file_path))
+    return sports_df.copy(deep=False), survey_df.copy(deep=False)
+
+
+def load_sports_data(file_path=DATA_FILE):
+    """Return the typed event frame"""
+    return load_data(file_path)[0]
+
+
+def load_survey_data(file_path=DATA_FILE):
+    """Return the typed survey frame"""
+    return load_data(file_path)[1]
+
+
+def revenue_by_source(sports_df):
+    """Total revenue per stream, in dollars"""
+    import numpy as np
+
+    return {
+        'Ticket Sales': float(sports_df['Ticket_Revenue'].to_numpy(dtype=np.float64).sum()),
+        'Concessions': float(sports_df['Concession_Revenue'].to_numpy(dtype=np.float64).sum()),
+        'Parking': float(sports_df['Parking_Revenue'].to_numpy(dtype=np.float64).sum()),
+        'Merchandise': float(sports_df['Merchandise_Revenue'].to_numpy(dtype=np.float64).sum()),
+    }
+
+
+# cache_clear callables of per-process caches built from the loaded frames (the cube, the survey engine)
+_DERIVED_CACHES = []
+
+
+def register_derived_cache(cache_clear):
+    """Have reset_cache() also drop a cache built from the loaded frames"""
+    _DERIVED_CACHES.append(cache_clear)
+    return cache_clear
+
+
+def reset_cache():
+    """Forget the in-process frames and everything built from them so the next load re-reads the workbook cache"""
+    _load_typed.cache_clear()
+    for cache_clear in _DERIVED_CACHES:
+        cache_clear()
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+KAGR Case Competition - Dynamic Pricing Optimizer
+Per-sport demand models fitted on midwest_state_sports and a batched solve for the revenue-maximizing ticket
+price of every game in a schedule
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from data_loader import DATA_FILE, DAY_ORDER, START_TIME_ORDER, load_sports_data
+
+# Game conditions the demand and current-price models are conditioned on
+CONDITIONS = ['Opponent_Type', 'Game_Importance', 'Day_of_Week', 'Start_Time']
+FLAGS = ['Local_Events_Competing']
+SECONDARY_COLUMNS = ['Concession_Revenue', 'Parking_Revenue', 'Merchandise_Revenue']
+
+RIDGE_ALPHA = 1.0
+
+# Price moves allowed per game, as multiples of the current price (keeps season-ticket holders onside)
+DEFAULT_BOUNDS = (0.75, 1.5)
+
+# Fallback price elasticity of attendance at a sport's average price and attendance, used when its prices are
+# set by a fixed rule from the same game conditions (as in this workbook) so the data cannot separate price
+# from demand. Marquee sports sell out and are inelastic; discretionary Olympic sports respond more to price
+PRIOR_ELASTICITY = {
+    'Football': -0.4,
+    "Men's Basketball": -0.6,
+    "Women's Basketball": -0.9,
+    "Men's Baseball": -0.8,
+    "Women's Softball": -0.9,
+    "Women's Volleyball": -0.9,
+}
+DEFAULT_ELASTICITY = -0.8
+
+# Price is treated as identified only if the conditions leave this much of log price unexplained
+MIN_PRICE_RESIDUAL_SHARE = 0.05
+
+# Price_Limit values: what set the recommended price when it is not the revenue-maximizing stationary point
+LIMIT_HIGH = 'max increase'
+LIMIT_LOW = 'max decrease'
+LIMIT_FILL = 'sellout'
+
+# ============================================================================
+# DESIGN MATRIX
+# ============================================================================
+
+def condition_levels(sports_df):
+    """Levels of every condition, reference level first (fixed orders where the loader defines them)"""
+    fixed = {'Day_of_Week': DAY_ORDER, 'Start_Time': START_TIME_ORDER}
+    levels = {}
+    for col in CONDITIONS:
+        seen = set(sports_df[col].dropna().astype(str))
+        order = fixed.get(col) or sorted(seen)
+        levels[col] = [level for level in order if level in seen]
+    return levels
+
+
+def design_matrix(df, levels):
+    """Intercept, one-hot conditions (reference level dropped) and flags as a float64 array"""
+    blocks = [np.ones((len(df), 1))]
+    for col in CONDITIONS:
+        values = df[col].astype(str).to_numpy()
+        unknown = set(values) - set(levels[col])
+        if unknown:
+            raise ValueError(f"Unknown {col} value(s) {sorted(unknown)}; known: {levels[col]}")
+        blocks.append(values[:, None] == np.array(levels[col][1:])[None, :])
+    blocks.append(df[FLAGS].to_numpy(dtype=np.float64))
+    return np.hstack(blocks).astype(np.float64)
+
+
+def ridge(X, y, alpha=RIDGE_ALPHA):
+    """Ridge coefficients with an unpenalized intercept (column 0)"""
+    penalty = np.eye(X.shape[1]) * alpha
+    penalty[0, 0] = 0
+    return np.linalg.solve(X.T @ X + penalty, X.T @ y)
+
+# ============================================================================
+# DEMAND MODEL
+# ============================================================================
+
+class DemandModel:
+    """
+    Per-sport models of a game's baseline: log attendance and log current price from its conditions
+    Around that baseline demand is linear in price with one slope per sport (attendees per $), set so the
+    elasticity at the sport's average price and attendance is `elasticity[sport]`; high-demand games are then
+    less price-sensitive than weak ones. Attendance is capped at capacity, and every attendee also spends the
+    sport's average on concessions, parking and merchandise
+    """
+
+    def __init__(self, alpha=RIDGE_ALPHA, elasticity=None):
+        self.alpha = alpha
+        self.elasticity_override = dict(elasticity or {})
+        self.sports = []
+        self.levels = {}
+        self.attendance_coef = None   # (sports, features)
+        self.price_coef = None
+        self.capacity = None          # (sports,)
+        self.secondary = None         # per-attendee non-ticket spend, (sports,)
+        self.elasticity = None
+        self.slope = None             # change in attendance per $1 of price, (sports,)
+        self.elasticity_source = {}
+
+    def fit(self, sports_df):
+        df = sports_df[sports_df['Attendance'] > 0]
+        self.sports = sorted(df['Sport'].astype(str).unique())
+        self.levels = condition_levels(df)
+        n_features = design_matrix(df.head(1), self.levels).shape[1]
+        shape = (len(self.sports), n_features)
+        self.attendance_coef, self.price_coef = np.zeros(shape), np.zeros(shape)
+        self.capacity, self.secondary, self.elasticity, self.slope = (np.zeros(len(self.sports)) for _ in range(4))
+
+        for i, (sport, group) in enumerate(df.groupby(df['Sport'].astype(str), sort=True)):
+            X = design_matrix(group, self.levels)
+            log_attendance = np.log(group['Attendance'].to_numpy(dtype=np.float64))
+            log_price = np.log(group['Avg_Ticket_Price'].to_numpy(dtype=np.float64))
+            self.attendance_coef[i] = ridge(X, log_attendance, self.alpha)
+            self.price_coef[i] = ridge(X, log_price, self.alpha)
+            self.capacity[i] = group['Venue_Capacity'].max()
+            self.secondary[i] = group[SECONDARY_COLUMNS].to_numpy(dtype=np.float64).sum() / group['Attendance'].sum()
+            self.elasticity[i], self.elasticity_source[sport] = self._elasticity(sport, X, log_price, log_attendance)
+            self.slope[i] = self.elasticity[i] * group['Attendance'].mean() / group['Avg_Ticket_Price'].mean()
+        return self
+
+    def _elasticity(self, sport, X, log_price, log_attendance):
+        """Override, else estimated from price variation the conditions do not explain, else the prior"""
+        if sport in self.elasticity_override:
+            return self.elasticity_override[sport], 'override'
+        price_residual = log_price - X @ np.linalg.lstsq(X, log_price, rcond=None)[0]
+        if price_residual.var() > MIN_PRICE_RESIDUAL_SHARE * log_price.var():
+            attendance_residual = log_attendance - X @ np.linalg.lstsq(X, log_attendance, rcond=None)[0]
+            estimate = (price_residual @ attendance_residual) / (price_residual @ price_residual)
+            if estimate < 0:
+                return estimate, 'estimated'
+        return PRIOR_ELASTICITY.get(sport, DEFAULT_ELASTICITY), 'prior'
+
+    def _sport_index(self, schedule):
+        codes = pd.Categorical(schedule['Sport'].astype(str), categories=self.sports).codes
+        if (codes < 0).any():
+            unknown = sorted(set(schedule['Sport'].astype(str)) - set(self.sports))
+            raise ValueError(f"No demand model for sport(s) {unknown}")
+        return codes
+
+    def baseline(self, schedule):
+        """(sport index, current price, expected attendance at that price) for every game in the schedule"""
+        X = design_matrix(schedule, self.levels)
+        sport = self._sport_index(schedule)
+        price = np.exp(np.einsum('ij,ij->i', X, self.price_coef[sport]))
+        if 'Avg_Ticket_Price' in schedule.columns:
+            price = schedule['Avg_Ticket_Price'].fillna(pd.Series(price, index=schedule.index)).to_numpy(np.float64)
+        attendance = np.exp(np.einsum('ij,ij->i', X, self.attendance_coef[sport]))
+        return sport, price, attendance
+
+# ============================================================================
+# OPTIMIZER
+# ============================================================================
+
+def optimize_prices(model, schedule, bounds=DEFAULT_BOUNDS, include_secondary=True):
+    """
+    Revenue-maximizing ticket price for every game in one vectorized solve
+    With demand A(p) = A0 + b * (p - p0) and spend s per attendee, revenue (p + s) * A(p) is concave, so the
+    optimum is its stationary point clipped to [max(bounds low, price that just fills the venue), bounds high]
+    Baseline_* columns are the model's expectation at the current price (Actual_Attendance is the recorded one);
+    Price_Limit names the clip that set the price, and Elasticity_Source says whether the slope is a prior
+    """
+    sport, p0, a0 = model.baseline(schedule)
+    b = model.slope[sport]
+    cap = model.capacity[sport]
+    s = model.secondary[sport] if include_secondary else np.zeros(len(p0))
+
+    stationary = (p0 - s) / 2 - a0 / (2 * b)
+    fill_price = p0 + (cap - a0) / b
+    low = np.maximum(bounds[0] * p0, fill_price)
+    high = bounds[1] * p0
+    price = np.minimum(np.maximum(stationary, low), high)
+    limit = np.select([np.isclose(stationary, price), np.isclose(price, high), np.isclose(price, fill_price)],
+                      ['', LIMIT_HIGH, LIMIT_FILL], LIMIT_LOW)
+
+    def attendance(p):
+        return np.clip(a0 + b * (p - p0), 0, cap)
+
+    baseline_attendance = attendance(p0)
+    expected_attendance = attendance(price)
+    result = pd.DataFrame({
+        'Sport': schedule['Sport'].astype(str).to_numpy(),
+        'Current_Price': p0,
+        'Optimal_Price': price,
+        'Price_Change_Pct': (price / p0 - 1) * 100,
+        'Price_Limit': limit,
+        'Elasticity': model.elasticity[sport],
+        'Elasticity_Source': np.array([model.elasticity_source[name] for name in model.sports])[sport],
+        'Baseline_Attendance': baseline_attendance,
+        'Expected_Attendance': expected_attendance,
+        'Baseline_Revenue': (p0 + s) * baseline_attendance,
+        'Expected_Revenue': (price + s) * expected_attendance,
+    }, index=schedule.index)
+    if 'Attendance' in schedule.columns:
+        result.insert(result.columns.get_loc('Baseline_Attendance'), 'Actual_Attendance',
+                      schedule['Attendance'].to_numpy())
+    result['Revenue_Lift'] = result['Expected_Revenue'] - result['Baseline_Revenue']
+    for col in CONDITIONS + FLAGS:
+        result[col] = schedule[col].to_numpy()
+    return result
+
+
+def pricing_rules(result):
+    """Average recommended price change per sport and condition level (the deck's "rivalry +20%" table)"""
+    frames = []
+    for col in CONDITIONS:
+        table = result.groupby(['Sport', col], observed=True)['Price_Change_Pct'].mean().rename('Price_Change_Pct')
+        frames.append(table.reset_index().rename(columns={col: 'Level'}).assign(Condition=col))
+    return pd.concat(frames, ignore_index=True)[['Sport', 'Condition', 'Level', 'Price_Change_Pct']]
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Fit per-sport demand models and price a schedule of games")
+    parser.add_argument('--data', default=DATA_FILE, help="workbook with the midwest_state_sports sheet")
+    parser.add_argument('--season', help="academic year to price (e.g. 2024-25); default all games")
+    parser.add_argument('--sport', nargs='+', help="only these sports")
+    parser.add_argument('--bounds', type=float, nargs=2, default=DEFAULT_BOUNDS, metavar=('LOW', 'HIGH'),
+                        help="allowed price range as multiples of the current price")
+    parser.add_argument('--ticket-only', action='store_true',
+                        help="maximize ticket revenue only (ignore concessions, parking and merchandise)")
+    parser.add_argument('--output', help="write the per-game prices to this CSV")
+    args = parser.parse_args()
+
+    print("📂 Loading data...")
+    sports_df = load_sports_data(args.data)
+
+    start = time.perf_counter()
+    model = DemandModel().fit(sports_df)
+    fit_seconds = time.perf_counter() - start
+
+    schedule = sports_df
+    if args.season:
+        schedule = schedule[schedule['Academic_Year'] == args.season]
+    if args.sport:
+        schedule = schedule[schedule['Sport'].isin(args.sport)]
+
+    start = time.perf_counter()
+    result = optimize_prices(model, schedule, tuple(args.bounds), include_secondary=not args.ticket_only)
+    solve_seconds = time.perf_counter() - start
+
+    print("\n📊 Elasticity at current prices:")
+    for i, sport in enumerate(model.sports):
+        print(f"   {sport:<20} {model.elasticity[i]:>6.2f}  ({model.elasticity_source[sport]})")
+
+    summary = result.groupby('Sport', observed=True).agg(
+        Games=('Optimal_Price', 'size'),
+        Avg_Current_Price=('Current_Price', 'mean'),
+        Avg_Optimal_Price=('Optimal_Price', 'mean'),
+        Avg_Price_Change_Pct=('Price_Change_Pct', 'mean'),
+        At_Limit=('Price_Limit', lambda limit: (limit != '').sum()),
+        Revenue_Lift=('Revenue_Lift', 'sum'),
+    ).sort_values('Revenue_Lift', ascending=False)
+    summary['Elasticity'] = [model.elasticity_source[sport] for sport in summary.index]
+    print("\n💰 Recommended prices by sport (revenue lift vs. the model's baseline at the current price):")
+    print(summary.to_string(float_format=lambda x: f"{x:,.2f}"))
+
+    limited = result['Price_Limit'] != ''
+    if limited.any():
+        counts = ', '.join(f"{n} at {limit}" for limit, n in result.loc[limited, 'Price_Limit'].value_counts().items())
+        print(f"\n⚠️  {limited.sum()} of {len(result)} prices are set by a limit, not the demand curve ({counts}); "
+              f"--bounds is {args.bounds[0]:g}-{args.bounds[1]:g}x the current price")
+    priors = [sport for sport in summary.index if model.elasticity_source[sport] == 'prior']
+    if priors:
+        print(f"⚠️  Prices here do not vary independently of game conditions, so {', '.join(priors)} use the "
+              f"assumed PRIOR_ELASTICITY; their recommendations follow that assumption, not the data")
+
+    rules = pricing_rules(result)
+    print("\n🎟️  Average price change by condition:")
+    print(rules.pivot_table(index=['Condition', 'Level'], columns='Sport', values='Price_Change_Pct',
+                            observed=True).to_string(float_format=lambda x: f"{x:+.0f}%"))
+
+    print(f"\n✅ {len(result)} games priced; revenue lift ${result['Revenue_Lift'].sum() / 1e6:,.2f}M")
+    print(f"⏱️  fit {fit_seconds * 1000:.1f} ms, solve {solve_seconds * 1000:.1f} ms")
+
+    if args.output:
+        result.to_csv(args.output)
+        print(f"✅ Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,22 +1,24 @@
 #!/usr/bin/env python3
 """
 Generate all 9 advanced story-driven visualizations for PowerPoint presentation
+Each chart is a task with declared inputs and an output file; run any subset from the CLI or import the builders
 """
 
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
 import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
+import argparse
+import sys
 import warnings
-from datetime import datetime
 import os
 
-warnings.filterwarnings('ignore')
+# pandas, plotly's subplots and the data modules are imported inside the builders and loaders that use them,
+# so --list and the data-free charts never load them
+from data_loader import DATA_FILE
+from html_export import HTML_MODES
+from initiatives import BASE_REVENUE, SETTLEMENT_TARGET, step_label, waterfall_steps, womens_bb_opportunity
+import tracing
+from tracing import span
 
-# Create output directory
-os.makedirs('docs', exist_ok=True)
+warnings.filterwarnings('ignore')
 
 # Professional Color Palette
 COLORS = {
@@ -32,941 +34,1079 @@ COLORS = {
     'light_blue': '#42A5F5'
 }
 
-print("=" * 80)
-print("🎨 GENERATING ADVANCED VISUALIZATIONS FOR PPT")
-print("=" * 80)
-
-# Load data
-print("\n📂 Loading data...")
-file_path = "data/2025 KODING with KAGR Case Competition_Dataset.xlsx"
-
-try:
-    sports_df = pd.read_excel(file_path, sheet_name='midwest_state_sports')
-    survey_df = pd.read_excel(file_path, sheet_name='Customer Experience Survey')
-
-    # Feature engineering
-    sports_df['Total_Revenue'] = (sports_df['Ticket_Revenue'] +
-                                   sports_df['Concession_Revenue'] +
-                                   sports_df['Merchandise_Revenue'] +
-                                   sports_df['Parking_Revenue'])
-    sports_df['Revenue_per_Attendee'] = sports_df['Total_Revenue'] / sports_df['Attendance'].replace(0, np.nan)
-    sports_df['Venue_Utilization'] = (sports_df['Attendance'] / sports_df['Venue_Capacity']) * 100
-
-    current_year = datetime.now().year
-    survey_df['Age'] = current_year - survey_df['Year Born']
-
-    print(f"✅ Data loaded: {sports_df.shape[0]} events, {survey_df.shape[0]} responses")
-except Exception as e:
-    print(f"❌ Error loading data: {e}")
-    exit(1)
+# Monte Carlo run behind the revenue waterfall's P10-P90 bands (fixed seed: the same figure on every build)
+WATERFALL_SCENARIOS = 200_000
+WATERFALL_SEED = 2025
 
 # =============================================================================
 # VISUALIZATION 1: The Challenge Gauge
 # =============================================================================
-print("\n📊 [1/9] Creating Challenge Gauge...")
-
-fig1 = go.Figure(go.Indicator(
-    mode="gauge+number+delta",
-    value=20.5,
-    domain={'x': [0, 1], 'y': [0, 1]},
-    title={'text': "<b>Annual Revenue Gap to Fill</b><br><sub>NCAA Settlement Obligation</sub>",
-           'font': {'size': 28, 'color': COLORS['danger']}},
-    number={'prefix': "$", 'suffix': "M", 'font': {'size': 60, 'color': COLORS['danger']}},
-    gauge={
-        'axis': {'range': [None, 30], 'tickwidth': 2, 'tickcolor': "darkgray"},
-        'bar': {'color': COLORS['danger'], 'thickness': 0.75},
-        'bgcolor': "white",
-        'borderwidth': 3,
-        'bordercolor': "gray",
-        'steps': [
-            {'range': [0, 10], 'color': COLORS['light_green']},
-            {'range': [10, 20], 'color': COLORS['warning']},
-            {'range': [20, 30], 'color': COLORS['danger']}],
-        'threshold': {
-            'line': {'color': "red", 'width': 4},
-            'thickness': 0.75,
-            'value': 20.5}}))
-
-fig1.add_annotation(
-    text="<b>CHALLENGE:</b> Generate $20.5M in new annual revenue<br>without reducing fan satisfaction or competitive excellence",
-    xref="paper", yref="paper",
-    x=0.5, y=-0.1,
-    showarrow=False,
-    font=dict(size=18, color=COLORS['neutral']),
-    align="center")
-
-fig1.update_layout(
-    height=600,
-    margin=dict(l=50, r=50, t=150, b=100),
-    paper_bgcolor="white",
-    font={'family': "Arial, sans-serif"})
-
-fig1.write_html("docs/viz_01_challenge_gauge.html")
-# PNG export requires Chrome - using HTML only
-print("✅ Visualization 1 saved: Challenge Gauge")
+def build_challenge_gauge():
+    """Challenge Gauge"""
+    fig1 = go.Figure(go.Indicator(
+        mode="gauge+number+delta",
+        value=20.5,
+        domain={'x': [0, 1], 'y': [0, 1]},
+        title={'text': "<b>Annual Revenue Gap to Fill</b><br><sub>NCAA Settlement Obligation</sub>",
+               'font': {'size': 28, 'color': COLORS['danger']}},
+        number={'prefix': "$", 'suffix': "M", 'font': {'size': 60, 'color': COLORS['danger']}},
+        gauge={
+            'axis': {'range': [None, 30], 'tickwidth': 2, 'tickcolor': "darkgray"},
+            'bar': {'color': COLORS['danger'], 'thickness': 0.75},
+            'bgcolor': "white",
+            'borderwidth': 3,
+            'bordercolor': "gray",
+            'steps': [
+                {'range': [0, 10], 'color': COLORS['light_green']},
+                {'range': [10, 20], 'color': COLORS['warning']},
+                {'range': [20, 30], 'color': COLORS['danger']}],
+            'threshold': {
+                'line': {'color': "red", 'width': 4},
+                'thickness': 0.75,
+                'value': 20.5}}))
+
+    fig1.add_annotation(
+        text="<b>CHALLENGE:</b> Generate $20.5M in new annual revenue<br>without reducing fan satisfaction or competitive excellence",
+        xref="paper", yref="paper",
+        x=0.5, y=-0.1,
+        showarrow=False,
+        font=dict(size=18, color=COLORS['neutral']),
+        align="center")
+
+    fig1.update_layout(
+        height=600,
+        margin=dict(l=50, r=50, t=150, b=100),
+        paper_bgcolor="white",
+        font={'family': "Arial, sans-serif"})
+
+    return fig1
 
 # =============================================================================
 # VISUALIZATION 2: Current State Dashboard
 # =============================================================================
-print("\n📊 [2/9] Creating Current State Dashboard...")
+def build_current_state_dashboard(cube):
+    """Current State Dashboard"""
+    from plotly.subplots import make_subplots
 
-total_revenue = sports_df['Total_Revenue'].sum() / 1e6
+    kpis = cube.kpis()
+    total_revenue = kpis['total_revenue'] / 1e6
 
-revenue_by_source = {
-    'Ticket Sales': sports_df['Ticket_Revenue'].sum() / 1e6,
-    'Concessions': sports_df['Concession_Revenue'].sum() / 1e6,
-    'Merchandise': sports_df['Merchandise_Revenue'].sum() / 1e6,
-    'Parking': sports_df['Parking_Revenue'].sum() / 1e6
-}
+    revenue_by_source = {source: value / 1e6 for source, value in kpis['revenue_by_source'].items()}
 
-sport_revenue = sports_df.groupby('Sport')['Total_Revenue'].sum().sort_values(ascending=False) / 1e6
-
-fig2 = make_subplots(
-    rows=2, cols=2,
-    subplot_titles=(
-        '<b>Total Revenue: $94.4M</b>',
-        '<b>Revenue by Source</b>',
-        '<b>Revenue by Sport</b>',
-        '<b>Key Performance Indicators</b>'
-    ),
-    specs=[
-        [{'type': 'indicator'}, {'type': 'pie'}],
-        [{'type': 'bar'}, {'type': 'table'}]
-    ],
-    vertical_spacing=0.15,
-    horizontal_spacing=0.12
-)
-
-fig2.add_trace(go.Indicator(
-    mode="number",
-    value=total_revenue,
-    number={'prefix': "$", 'suffix': "M", 'font': {'size': 60, 'color': COLORS['primary']}},
-    domain={'x': [0, 1], 'y': [0, 1]}
-), row=1, col=1)
-
-fig2.add_trace(go.Pie(
-    labels=list(revenue_by_source.keys()),
-    values=list(revenue_by_source.values()),
-    hole=0.4,
-    marker=dict(colors=['#FF6B6B', '#4ECDC4', '#45B7D1', '#FFA07A']),
-    textinfo='label+percent',
-    textfont=dict(size=13)
-), row=1, col=2)
-
-fig2.add_trace(go.Bar(
-    x=sport_revenue.index,
-    y=sport_revenue.values,
-    marker=dict(color=sport_revenue.values, colorscale='Blues', showscale=False),
-    text=[f'${x:.1f}M' for x in sport_revenue.values],
-    textposition='outside'
-), row=2, col=1)
-
-avg_attendance = sports_df['Attendance'].mean()
-avg_utilization = sports_df['Venue_Utilization'].mean()
-avg_rev_per_att = sports_df['Revenue_per_Attendee'].mean()
-
-fig2.add_trace(go.Table(
-    header=dict(
-        values=['<b>Metric</b>', '<b>Value</b>'],
-        fill_color=COLORS['primary'],
-        font=dict(color='white', size=14),
-        align='left'
-    ),
-    cells=dict(
-        values=[
-            ['Total Events', 'Avg Attendance', 'Avg Utilization', 'Revenue/Attendee'],
-            [f"{len(sports_df)}", f"{avg_attendance:,.0f}", f"{avg_utilization:.1f}%", f"${avg_rev_per_att:.2f}"]
+    sport_revenue = cube.slice('Sport', 'Total_Revenue', 'sum').sort_values(ascending=False) / 1e6
+
+    fig2 = make_subplots(
+        rows=2, cols=2,
+        subplot_titles=(
+            '<b>Total Revenue: $94.4M</b>',
+            '<b>Revenue by Source</b>',
+            '<b>Revenue by Sport</b>',
+            '<b>Key Performance Indicators</b>'
+        ),
+        specs=[
+            [{'type': 'indicator'}, {'type': 'pie'}],
+            [{'type': 'bar'}, {'type': 'table'}]
         ],
-        fill_color='lavender',
-        font=dict(size=13),
-        align='left',
-        height=30
+        vertical_spacing=0.15,
+        horizontal_spacing=0.12
     )
-), row=2, col=2)
-
-fig2.update_layout(
-    title=dict(
-        text='<b>Current State: Midwest State Athletics Revenue Overview</b>',
-        font=dict(size=24, color=COLORS['primary']),
-        x=0.5,
-        xanchor='center'
-    ),
-    height=900,
-    showlegend=False,
-    paper_bgcolor='white'
-)
-
-fig2.write_html("docs/viz_02_current_state_dashboard.html")
-# PNG export requires Chrome - using HTML only
-print("✅ Visualization 2 saved: Current State Dashboard")
-
-# =============================================================================
-# VISUALIZATION 3: Gap Analysis Matrix
-# =============================================================================
-print("\n📊 [3/9] Creating Gap Analysis Matrix...")
-
-categories = [
-    'Corporate<br>Partnerships',
-    'Women\'s BB<br>Capacity',
-    'Premium<br>Seating',
-    'Merchandise<br>per Fan',
-    'Digital<br>Engagement'
-]
 
-current = [9.2, 43.5, 8, 10.5, 12]
-industry_avg = [15, 65, 18, 12, 35]
-industry_leader = [18, 85, 25, 15, 50]
-
-fig3 = go.Figure()
-
-fig3.add_trace(go.Bar(
-    name='Industry Leader',
-    x=categories,
-    y=industry_leader,
-    marker=dict(color='lightgray', opacity=0.3),
-    text=[f'{x}%' for x in industry_leader],
-    textposition='outside'
-))
-
-fig3.add_trace(go.Bar(
-    name='Industry Average (Target)',
-    x=categories,
-    y=industry_avg,
-    marker=dict(color=COLORS['warning'], opacity=0.6),
-    text=[f'{x}%' for x in industry_avg],
-    textposition='inside',
-    textfont=dict(color='white', size=14)
-))
-
-colors_current = [COLORS['danger'] if c < t else COLORS['success']
-                 for c, t in zip(current, industry_avg)]
-
-fig3.add_trace(go.Bar(
-    name='Midwest State (Current)',
-    x=categories,
-    y=current,
-    marker=dict(color=colors_current),
-    text=[f'<b>{x}%</b>' for x in current],
-    textposition='inside',
-    textfont=dict(color='white', size=16, family='Arial Black')
-))
-
-for i, (cat, cur, avg) in enumerate(zip(categories, current, industry_avg)):
-    if cur < avg:
-        gap = avg - cur
-        fig3.add_annotation(
-            x=cat,
-            y=avg + 3,
-            text=f"<b>↑ {gap:.1f}% gap</b>",
-            showarrow=True,
-            arrowhead=2,
-            arrowcolor=COLORS['danger'],
-            font=dict(size=12, color=COLORS['danger']),
-            bgcolor='yellow',
-            opacity=0.8
+    fig2.add_trace(go.Indicator(
+        mode="number",
+        value=total_revenue,
+        number={'prefix': "$", 'suffix': "M", 'font': {'size': 60, 'color': COLORS['primary']}},
+        domain={'x': [0, 1], 'y': [0, 1]}
+    ), row=1, col=1)
+
+    fig2.add_trace(go.Pie(
+        labels=list(revenue_by_source.keys()),
+        values=list(revenue_by_source.values()),
+        hole=0.4,
+        marker=dict(colors=['#FF6B6B', '#4ECDC4', '#45B7D1', '#FFA07A']),
+        textinfo='label+percent',
+        textfont=dict(size=13)
+    ), row=1, col=2)
+
+    fig2.add_trace(go.Bar(
+        x=sport_revenue.index,
+        y=sport_revenue.values,
+        marker=dict(color=sport_revenue.values, colorscale='Blues', showscale=False),
+        text=[f'${x:.1f}M' for x in sport_revenue.values],
+        textposition='outside'
+    ), row=2, col=1)
+
+    avg_attendance = kpis['avg_attendance']
+    avg_utilization = kpis['avg_utilization']
+    avg_rev_per_att = kpis['revenue_per_attendee']
+
+    fig2.add_trace(go.Table(
+        header=dict(
+            values=['<b>Metric</b>', '<b>Value</b>'],
+            fill_color=COLORS['primary'],
+            font=dict(color='white', size=14),
+            align='left'
+        ),
+        cells=dict(
+            values=[
+                ['Total Events', 'Avg Attendance', 'Avg Utilization', 'Revenue/Attendee'],
+                [f"{kpis['total_events']}", f"{avg_attendance:,.0f}", f"{avg_utilization:.1f}%", f"${avg_rev_per_att:.2f}"]
+            ],
+            fill_color='lavender',
+            font=dict(size=13),
+            align='left',
+            height=30
         )
+    ), row=2, col=2)
+
+    fig2.update_layout(
+        title=dict(
+            text='<b>Current State: Midwest State Athletics Revenue Overview</b>',
+            font=dict(size=24, color=COLORS['primary']),
+            x=0.5,
+            xanchor='center'
+        ),
+        height=900,
+        showlegend=False,
+        paper_bgcolor='white'
+    )
 
-fig3.update_layout(
-    title=dict(
-        text='<b>The Gap: Midwest State vs. Power 5 Conference Benchmarks</b><br><sub>Where are the opportunities?</sub>',
-        font=dict(size=26, color=COLORS['primary']),
-        x=0.5,
-        xanchor='center'
-    ),
-    barmode='overlay',
-    height=700,
-    yaxis=dict(title='Percentage (%)', range=[0, max(industry_leader) * 1.15]),
-    legend=dict(
-        orientation="h",
-        yanchor="bottom",
-        y=1.02,
-        xanchor="center",
-        x=0.5,
-        font=dict(size=14)
-    ),
-    paper_bgcolor='white',
-    plot_bgcolor='white'
-)
-
-fig3.add_annotation(
-    text="Source: NCAA Financial Database 2023-24; UT Austin, Ohio State, Michigan, Penn State, Wisconsin athletic reports",
-    xref="paper", yref="paper",
-    x=0.5, y=-0.1,
-    showarrow=False,
-    font=dict(size=11, color='gray', style='italic')
-)
-
-fig3.write_html("docs/viz_03_gap_analysis.html")
-# PNG export requires Chrome - using HTML only
-print("✅ Visualization 3 saved: Gap Analysis Matrix")
+    return fig2
 
 # =============================================================================
-# VISUALIZATION 4: Women's Basketball Opportunity
+# VISUALIZATION 3: Gap Analysis Matrix
 # =============================================================================
-print("\n📊 [4/9] Creating Women's Basketball Opportunity Chart...")
-
-sports = ['Football', 'Men\'s<br>Basketball', 'Women\'s<br>Basketball', 'Baseball', 'Softball', 'Volleyball']
-interest_scores = [95, 88, 85, 65, 58, 52]
-
-sport_mapping = {
-    'Football': 'Football',
-    "Men's<br>Basketball": 'Mens_Basketball',
-    "Women's<br>Basketball": 'Womens_Basketball',
-    'Baseball': 'Baseball',
-    'Softball': 'Softball',
-    'Volleyball': 'Volleyball'
-}
-
-capacity_util = []
-for sport_display in sports:
-    sport_name = sport_mapping[sport_display]
-    sport_data = sports_df[sports_df['Sport'] == sport_name]
-    if len(sport_data) > 0:
-        capacity_util.append(sport_data['Venue_Utilization'].mean())
-    else:
-        capacity_util.append(0)
+def build_gap_analysis():
+    """Gap Analysis Matrix"""
+    categories = [
+        'Corporate<br>Partnerships',
+        'Women\'s BB<br>Capacity',
+        'Premium<br>Seating',
+        'Merchandise<br>per Fan',
+        'Digital<br>Engagement'
+    ]
+
+    current = [9.2, 43.5, 8, 10.5, 12]
+    industry_avg = [15, 65, 18, 12, 35]
+    industry_leader = [18, 85, 25, 15, 50]
+
+    fig3 = go.Figure()
+
+    fig3.add_trace(go.Bar(
+        name='Industry Leader',
+        x=categories,
+        y=industry_leader,
+        marker=dict(color='lightgray', opacity=0.3),
+        text=[f'{x}%' for x in industry_leader],
+        textposition='outside'
+    ))
 
-fig4 = make_subplots(specs=[[{"secondary_y": True}]])
+    fig3.add_trace(go.Bar(
+        name='Industry Average (Target)',
+        x=categories,
+        y=industry_avg,
+        marker=dict(color=COLORS['warning'], opacity=0.6),
+        text=[f'{x}%' for x in industry_avg],
+        textposition='inside',
+        textfont=dict(color='white', size=14)
+    ))
 
-colors_interest = [COLORS['primary']] * len(sports)
-colors_interest[2] = COLORS['danger']
+    colors_current = [COLORS['danger'] if c < t else COLORS['success']
+                     for c, t in zip(current, industry_avg)]
 
-fig4.add_trace(
-    go.Bar(
-        name='Fan Interest Score',
-        x=sports,
-        y=interest_scores,
-        marker=dict(color=colors_interest, opacity=0.8),
-        text=[f'{x}' for x in interest_scores],
+    fig3.add_trace(go.Bar(
+        name='Midwest State (Current)',
+        x=categories,
+        y=current,
+        marker=dict(color=colors_current),
+        text=[f'<b>{x}%</b>' for x in current],
         textposition='inside',
-        textfont=dict(size=16, color='white', family='Arial Black'),
-        yaxis='y'
-    ),
-    secondary_y=False
-)
-
-fig4.add_trace(
-    go.Scatter(
-        name='Capacity Utilization',
-        x=sports,
-        y=capacity_util,
-        mode='lines+markers',
-        line=dict(color=COLORS['success'], width=4),
-        marker=dict(size=15, symbol='diamond'),
-        yaxis='y2'
-    ),
-    secondary_y=True
-)
-
-fig4.add_annotation(
-    x="Women's<br>Basketball",
-    y=85,
-    text="<b>MAJOR OPPORTUNITY!</b><br>Interest Score: 85<br>Capacity: 43.5%<br><br>Same interest as Men's BB<br>but 40% lower attendance",
-    showarrow=True,
-    arrowhead=2,
-    arrowsize=2,
-    arrowwidth=3,
-    arrowcolor=COLORS['danger'],
-    ax=-150,
-    ay=-100,
-    font=dict(size=16, color=COLORS['danger'], family='Arial Black'),
-    bgcolor='yellow',
-    bordercolor=COLORS['danger'],
-    borderwidth=3,
-    borderpad=10,
-    opacity=0.95
-)
-
-fig4.add_annotation(
-    x="Women's<br>Basketball",
-    y=43.5,
-    text="<b>+$4.0M Annual Revenue<br>if we reach 60% capacity</b>",
-    showarrow=True,
-    arrowhead=2,
-    arrowcolor=COLORS['success'],
-    ax=100,
-    ay=80,
-    font=dict(size=14, color=COLORS['success'], family='Arial Black'),
-    bgcolor=COLORS['light_green'],
-    bordercolor=COLORS['success'],
-    borderwidth=2,
-    borderpad=8,
-    opacity=0.9
-)
-
-fig4.update_layout(
-    title=dict(
-        text='<b>The Women\'s Basketball Paradox</b><br><sub>High Fan Interest, Low Attendance = Biggest Opportunity</sub>',
-        font=dict(size=28, color=COLORS['primary']),
-        x=0.5,
-        xanchor='center'
-    ),
-    height=700,
-    hovermode='x unified',
-    legend=dict(
-        orientation="h",
-        yanchor="bottom",
-        y=1.02,
-        xanchor="center",
-        x=0.5,
-        font=dict(size=14)
-    ),
-    paper_bgcolor='white'
-)
-
-fig4.update_yaxes(title_text="<b>Fan Interest Score (0-100)</b>", secondary_y=False, range=[0, 100])
-fig4.update_yaxes(title_text="<b>Capacity Utilization (%)</b>", secondary_y=True, range=[0, 100])
-
-fig4.write_html("docs/viz_04_womens_bb_opportunity.html")
-# PNG export requires Chrome - using HTML only
-print("✅ Visualization 4 saved: Women's Basketball Opportunity")
+        textfont=dict(color='white', size=16, family='Arial Black')
+    ))
+
+    for i, (cat, cur, avg) in enumerate(zip(categories, current, industry_avg)):
+        if cur < avg:
+            gap = avg - cur
+            fig3.add_annotation(
+                x=cat,
+                y=avg + 3,
+                text=f"<b>↑ {gap:.1f}% gap</b>",
+                showarrow=True,
+                arrowhead=2,
+                arrowcolor=COLORS['danger'],
+                font=dict(size=12, color=COLORS['danger']),
+                bgcolor='yellow',
+                opacity=0.8
+            )
+
+    fig3.update_layout(
+        title=dict(
+            text='<b>The Gap: Midwest State vs. Power 5 Conference Benchmarks</b><br><sub>Where are the opportunities?</sub>',
+            font=dict(size=26, color=COLORS['primary']),
+            x=0.5,
+            xanchor='center'
+        ),
+        barmode='overlay',
+        height=700,
+        yaxis=dict(title='Percentage (%)', range=[0, max(industry_leader) * 1.15]),
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="center",
+            x=0.5,
+            font=dict(size=14)
+        ),
+        paper_bgcolor='white',
+        plot_bgcolor='white'
+    )
+
+    fig3.add_annotation(
+        text="Source: NCAA Financial Database 2023-24; UT Austin, Ohio State, Michigan, Penn State, Wisconsin athletic reports",
+        xref="paper", yref="paper",
+        x=0.5, y=-0.1,
+        showarrow=False,
+        font=dict(size=11, color='gray', style='italic')
+    )
+
+    return fig3
 
 # =============================================================================
-# VISUALIZATION 5: Initiative Bubble Chart
+# VISUALIZATION 4: Women's Basketball Opportunity
 # =============================================================================
-print("\n📊 [5/9] Creating Initiative Bubble Chart...")
-
-initiatives = [
-    {'name': 'Women\'s BB<br>Growth', 'revenue': 4.0, 'effort': 2, 'timeline': 6},
-    {'name': 'Corporate<br>Partnerships', 'revenue': 7.5, 'effort': 3, 'timeline': 9},
-    {'name': 'Dynamic<br>Pricing', 'revenue': 4.2, 'effort': 1, 'timeline': 3},
-    {'name': 'Premium<br>Seating', 'revenue': 2.8, 'effort': 4, 'timeline': 12},
-    {'name': 'Digital<br>Platform', 'revenue': 2.8, 'effort': 2, 'timeline': 6},
-    {'name': 'Merchandise<br>Expansion', 'revenue': 1.9, 'effort': 2, 'timeline': 4},
-    {'name': 'Alumni<br>Program', 'revenue': 0.9, 'effort': 1, 'timeline': 3}
-]
+def build_womens_bb_opportunity(cube, survey):
+    """Women's Basketball Opportunity"""
+    from plotly.subplots import make_subplots
+
+    sports = ['Football', 'Men\'s<br>Basketball', 'Women\'s<br>Basketball', 'Baseball', 'Softball', 'Volleyball']
+
+    sport_mapping = {
+        'Football': 'Football',
+        "Men's<br>Basketball": "Men's Basketball",
+        "Women's<br>Basketball": "Women's Basketball",
+        'Baseball': "Men's Baseball",
+        'Softball': "Women's Softball",
+        'Volleyball': "Women's Volleyball"
+    }
 
-df_init = pd.DataFrame(initiatives)
+    # % of survey respondents interested in each sport
+    interest_by_sport = survey.interest_by_sport()
+    interest_scores = [round(float(interest_by_sport.get(sport_mapping[sport_display], 0)))
+                       for sport_display in sports]
+
+    util_by_sport = cube.slice('Sport', 'Venue_Utilization')
+    capacity_util = [float(util_by_sport.get(sport_mapping[sport_display], 0))
+                     for sport_display in sports]
+
+    fig4 = make_subplots(specs=[[{"secondary_y": True}]])
+
+    # Women's BB (index 2) against Men's BB (index 1): utilization gap and the revenue at the target utilization
+    opportunity = womens_bb_opportunity(cube, survey)
+    utilization_gap = 1 - capacity_util[2] / capacity_util[1]
+
+    colors_interest = [COLORS['primary']] * len(sports)
+    colors_interest[2] = COLORS['danger']
+
+    fig4.add_trace(
+        go.Bar(
+            name='Fan Interest Score',
+            x=sports,
+            y=interest_scores,
+            marker=dict(color=colors_interest, opacity=0.8),
+            text=[f'{x}' for x in interest_scores],
+            textposition='inside',
+            textfont=dict(size=16, color='white', family='Arial Black'),
+            yaxis='y'
+        ),
+        secondary_y=False
+    )
 
-fig5 = go.Figure()
+    fig4.add_trace(
+        go.Scatter(
+            name='Capacity Utilization',
+            x=sports,
+            y=capacity_util,
+            mode='lines+markers',
+            line=dict(color=COLORS['success'], width=4),
+            marker=dict(size=15, symbol='diamond'),
+            yaxis='y2'
+        ),
+        secondary_y=True
+    )
 
-colors_effort = ['#2E7D32', '#66BB6A', '#FFA726', '#E65100']
+    fig4.add_annotation(
+        x="Women's<br>Basketball",
+        y=interest_scores[2],
+        text=f"<b>MAJOR OPPORTUNITY!</b><br>Interest Score: {interest_scores[2]}<br>Capacity: {capacity_util[2]:.1f}%<br><br>Near Men's BB interest ({interest_scores[1]})<br>but {utilization_gap:.0%} lower capacity utilization",
+        showarrow=True,
+        arrowhead=2,
+        arrowsize=2,
+        arrowwidth=3,
+        arrowcolor=COLORS['danger'],
+        ax=-150,
+        ay=-100,
+        font=dict(size=16, color=COLORS['danger'], family='Arial Black'),
+        bgcolor='yellow',
+        bordercolor=COLORS['danger'],
+        borderwidth=3,
+        borderpad=10,
+        opacity=0.95
+    )
 
-for _, row in df_init.iterrows():
-    color_idx = min(row['effort'] - 1, len(colors_effort) - 1)
+    fig4.add_annotation(
+        x="Women's<br>Basketball",
+        y=capacity_util[2],
+        text=f"<b>+${opportunity['added_revenue'] / 1e6:.1f}M Annual Revenue<br>if we reach {opportunity['target']}% capacity</b>",
+        showarrow=True,
+        arrowhead=2,
+        arrowcolor=COLORS['success'],
+        ax=100,
+        ay=80,
+        font=dict(size=14, color=COLORS['success'], family='Arial Black'),
+        bgcolor=COLORS['light_green'],
+        bordercolor=COLORS['success'],
+        borderwidth=2,
+        borderpad=8,
+        opacity=0.9
+    )
 
-    fig5.add_trace(go.Scatter(
-        x=[row['timeline']],
-        y=[row['revenue']],
-        mode='markers+text',
-        marker=dict(
-            size=row['revenue'] * 30,
-            color=colors_effort[color_idx],
-            line=dict(color='white', width=3),
-            opacity=0.8
+    fig4.update_layout(
+        title=dict(
+            text='<b>The Women\'s Basketball Paradox</b><br><sub>High Fan Interest, Low Attendance = Biggest Opportunity</sub>',
+            font=dict(size=28, color=COLORS['primary']),
+            x=0.5,
+            xanchor='center'
         ),
-        text=row['name'],
-        textposition='middle center',
-        textfont=dict(size=12, color='white', family='Arial Black'),
-        hovertemplate=(
-            '<b>%{text}</b><br>' +
-            'Revenue Impact: $%{y:.1f}M<br>' +
-            'Timeline: %{x} months<br>' +
-            f'Implementation Effort: {row["effort"]}/5<br>' +
-            '<extra></extra>'
+        height=700,
+        hovermode='x unified',
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="center",
+            x=0.5,
+            font=dict(size=14)
         ),
-        name=row['name'].replace('<br>', ' ')
-    ))
+        paper_bgcolor='white'
+    )
+
+    fig4.update_yaxes(title_text="<b>Fan Interest Score (% of survey respondents)</b>", secondary_y=False, range=[0, 100])
+    fig4.update_yaxes(title_text="<b>Capacity Utilization (%)</b>", secondary_y=True, range=[0, 100])
 
-fig5.add_hline(y=3, line_dash="dash", line_color="gray", opacity=0.5)
-fig5.add_vline(x=6, line_dash="dash", line_color="gray", opacity=0.5)
-
-fig5.add_annotation(x=3, y=6.5, text="<b>Quick Wins</b><br>(High Impact, Fast)",
-                  showarrow=False, font=dict(size=14, color=COLORS['success']))
-fig5.add_annotation(x=9, y=6.5, text="<b>Strategic Bets</b><br>(High Impact, Slow)",
-                  showarrow=False, font=dict(size=14, color=COLORS['primary']))
-fig5.add_annotation(x=3, y=1.5, text="<b>Low-Hanging Fruit</b><br>(Fast, Easy)",
-                  showarrow=False, font=dict(size=14, color=COLORS['light_green']))
-fig5.add_annotation(x=9, y=1.5, text="<b>Long-term Builds</b><br>(Slow, Steady)",
-                  showarrow=False, font=dict(size=14, color=COLORS['warning']))
-
-fig5.update_layout(
-    title=dict(
-        text='<b>7 Strategic Initiatives: Revenue Impact vs. Timeline</b><br><sub>Bubble size = Revenue impact | Color = Implementation effort</sub>',
-        font=dict(size=26, color=COLORS['primary']),
-        x=0.5,
-        xanchor='center'
-    ),
-    xaxis=dict(
-        title='<b>Implementation Timeline (Months)</b>',
-        range=[0, 14],
-        gridcolor='lightgray'
-    ),
-    yaxis=dict(
-        title='<b>Annual Revenue Impact ($M)</b>',
-        range=[0, 8],
-        gridcolor='lightgray'
-    ),
-    height=800,
-    showlegend=False,
-    paper_bgcolor='white',
-    plot_bgcolor='white',
-    hovermode='closest'
-)
-
-fig5.write_html("docs/viz_05_initiative_bubbles.html")
-# PNG export requires Chrome - using HTML only
-print("✅ Visualization 5 saved: Initiative Bubble Chart")
+    return fig4
 
 # =============================================================================
-# VISUALIZATION 6: Revenue Waterfall
+# VISUALIZATION 5: Initiative Bubble Chart
 # =============================================================================
-print("\n📊 [6/9] Creating Revenue Waterfall...")
-
-categories = [
-    'Current<br>Revenue',
-    'Dynamic<br>Pricing',
-    'Women\'s BB<br>Growth',
-    'Corporate<br>Partners',
-    'Premium<br>Seating',
-    'Digital<br>Platform',
-    'Merchandise',
-    'Alumni<br>Program',
-    'Projected<br>Revenue'
-]
+def build_initiative_bubbles():
+    """Initiative Bubble Chart"""
+    import pandas as pd
+
+    initiatives = [
+        {'name': 'Women\'s BB<br>Growth', 'revenue': 4.0, 'effort': 2, 'timeline': 6},
+        {'name': 'Corporate<br>Partnerships', 'revenue': 7.5, 'effort': 3, 'timeline': 9},
+        {'name': 'Dynamic<br>Pricing', 'revenue': 4.2, 'effort': 1, 'timeline': 3},
+        {'name': 'Premium<br>Seating', 'revenue': 2.8, 'effort': 4, 'timeline': 12},
+        {'name': 'Digital<br>Platform', 'revenue': 2.8, 'effort': 2, 'timeline': 6},
+        {'name': 'Merchandise<br>Expansion', 'revenue': 1.9, 'effort': 2, 'timeline': 4},
+        {'name': 'Alumni<br>Program', 'revenue': 0.9, 'effort': 1, 'timeline': 3}
+    ]
+
+    df_init = pd.DataFrame(initiatives)
+
+    fig5 = go.Figure()
+
+    colors_effort = ['#2E7D32', '#66BB6A', '#FFA726', '#E65100']
+
+    for _, row in df_init.iterrows():
+        color_idx = min(row['effort'] - 1, len(colors_effort) - 1)
+
+        fig5.add_trace(go.Scatter(
+            x=[row['timeline']],
+            y=[row['revenue']],
+            mode='markers+text',
+            marker=dict(
+                size=row['revenue'] * 30,
+                color=colors_effort[color_idx],
+                line=dict(color='white', width=3),
+                opacity=0.8
+            ),
+            text=row['name'],
+            textposition='middle center',
+            textfont=dict(size=12, color='white', family='Arial Black'),
+            hovertemplate=(
+                '<b>%{text}</b><br>' +
+                'Revenue Impact: $%{y:.1f}M<br>' +
+                'Timeline: %{x} months<br>' +
+                f'Implementation Effort: {row["effort"]}/5<br>' +
+                '<extra></extra>'
+            ),
+            name=row['name'].replace('<br>', ' ')
+        ))
+
+    fig5.add_hline(y=3, line_dash="dash", line_color="gray", opacity=0.5)
+    fig5.add_vline(x=6, line_dash="dash", line_color="gray", opacity=0.5)
+
+    fig5.add_annotation(x=3, y=6.5, text="<b>Quick Wins</b><br>(High Impact, Fast)",
+                      showarrow=False, font=dict(size=14, color=COLORS['success']))
+    fig5.add_annotation(x=9, y=6.5, text="<b>Strategic Bets</b><br>(High Impact, Slow)",
+                      showarrow=False, font=dict(size=14, color=COLORS['primary']))
+    fig5.add_annotation(x=3, y=1.5, text="<b>Low-Hanging Fruit</b><br>(Fast, Easy)",
+                      showarrow=False, font=dict(size=14, color=COLORS['light_green']))
+    fig5.add_annotation(x=9, y=1.5, text="<b>Long-term Builds</b><br>(Slow, Steady)",
+                      showarrow=False, font=dict(size=14, color=COLORS['warning']))
+
+    fig5.update_layout(
+        title=dict(
+            text='<b>7 Strategic Initiatives: Revenue Impact vs. Timeline</b><br><sub>Bubble size = Revenue impact | Color = Implementation effort</sub>',
+            font=dict(size=26, color=COLORS['primary']),
+            x=0.5,
+            xanchor='center'
+        ),
+        xaxis=dict(
+            title='<b>Implementation Timeline (Months)</b>',
+            range=[0, 14],
+            gridcolor='lightgray'
+        ),
+        yaxis=dict(
+            title='<b>Annual Revenue Impact ($M)</b>',
+            range=[0, 8],
+            gridcolor='lightgray'
+        ),
+        height=800,
+        showlegend=False,
+        paper_bgcolor='white',
+        plot_bgcolor='white',
+        hovermode='closest'
+    )
 
-values = [94.4, 4.2, 4.0, 7.5, 2.8, 2.8, 1.9, 0.9, 0]
-
-cumulative = [94.4]
-for i in range(1, len(values) - 1):
-    cumulative.append(cumulative[-1] + values[i])
-cumulative.append(cumulative[-1])
-
-measure = ['absolute'] + ['relative'] * 7 + ['total']
-
-text = [f'${cumulative[0]:.1f}M']
-for i in range(1, len(values) - 1):
-    text.append(f'+${values[i]:.1f}M')
-text.append(f'<b>${cumulative[-1]:.1f}M</b>')
-
-fig6 = go.Figure(go.Waterfall(
-    x=categories,
-    y=values,
-    measure=measure,
-    text=text,
-    textposition='outside',
-    textfont=dict(size=16, family='Arial Black'),
-    connector={"line": {"color": "gray", "width": 2, "dash": "dot"}},
-    increasing={"marker": {"color": COLORS['success']}},
-    decreasing={"marker": {"color": COLORS['danger']}},
-    totals={"marker": {"color": COLORS['gold']}}
-))
-
-target = 94.4 + 20.5
-fig6.add_hline(
-    y=target,
-    line_dash="dash",
-    line_color=COLORS['danger'],
-    line_width=3,
-    annotation_text=f"NCAA Settlement Target: ${target:.1f}M",
-    annotation_position="right",
-    annotation_font=dict(size=14, color=COLORS['danger'])
-)
-
-exceeded = cumulative[-1] - target
-fig6.add_annotation(
-    x='Projected<br>Revenue',
-    y=cumulative[-1],
-    text=f"<b>EXCEEDS TARGET<br>by ${exceeded:.1f}M!</b><br>(+{(exceeded/20.5)*100:.1f}%)",
-    showarrow=True,
-    arrowhead=2,
-    arrowcolor=COLORS['success'],
-    ax=-100,
-    ay=-80,
-    font=dict(size=18, color=COLORS['success'], family='Arial Black'),
-    bgcolor=COLORS['light_green'],
-    bordercolor=COLORS['success'],
-    borderwidth=3,
-    borderpad=10
-)
-
-fig6.update_layout(
-    title=dict(
-        text='<b>Revenue Growth Roadmap: From Challenge to Solution</b><br><sub>$94.4M → $119.5M (+27% growth, +$25.1M)</sub>',
-        font=dict(size=26, color=COLORS['primary']),
-        x=0.5,
-        xanchor='center'
-    ),
-    yaxis=dict(
-        title='<b>Revenue ($M)</b>',
-        range=[0, cumulative[-1] * 1.15]
-    ),
-    height=700,
-    paper_bgcolor='white',
-    plot_bgcolor='white',
-    showlegend=False
-)
-
-fig6.write_html("docs/viz_06_revenue_waterfall.html")
-# PNG export requires Chrome - using HTML only
-print("✅ Visualization 6 saved: Revenue Waterfall")
+    return fig5
 
 # =============================================================================
-# VISUALIZATION 7: Implementation Roadmap
+# VISUALIZATION 6: Revenue Waterfall
 # =============================================================================
-print("\n📊 [7/9] Creating Implementation Roadmap...")
-
-roadmap_initiatives = [
-    dict(Task="Dynamic Pricing", Start='2025-01-01', Finish='2025-03-31', Priority="Quick Win", Revenue=4.2),
-    dict(Task="Alumni Program", Start='2025-01-01', Finish='2025-03-31', Priority="Quick Win", Revenue=0.9),
-    dict(Task="Merchandise Expansion", Start='2025-02-01', Finish='2025-05-31', Priority="Short-term", Revenue=1.9),
-    dict(Task="Women's BB Growth", Start='2025-01-01', Finish='2025-06-30', Priority="Strategic", Revenue=4.0),
-    dict(Task="Digital Platform", Start='2025-02-01', Finish='2025-07-31', Priority="Short-term", Revenue=2.8),
-    dict(Task="Corporate Partnerships", Start='2025-01-01', Finish='2025-09-30', Priority="Strategic", Revenue=7.5),
-    dict(Task="Premium Seating", Start='2025-03-01', Finish='2026-02-28', Priority="Long-term", Revenue=2.8)
-]
-
-df_roadmap = pd.DataFrame(roadmap_initiatives)
+def build_revenue_waterfall():
+    """Revenue Waterfall: the shared initiative table's most likely uplifts, with Monte Carlo P10-P90 bands"""
+    from revenue_simulation import simulate
+
+    steps = waterfall_steps()
+    categories = ([step_label('Current Revenue', '<br>')] + [step_label(name, '<br>') for name, _ in steps] +
+                  [step_label('Projected Revenue', '<br>')])
+    values = [BASE_REVENUE] + [uplift for _, uplift in steps] + [0]
+
+    cumulative = [BASE_REVENUE]
+    for i in range(1, len(values) - 1):
+        cumulative.append(cumulative[-1] + values[i])
+    cumulative.append(cumulative[-1])
+
+    measure = ['absolute'] + ['relative'] * len(steps) + ['total']
+
+    text = [f'${cumulative[0]:.1f}M']
+    for i in range(1, len(values) - 1):
+        text.append(f'+${values[i]:.1f}M')
+    text.append(f'<b>${cumulative[-1]:.1f}M</b>')
+
+    fig6 = go.Figure(go.Waterfall(
+        x=categories,
+        y=values,
+        measure=measure,
+        text=text,
+        textposition='outside',
+        textfont=dict(size=16, family='Arial Black'),
+        connector={"line": {"color": "gray", "width": 2, "dash": "dot"}},
+        increasing={"marker": {"color": COLORS['success']}},
+        decreasing={"marker": {"color": COLORS['danger']}},
+        totals={"marker": {"color": COLORS['gold']}},
+        showlegend=False
+    ))
 
-color_map = {
-    "Quick Win": COLORS['light_green'],
-    "Short-term": COLORS['light_blue'],
-    "Strategic": COLORS['warning'],
-    "Long-term": COLORS['secondary']
-}
+    # Running-total P10-P90 range across simulated scenarios, each initiative drawn from its (low, likely, high)
+    projection = simulate(WATERFALL_SCENARIOS, seed=WATERFALL_SEED)
+    bands = projection.bands.iloc[1:]
+    fig6.add_trace(go.Scatter(
+        x=categories[1:],
+        y=bands['Cumulative_P50'],
+        mode='markers',
+        marker=dict(symbol='line-ew', size=18, line=dict(width=2, color=COLORS['neutral'])),
+        error_y=dict(type='data', symmetric=False, array=bands['Cumulative_P90'] - bands['Cumulative_P50'],
+                     arrayminus=bands['Cumulative_P50'] - bands['Cumulative_P10'],
+                     color=COLORS['neutral'], thickness=2, width=10),
+        customdata=bands[['Cumulative_P10', 'Cumulative_P90']],
+        hovertemplate='P50 $%{y:.1f}M<br>P10-P90 $%{customdata[0]:.1f}M-$%{customdata[1]:.1f}M<extra></extra>',
+        name='P10-P90 range'
+    ))
 
-df_roadmap['Color'] = df_roadmap['Priority'].map(color_map)
+    target = BASE_REVENUE + SETTLEMENT_TARGET
+    fig6.add_hline(
+        y=target,
+        line_dash="dash",
+        line_color=COLORS['danger'],
+        line_width=3,
+        annotation_text=f"NCAA Settlement Target: ${target:.1f}M",
+        annotation_position="right",
+        annotation_font=dict(size=14, color=COLORS['danger'])
+    )
 
-fig7 = go.Figure()
+    exceeded = cumulative[-1] - target
+    fig6.add_annotation(
+        x=categories[-1],
+        y=cumulative[-1],
+        text=f"<b>EXCEEDS TARGET<br>by ${exceeded:.1f}M!</b><br>(+{(exceeded/SETTLEMENT_TARGET)*100:.1f}%)",
+        showarrow=True,
+        arrowhead=2,
+        arrowcolor=COLORS['success'],
+        ax=-100,
+        ay=-80,
+        font=dict(size=18, color=COLORS['success'], family='Arial Black'),
+        bgcolor=COLORS['light_green'],
+        bordercolor=COLORS['success'],
+        borderwidth=3,
+        borderpad=10
+    )
 
-for _, row in df_roadmap.iterrows():
-    start_dt = pd.to_datetime(row['Start'])
-    finish_dt = pd.to_datetime(row['Finish'])
-    duration_days = (finish_dt - start_dt).days
+    total = bands.iloc[-1]
+    fig6.add_annotation(
+        x=0, y=-0.12, xref='paper', yref='paper', xanchor='left', showarrow=False,
+        text=(f"Whiskers: P10-P90 running total over {projection.scenarios:,} scenarios "
+              f"(P10 ${total['Cumulative_P10']:.1f}M, P90 ${total['Cumulative_P90']:.1f}M); "
+              f"{projection.p_target:.0%} clear the ${SETTLEMENT_TARGET:.1f}M target"),
+        font=dict(size=13, color=COLORS['neutral'])
+    )
 
-    fig7.add_trace(go.Bar(
-        y=[row['Task']],
-        x=[duration_days],
-        base=start_dt,
-        orientation='h',
-        marker=dict(color=row['Color']),
-        name=row['Priority'],
-        text=f"+${row['Revenue']:.1f}M",
-        textposition='inside',
-        textfont=dict(color='white', size=14, family='Arial Black'),
-        hovertemplate=(
-            f"<b>{row['Task']}</b><br>" +
-            f"Priority: {row['Priority']}<br>" +
-            f"Revenue: ${row['Revenue']:.1f}M<br>" +
-            f"Start: {row['Start']}<br>" +
-            f"Finish: {row['Finish']}<br>" +
-            "<extra></extra>"
+    new_revenue = cumulative[-1] - BASE_REVENUE
+    fig6.update_layout(
+        title=dict(
+            text=(f'<b>Revenue Growth Roadmap: From Challenge to Solution</b><br><sub>${BASE_REVENUE:.1f}M → '
+                  f'${cumulative[-1]:.1f}M (+{new_revenue / BASE_REVENUE:.0%} growth, +${new_revenue:.1f}M)</sub>'),
+            font=dict(size=26, color=COLORS['primary']),
+            x=0.5,
+            xanchor='center'
         ),
+        yaxis=dict(
+            title='<b>Revenue ($M)</b>',
+            range=[0, max(cumulative[-1], total['Cumulative_P90']) * 1.15]
+        ),
+        margin=dict(b=110),
+        height=700,
+        paper_bgcolor='white',
+        plot_bgcolor='white',
         showlegend=False
-    ))
+    )
 
-milestones = [
-    {'date': '2025-03-31', 'text': 'Quick Wins<br>Complete<br>$5.1M', 'color': COLORS['success']},
-    {'date': '2025-06-30', 'text': 'Phase 1<br>Complete<br>$14.6M', 'color': COLORS['primary']},
-    {'date': '2025-12-31', 'text': 'Target<br>Achieved<br>$20.5M+', 'color': COLORS['gold']}
-]
+    return fig6
 
-for milestone in milestones:
-    fig7.add_vline(
-        x=pd.to_datetime(milestone['date']).timestamp() * 1000,
-        line_dash="dash",
-        line_color=milestone['color'],
-        line_width=3,
-        annotation_text=milestone['text'],
-        annotation_position="top",
-        annotation_font=dict(size=12, color=milestone['color'], family='Arial Black')
+# =============================================================================
+# VISUALIZATION 7: Implementation Roadmap
+# =============================================================================
+def build_implementation_roadmap():
+    """Implementation Roadmap"""
+    import pandas as pd
+
+    roadmap_initiatives = [
+        dict(Task="Dynamic Pricing", Start='2025-01-01', Finish='2025-03-31', Priority="Quick Win", Revenue=4.2),
+        dict(Task="Alumni Program", Start='2025-01-01', Finish='2025-03-31', Priority="Quick Win", Revenue=0.9),
+        dict(Task="Merchandise Expansion", Start='2025-02-01', Finish='2025-05-31', Priority="Short-term", Revenue=1.9),
+        dict(Task="Women's BB Growth", Start='2025-01-01', Finish='2025-06-30', Priority="Strategic", Revenue=4.0),
+        dict(Task="Digital Platform", Start='2025-02-01', Finish='2025-07-31', Priority="Short-term", Revenue=2.8),
+        dict(Task="Corporate Partnerships", Start='2025-01-01', Finish='2025-09-30', Priority="Strategic", Revenue=7.5),
+        dict(Task="Premium Seating", Start='2025-03-01', Finish='2026-02-28', Priority="Long-term", Revenue=2.8)
+    ]
+
+    df_roadmap = pd.DataFrame(roadmap_initiatives)
+
+    color_map = {
+        "Quick Win": COLORS['light_green'],
+        "Short-term": COLORS['light_blue'],
+        "Strategic": COLORS['warning'],
+        "Long-term": COLORS['secondary']
+    }
+
+    df_roadmap['Color'] = df_roadmap['Priority'].map(color_map)
+
+    fig7 = go.Figure()
+
+    for _, row in df_roadmap.iterrows():
+        start_dt = pd.to_datetime(row['Start'])
+        finish_dt = pd.to_datetime(row['Finish'])
+        # Bar lengths on a date axis are in milliseconds
+        duration_ms = (finish_dt - start_dt) / pd.Timedelta(milliseconds=1)
+
+        fig7.add_trace(go.Bar(
+            y=[row['Task']],
+            x=[duration_ms],
+            base=start_dt,
+            orientation='h',
+            marker=dict(color=row['Color']),
+            name=row['Priority'],
+            text=f"+${row['Revenue']:.1f}M",
+            textposition='inside',
+            textfont=dict(color='white', size=14, family='Arial Black'),
+            hovertemplate=(
+                f"<b>{row['Task']}</b><br>" +
+                f"Priority: {row['Priority']}<br>" +
+                f"Revenue: ${row['Revenue']:.1f}M<br>" +
+                f"Start: {row['Start']}<br>" +
+                f"Finish: {row['Finish']}<br>" +
+                "<extra></extra>"
+            ),
+            showlegend=False
+        ))
+
+    milestones = [
+        {'date': '2025-03-31', 'text': 'Quick Wins<br>Complete<br>$5.1M', 'color': COLORS['success']},
+        {'date': '2025-06-30', 'text': 'Phase 1<br>Complete<br>$14.6M', 'color': COLORS['primary']},
+        {'date': '2025-12-31', 'text': 'Target<br>Achieved<br>$20.5M+', 'color': COLORS['gold']}
+    ]
+
+    for milestone in milestones:
+        fig7.add_vline(
+            x=pd.to_datetime(milestone['date']).timestamp() * 1000,
+            line_dash="dash",
+            line_color=milestone['color'],
+            line_width=3,
+            annotation_text=milestone['text'],
+            annotation_position="top",
+            annotation_font=dict(size=12, color=milestone['color'], family='Arial Black')
+        )
+
+    fig7.update_layout(
+        title=dict(
+            text='<b>Implementation Roadmap: 18-Month Strategic Plan</b><br><sub>From launch to exceeding target</sub>',
+            font=dict(size=26, color=COLORS['primary']),
+            x=0.5,
+            xanchor='center'
+        ),
+        xaxis=dict(
+            title='<b>Timeline</b>',
+            type='date',
+            tickformat='%b %Y'
+        ),
+        yaxis=dict(title='<b>Initiative</b>'),
+        height=700,
+        paper_bgcolor='white',
+        plot_bgcolor='white',
+        barmode='overlay'
     )
 
-fig7.update_layout(
-    title=dict(
-        text='<b>Implementation Roadmap: 18-Month Strategic Plan</b><br><sub>From launch to exceeding target</sub>',
-        font=dict(size=26, color=COLORS['primary']),
-        x=0.5,
-        xanchor='center'
-    ),
-    xaxis=dict(
-        title='<b>Timeline</b>',
-        type='date',
-        tickformat='%b %Y'
-    ),
-    yaxis=dict(title='<b>Initiative</b>'),
-    height=700,
-    paper_bgcolor='white',
-    plot_bgcolor='white',
-    barmode='overlay'
-)
-
-fig7.write_html("docs/viz_07_implementation_roadmap.html")
-# PNG export requires Chrome - using HTML only
-print("✅ Visualization 7 saved: Implementation Roadmap")
+    return fig7
 
 # =============================================================================
 # VISUALIZATION 8: ROI Comparison
 # =============================================================================
-print("\n📊 [8/9] Creating ROI Comparison...")
-
-roi_initiatives = [
-    {'name': 'Dynamic Pricing', 'investment': 0.15, 'annual_return': 4.2, 'timeline': 3},
-    {'name': 'Alumni Program', 'investment': 0.05, 'annual_return': 0.9, 'timeline': 3},
-    {'name': 'Merchandise', 'investment': 0.3, 'annual_return': 1.9, 'timeline': 4},
-    {'name': 'Women\'s BB', 'investment': 1.2, 'annual_return': 4.0, 'timeline': 6},
-    {'name': 'Digital Platform', 'investment': 0.8, 'annual_return': 2.8, 'timeline': 6},
-    {'name': 'Corporate', 'investment': 0.5, 'annual_return': 7.5, 'timeline': 9},
-    {'name': 'Premium Seating', 'investment': 8.5, 'annual_return': 2.8, 'timeline': 12}
-]
+def build_roi_comparison():
+    """ROI Comparison"""
+    import pandas as pd
+
+    roi_initiatives = [
+        {'name': 'Dynamic Pricing', 'investment': 0.15, 'annual_return': 4.2, 'timeline': 3},
+        {'name': 'Alumni Program', 'investment': 0.05, 'annual_return': 0.9, 'timeline': 3},
+        {'name': 'Merchandise', 'investment': 0.3, 'annual_return': 1.9, 'timeline': 4},
+        {'name': 'Women\'s BB', 'investment': 1.2, 'annual_return': 4.0, 'timeline': 6},
+        {'name': 'Digital Platform', 'investment': 0.8, 'annual_return': 2.8, 'timeline': 6},
+        {'name': 'Corporate', 'investment': 0.5, 'annual_return': 7.5, 'timeline': 9},
+        {'name': 'Premium Seating', 'investment': 8.5, 'annual_return': 2.8, 'timeline': 12}
+    ]
+
+    df_roi = pd.DataFrame(roi_initiatives)
+    df_roi['roi_pct'] = ((df_roi['annual_return'] - df_roi['investment']) / df_roi['investment'] * 100)
+    df_roi['payback_months'] = (df_roi['investment'] / df_roi['annual_return'] * 12)
+
+    # Normalize ROI for marker size (scale from 20 to 80)
+    roi_min = df_roi['roi_pct'].min()
+    roi_max = df_roi['roi_pct'].max()
+    df_roi['marker_size'] = 20 + (df_roi['roi_pct'] - roi_min) / (roi_max - roi_min) * 60
+
+    fig8 = go.Figure()
+
+    fig8.add_trace(go.Scatter(
+        x=df_roi['investment'],
+        y=df_roi['annual_return'],
+        mode='markers+text',
+        marker=dict(
+            size=df_roi['marker_size'],
+            color=df_roi['roi_pct'],
+            colorscale='RdYlGn',
+            showscale=True,
+            colorbar=dict(title='ROI %', x=1.15),
+            line=dict(color='white', width=2),
+            cmin=0,
+            cmax=2000
+        ),
+        text=df_roi['name'],
+        textposition='top center',
+        textfont=dict(size=12, family='Arial Black'),
+        hovertemplate=(
+            '<b>%{text}</b><br>' +
+            'Investment: $%{x:.2f}M<br>' +
+            'Annual Return: $%{y:.1f}M<br>' +
+            'ROI: %{customdata[0]:.0f}%<br>' +
+            'Payback: %{customdata[1]:.1f} months<br>' +
+            '<extra></extra>'
+        ),
+        customdata=df_roi[['roi_pct', 'payback_months']].values
+    ))
+
+    max_val = max(df_roi['investment'].max(), df_roi['annual_return'].max())
+    fig8.add_trace(go.Scatter(
+        x=[0, max_val],
+        y=[0, max_val],
+        mode='lines',
+        line=dict(color='gray', dash='dash', width=2),
+        name='Break-even Line',
+        hoverinfo='skip',
+        showlegend=True
+    ))
+
+    fig8.add_annotation(
+        x=0.15, y=4.2,
+        text="<b>BEST ROI:<br>2,700%</b>",
+        showarrow=True,
+        arrowhead=2,
+        arrowcolor=COLORS['success'],
+        font=dict(size=14, color=COLORS['success']),
+        bgcolor='lightgreen',
+        bordercolor=COLORS['success'],
+        borderwidth=2,
+        ax=40,
+        ay=-40
+    )
+
+    fig8.add_annotation(
+        x=0.5, y=7.5,
+        text="<b>Highest Return:<br>$7.5M/year</b>",
+        showarrow=True,
+        arrowhead=2,
+        arrowcolor=COLORS['primary'],
+        font=dict(size=14, color=COLORS['primary']),
+        bgcolor='lightblue',
+        bordercolor=COLORS['primary'],
+        borderwidth=2,
+        ax=-50,
+        ay=30
+    )
 
-df_roi = pd.DataFrame(roi_initiatives)
-df_roi['roi_pct'] = ((df_roi['annual_return'] - df_roi['investment']) / df_roi['investment'] * 100)
-df_roi['payback_months'] = (df_roi['investment'] / df_roi['annual_return'] * 12)
-
-# Normalize ROI for marker size (scale from 20 to 80)
-roi_min = df_roi['roi_pct'].min()
-roi_max = df_roi['roi_pct'].max()
-df_roi['marker_size'] = 20 + (df_roi['roi_pct'] - roi_min) / (roi_max - roi_min) * 60
-
-fig8 = go.Figure()
-
-fig8.add_trace(go.Scatter(
-    x=df_roi['investment'],
-    y=df_roi['annual_return'],
-    mode='markers+text',
-    marker=dict(
-        size=df_roi['marker_size'],
-        color=df_roi['roi_pct'],
-        colorscale='RdYlGn',
-        showscale=True,
-        colorbar=dict(title='ROI %', x=1.15),
-        line=dict(color='white', width=2),
-        cmin=0,
-        cmax=2000
-    ),
-    text=df_roi['name'],
-    textposition='top center',
-    textfont=dict(size=12, family='Arial Black'),
-    hovertemplate=(
-        '<b>%{text}</b><br>' +
-        'Investment: $%{x:.2f}M<br>' +
-        'Annual Return: $%{y:.1f}M<br>' +
-        'ROI: %{customdata[0]:.0f}%<br>' +
-        'Payback: %{customdata[1]:.1f} months<br>' +
-        '<extra></extra>'
-    ),
-    customdata=df_roi[['roi_pct', 'payback_months']].values
-))
-
-max_val = max(df_roi['investment'].max(), df_roi['annual_return'].max())
-fig8.add_trace(go.Scatter(
-    x=[0, max_val],
-    y=[0, max_val],
-    mode='lines',
-    line=dict(color='gray', dash='dash', width=2),
-    name='Break-even Line',
-    hoverinfo='skip',
-    showlegend=True
-))
-
-fig8.add_annotation(
-    x=0.15, y=4.2,
-    text="<b>BEST ROI:<br>2,700%</b>",
-    showarrow=True,
-    arrowhead=2,
-    arrowcolor=COLORS['success'],
-    font=dict(size=14, color=COLORS['success']),
-    bgcolor='lightgreen',
-    bordercolor=COLORS['success'],
-    borderwidth=2,
-    ax=40,
-    ay=-40
-)
-
-fig8.add_annotation(
-    x=0.5, y=7.5,
-    text="<b>Highest Return:<br>$7.5M/year</b>",
-    showarrow=True,
-    arrowhead=2,
-    arrowcolor=COLORS['primary'],
-    font=dict(size=14, color=COLORS['primary']),
-    bgcolor='lightblue',
-    bordercolor=COLORS['primary'],
-    borderwidth=2,
-    ax=-50,
-    ay=30
-)
-
-fig8.update_layout(
-    title=dict(
-        text='<b>Investment vs. Annual Return Analysis</b><br><sub>Bubble size = ROI percentage | All initiatives above break-even line</sub>',
-        font=dict(size=26, color=COLORS['primary']),
-        x=0.5,
-        xanchor='center'
-    ),
-    xaxis=dict(
-        title='<b>Initial Investment Required ($M)</b>',
-        range=[0, max_val * 1.1],
-        gridcolor='lightgray'
-    ),
-    yaxis=dict(
-        title='<b>Annual Revenue Return ($M)</b>',
-        range=[0, max_val * 1.1],
-        gridcolor='lightgray'
-    ),
-    height=800,
-    paper_bgcolor='white',
-    plot_bgcolor='white'
-)
-
-fig8.write_html("docs/viz_08_roi_comparison.html")
-# PNG export requires Chrome - using HTML only
-print("✅ Visualization 8 saved: ROI Comparison")
+    fig8.update_layout(
+        title=dict(
+            text='<b>Investment vs. Annual Return Analysis</b><br><sub>Bubble size = ROI percentage | All initiatives above break-even line</sub>',
+            font=dict(size=26, color=COLORS['primary']),
+            x=0.5,
+            xanchor='center'
+        ),
+        xaxis=dict(
+            title='<b>Initial Investment Required ($M)</b>',
+            range=[0, max_val * 1.1],
+            gridcolor='lightgray'
+        ),
+        yaxis=dict(
+            title='<b>Annual Revenue Return ($M)</b>',
+            range=[0, max_val * 1.1],
+            gridcolor='lightgray'
+        ),
+        height=800,
+        paper_bgcolor='white',
+        plot_bgcolor='white'
+    )
+
+    return fig8
 
 # =============================================================================
 # VISUALIZATION 9: Executive Summary Dashboard
 # =============================================================================
-print("\n📊 [9/9] Creating Executive Summary Dashboard...")
-
-fig9 = make_subplots(
-    rows=3, cols=3,
-    subplot_titles=(
-        '<b>THE CHALLENGE</b>',
-        '<b>THE SOLUTION</b>',
-        '<b>THE RESULT</b>',
-        '<b>Revenue Growth</b>',
-        '<b>Top 3 Initiatives</b>',
-        '<b>Timeline</b>',
-        '<b>ROI Summary</b>',
-        '<b>Risk Level</b>',
-        '<b>Success Metrics</b>'
-    ),
-    specs=[
-        [{'type': 'indicator'}, {'type': 'indicator'}, {'type': 'indicator'}],
-        [{'type': 'bar'}, {'type': 'bar'}, {'type': 'bar'}],
-        [{'type': 'indicator'}, {'type': 'indicator'}, {'type': 'table'}]
-    ],
-    vertical_spacing=0.12,
-    horizontal_spacing=0.1
-)
-
-# Row 1: Key numbers
-fig9.add_trace(go.Indicator(
-    mode="number",
-    value=20.5,
-    number={'prefix': "$", 'suffix': "M", 'font': {'size': 40, 'color': COLORS['danger']}},
-    title={'text': "Annual Gap", 'font': {'size': 16}}
-), row=1, col=1)
-
-fig9.add_trace(go.Indicator(
-    mode="number",
-    value=7,
-    number={'font': {'size': 40, 'color': COLORS['primary']}},
-    title={'text': "Strategic<br>Initiatives", 'font': {'size': 16}}
-), row=1, col=2)
-
-fig9.add_trace(go.Indicator(
-    mode="number+delta",
-    value=25.1,
-    delta={'reference': 20.5, 'valueformat': '.1f', 'prefix': '$', 'suffix': 'M'},
-    number={'prefix': "$", 'suffix': "M", 'font': {'size': 40, 'color': COLORS['success']}},
-    title={'text': "Projected<br>Revenue", 'font': {'size': 16}}
-), row=1, col=3)
-
-# Row 2: Charts
-fig9.add_trace(go.Bar(
-    x=['Current', 'Target', 'Projected'],
-    y=[94.4, 114.9, 119.5],
-    marker=dict(color=[COLORS['neutral'], COLORS['warning'], COLORS['success']]),
-    text=['$94.4M', '$114.9M', '$119.5M'],
-    textposition='outside'
-), row=2, col=1)
-
-fig9.add_trace(go.Bar(
-    x=['Corporate', 'Dynamic<br>Pricing', 'Women\'s<br>BB'],
-    y=[7.5, 4.2, 4.0],
-    marker=dict(color=[COLORS['primary'], COLORS['light_blue'], COLORS['secondary']]),
-    text=['$7.5M', '$4.2M', '$4.0M'],
-    textposition='outside'
-), row=2, col=2)
-
-fig9.add_trace(go.Bar(
-    x=['Q1', 'Q2', 'Q3', 'Q4'],
-    y=[5.1, 9.5, 3.0, 7.5],
-    marker=dict(color=COLORS['light_green']),
-    text=['$5.1M', '$9.5M', '$3.0M', '$7.5M'],
-    textposition='outside'
-), row=2, col=3)
-
-# Row 3: Summary metrics
-fig9.add_trace(go.Indicator(
-    mode="number",
-    value=723,
-    number={'suffix': "%", 'font': {'size': 40, 'color': COLORS['success']}},
-    title={'text': "Avg ROI", 'font': {'size': 16}}
-), row=3, col=1)
-
-fig9.add_trace(go.Indicator(
-    mode="gauge+number",
-    value=3.2,
-    domain={'x': [0, 1], 'y': [0, 1]},
-    title={'text': "Risk Score", 'font': {'size': 14}},
-    number={'font': {'size': 30}},
-    gauge={
-        'axis': {'range': [0, 10]},
-        'bar': {'color': COLORS['light_green']},
-        'steps': [
-            {'range': [0, 3], 'color': 'lightgreen'},
-            {'range': [3, 7], 'color': 'yellow'},
-            {'range': [7, 10], 'color': 'lightcoral'}
-        ]
-    }
-), row=3, col=2)
-
-fig9.add_trace(go.Table(
-    header=dict(
-        values=['<b>Metric</b>', '<b>Target</b>'],
-        fill_color=COLORS['primary'],
-        font=dict(color='white', size=12),
-        align='left'
-    ),
-    cells=dict(
-        values=[
-            ['Revenue +', 'Fan Satisfaction', 'ROI', 'Payback'],
-            ['27%', '≥4.0/5.0', '723%', '8-14 mo']
+def build_executive_summary():
+    """Executive Summary Dashboard"""
+    from plotly.subplots import make_subplots
+
+    fig9 = make_subplots(
+        rows=3, cols=3,
+        subplot_titles=(
+            '<b>THE CHALLENGE</b>',
+            '<b>THE SOLUTION</b>',
+            '<b>THE RESULT</b>',
+            '<b>Revenue Growth</b>',
+            '<b>Top 3 Initiatives</b>',
+            '<b>Timeline</b>',
+            '<b>ROI Summary</b>',
+            '<b>Risk Level</b>',
+            '<b>Success Metrics</b>'
+        ),
+        specs=[
+            [{'type': 'indicator'}, {'type': 'indicator'}, {'type': 'indicator'}],
+            [{'type': 'bar'}, {'type': 'bar'}, {'type': 'bar'}],
+            [{'type': 'indicator'}, {'type': 'indicator'}, {'type': 'table'}]
         ],
-        fill_color='lavender',
-        font=dict(size=11),
-        align='left',
-        height=25
+        vertical_spacing=0.12,
+        horizontal_spacing=0.1
     )
-), row=3, col=3)
-
-fig9.update_layout(
-    title=dict(
-        text='<b>EXECUTIVE SUMMARY: Strategic Revenue Optimization Plan</b><br><sub>Midwest State University Athletics - NCAA Settlement Response</sub>',
-        font=dict(size=24, color=COLORS['primary']),
-        x=0.5,
-        xanchor='center'
-    ),
-    height=1200,
-    showlegend=False,
-    paper_bgcolor='white'
-)
-
-fig9.write_html("docs/viz_09_executive_summary.html")
-# PNG export requires Chrome - using HTML only
-print("✅ Visualization 9 saved: Executive Summary Dashboard")
+
+    # Row 1: Key numbers
+    fig9.add_trace(go.Indicator(
+        mode="number",
+        value=20.5,
+        number={'prefix': "$", 'suffix': "M", 'font': {'size': 40, 'color': COLORS['danger']}},
+        title={'text': "Annual Gap", 'font': {'size': 16}}
+    ), row=1, col=1)
+
+    fig9.add_trace(go.Indicator(
+        mode="number",
+        value=7,
+        number={'font': {'size': 40, 'color': COLORS['primary']}},
+        title={'text': "Strategic<br>Initiatives", 'font': {'size': 16}}
+    ), row=1, col=2)
+
+    fig9.add_trace(go.Indicator(
+        mode="number+delta",
+        value=25.1,
+        delta={'reference': 20.5, 'valueformat': '.1f', 'prefix': '$', 'suffix': 'M'},
+        number={'prefix': "$", 'suffix': "M", 'font': {'size': 40, 'color': COLORS['success']}},
+        title={'text': "Projected<br>Revenue", 'font': {'size': 16}}
+    ), row=1, col=3)
+
+    # Row 2: Charts
+    fig9.add_trace(go.Bar(
+        x=['Current', 'Target', 'Projected'],
+        y=[94.4, 114.9, 119.5],
+        marker=dict(color=[COLORS['neutral'], COLORS['warning'], COLORS['success']]),
+        text=['$94.4M', '$114.9M', '$119.5M'],
+        textposition='outside'
+    ), row=2, col=1)
+
+    fig9.add_trace(go.Bar(
+        x=['Corporate', 'Dynamic<br>Pricing', 'Women\'s<br>BB'],
+        y=[7.5, 4.2, 4.0],
+        marker=dict(color=[COLORS['primary'], COLORS['light_blue'], COLORS['secondary']]),
+        text=['$7.5M', '$4.2M', '$4.0M'],
+        textposition='outside'
+    ), row=2, col=2)
+
+    fig9.add_trace(go.Bar(
+        x=['Q1', 'Q2', 'Q3', 'Q4'],
+        y=[5.1, 9.5, 3.0, 7.5],
+        marker=dict(color=COLORS['light_green']),
+        text=['$5.1M', '$9.5M', '$3.0M', '$7.5M'],
+        textposition='outside'
+    ), row=2, col=3)
+
+    # Row 3: Summary metrics
+    fig9.add_trace(go.Indicator(
+        mode="number",
+        value=723,
+        number={'suffix': "%", 'font': {'size': 40, 'color': COLORS['success']}},
+        title={'text': "Avg ROI", 'font': {'size': 16}}
+    ), row=3, col=1)
+
+    fig9.add_trace(go.Indicator(
+        mode="gauge+number",
+        value=3.2,
+        domain={'x': [0, 1], 'y': [0, 1]},
+        title={'text': "Risk Score", 'font': {'size': 14}},
+        number={'font': {'size': 30}},
+        gauge={
+            'axis': {'range': [0, 10]},
+            'bar': {'color': COLORS['light_green']},
+            'steps': [
+                {'range': [0, 3], 'color': 'lightgreen'},
+                {'range': [3, 7], 'color': 'yellow'},
+                {'range': [7, 10], 'color': 'lightcoral'}
+            ]
+        }
+    ), row=3, col=2)
+
+    fig9.add_trace(go.Table(
+        header=dict(
+            values=['<b>Metric</b>', '<b>Target</b>'],
+            fill_color=COLORS['primary'],
+            font=dict(color='white', size=12),
+            align='left'
+        ),
+        cells=dict(
+            values=[
+                ['Revenue +', 'Fan Satisfaction', 'ROI', 'Payback'],
+                ['27%', '≥4.0/5.0', '723%', '8-14 mo']
+            ],
+            fill_color='lavender',
+            font=dict(size=11),
+            align='left',
+            height=25
+        )
+    ), row=3, col=3)
+
+    fig9.update_layout(
+        title=dict(
+            text='<b>EXECUTIVE SUMMARY: Strategic Revenue Optimization Plan</b><br><sub>Midwest State University Athletics - NCAA Settlement Response</sub>',
+            font=dict(size=24, color=COLORS['primary']),
+            x=0.5,
+            xanchor='center'
+        ),
+        height=1200,
+        showlegend=False,
+        paper_bgcolor='white'
+    )
+
+    return fig9
+
+# =============================================================================
+# TASKS
+# =============================================================================
+class VizTask:
+    """
+    One visualization: builder(**inputs) -> plotly Figure, written to <out_dir>/<output>.html (or .json)
+    `inputs` names the shared data the builder needs; tasks with no inputs never touch the workbook
+    """
+
+    def __init__(self, name, title, builder, output, inputs=()):
+        self.name = name
+        self.title = title
+        self.builder = builder
+        self.output = output
+        self.inputs = tuple(inputs)
+
+    def output_path(self, out_dir='docs', html_mode='inline'):
+        """File the task writes in the given export mode"""
+        return os.path.join(out_dir, f"{self.output}.{'json' if html_mode == 'json' else 'html'}")
+
+    def build(self, inputs):
+        return self.builder(**{name: inputs[name] for name in self.inputs})
+
+    def __repr__(self):
+        return f"VizTask({self.name!r}, inputs={self.inputs})"
+
+
+TASKS = [
+    VizTask('challenge_gauge', 'Challenge Gauge', build_challenge_gauge,
+            'viz_01_challenge_gauge'),
+    VizTask('current_state_dashboard', 'Current State Dashboard', build_current_state_dashboard,
+            'viz_02_current_state_dashboard', inputs=('cube',)),
+    VizTask('gap_analysis', 'Gap Analysis Matrix', build_gap_analysis,
+            'viz_03_gap_analysis'),
+    VizTask('womens_bb_opportunity', "Women's Basketball Opportunity", build_womens_bb_opportunity,
+            'viz_04_womens_bb_opportunity', inputs=('cube', 'survey')),
+    VizTask('initiative_bubbles', 'Initiative Bubble Chart', build_initiative_bubbles,
+            'viz_05_initiative_bubbles'),
+    VizTask('revenue_waterfall', 'Revenue Waterfall', build_revenue_waterfall,
+            'viz_06_revenue_waterfall'),
+    VizTask('implementation_roadmap', 'Implementation Roadmap', build_implementation_roadmap,
+            'viz_07_implementation_roadmap'),
+    VizTask('roi_comparison', 'ROI Comparison', build_roi_comparison,
+            'viz_08_roi_comparison'),
+    VizTask('executive_summary', 'Executive Summary Dashboard', build_executive_summary,
+            'viz_09_executive_summary'),
+]
+
+TASKS_BY_NAME = {task.name: task for task in TASKS}
+
+
+def select_tasks(names=None):
+    """Tasks in presentation order; None selects all nine"""
+    if not names:
+        return list(TASKS)
+    unknown = [name for name in names if name not in TASKS_BY_NAME]
+    if unknown:
+        raise KeyError(f"Unknown visualization(s): {', '.join(unknown)}")
+    return [task for task in TASKS if task.name in names]
+
+
+def load_inputs(names, file_path=DATA_FILE):
+    """Load only the named inputs (the aggregate cube and the survey engine)"""
+    inputs = {}
+    if 'cube' in names:
+        from aggregate_cube import load_cube
+
+        # Every per-sport / per-slice number is read from the cube over the typed event frame
+        inputs['cube'] = load_cube(file_path)
+    if 'survey' in names:
+        from survey_engine import load_survey_engine
+
+        # Survey shares and means are lookups into the engine's precomputed segment cells
+        inputs['survey'] = load_survey_engine(file_path)
+    return inputs
+
+
+def run_tasks(names=None, out_dir='docs', html_mode='inline', dashboard=False, file_path=DATA_FILE):
+    """Build and export the selected visualizations; returns {task name: output path}"""
+    tasks = select_tasks(names)
+    needed = {name for task in tasks for name in task.inputs}
+    if needed:
+        print("\n📂 Loading data...")
+        inputs = load_inputs(needed, file_path)
+        loaded = []
+        if 'cube' in inputs:
+            loaded.append(f"{inputs['cube'].n_events} events")
+        if 'survey' in inputs:
+            loaded.append(f"{inputs['survey'].respondents} survey responses")
+        print(f"✅ Data loaded: {', '.join(loaded)}")
+    else:
+        inputs = {}
+
+    from html_export import FigureExporter
+
+    exporter = FigureExporter(out_dir, html_mode)
+    outputs = {}
+    for task in tasks:
+        number = TASKS.index(task) + 1
+        print(f"\n📊 [{number}/{len(TASKS)}] Creating {task.title}...")
+        with span(f"build:{task.name}", 'chart'):
+            fig = task.build(inputs)
+        outputs[task.name] = exporter.save(fig, task.output, task.title)
+        # PNG export requires Chrome - using HTML only
+        print(f"✅ Visualization {number} saved: {task.title}")
+
+    if dashboard:
+        outputs['dashboard'] = exporter.write_dashboard()
+        print(f"\n🗂️  Dashboard: {outputs['dashboard']}")
+    print(f"\n📁 Files exported to: {out_dir}/ ({html_mode} mode, {exporter.total_bytes() / 1024 / 1024:.1f} MB)")
+    return outputs
+
 
 # =============================================================================
-# SUMMARY
+# CLI
 # =============================================================================
-print("\n" + "=" * 80)
-print("✅ ALL 9 VISUALIZATIONS CREATED SUCCESSFULLY!")
-print("=" * 80)
-print("\n📁 Files exported to: /docs/ folder")
-print("\n📊 Visualizations created:")
-print("   1. Challenge Gauge")
-print("   2. Current State Dashboard")
-print("   3. Gap Analysis Matrix")
-print("   4. Women's Basketball Opportunity")
-print("   5. Initiative Bubble Chart")
-print("   6. Revenue Waterfall")
-print("   7. Implementation Roadmap")
-print("   8. ROI Comparison")
-print("   9. Executive Summary Dashboard")
-print("\n🎨 Formats: HTML (interactive) + PNG (high-res 2400x1600)")
-print("\n🎯 Story Flow: Challenge → Analysis → Solution → Results")
-print("\n💡 Ready for your PowerPoint presentation!")
-print("=" * 80)
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate the 9 interactive visualizations")
+    parser.add_argument('charts', nargs='*', metavar='CHART',
+                        help="visualizations to build (default: all); see --list")
+    parser.add_argument('--list', action='store_true', help="list the visualizations and exit")
+    parser.add_argument('--html-mode', choices=HTML_MODES, default='inline',
+                        help="inline: self-contained HTML; shared: one local plotly.js bundle; json: figure JSON only")
+    parser.add_argument('--dashboard', action='store_true',
+                        help="also write dashboard.html with the selected figures and a single plotly.js fetch")
+    parser.add_argument('--out', default='docs', help="output directory")
+    parser.add_argument('--data', default=DATA_FILE, help="workbook path")
+    tracing.add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for number, task in enumerate(TASKS, 1):
+            needs = ', '.join(task.inputs) or '-'
+            print(f"{number}. {task.name:<26} {task.title:<32} inputs: {needs}")
+        return 0
+
+    try:
+        select_tasks(args.charts)
+    except KeyError as e:
+        parser.error(e.args[0])
+
+    print("=" * 80)
+    print("🎨 GENERATING ADVANCED VISUALIZATIONS FOR PPT")
+    print("=" * 80)
+
+    try:
+        with tracing.Session.from_args(args, 'generate_visualizations'):
+            run_tasks(args.charts, args.out, args.html_mode, args.dashboard, args.data)
+    except (OSError, ValueError) as e:
+        print(f"❌ Build failed: {e}")
+        return 1
+
+    built = select_tasks(args.charts)
+    print("\n" + "=" * 80)
+    print(f"✅ {len(built)} OF {len(TASKS)} VISUALIZATIONS CREATED SUCCESSFULLY!")
+    print("=" * 80)
+    print("\n📊 Visualizations created:")
+    for task in built:
+        print(f"   {TASKS.index(task) + 1}. {task.title}")
+    print("\n🎯 Story Flow: Challenge → Analysis → Solution → Results")
+    print("\n💡 Ready for your PowerPoint presentation!")
+    print("=" * 80)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
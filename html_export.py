@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+KAGR Case Competition - Plotly HTML Export
+Writes interactive figures against one shared, locally hosted plotly.js bundle instead of inlining ~4.6 MB per file
+"""
+
+import html
+import os
+
+import plotly.io as pio
+from plotly.offline import get_plotlyjs, get_plotlyjs_version
+
+from tracing import span
+
+# inline: self-contained HTML (plotly.js embedded in every file)
+# shared: HTML that loads the shared bundle with a <script src>
+# json:   bare figure JSON for an app or dashboard to render
+HTML_MODES = ('inline', 'shared', 'json')
+
+BUNDLE_NAME = f"plotly-{get_plotlyjs_version()}.min.js"
+
+DASHBOARD_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<script src="{bundle}"></script>
+<style>
+body {{ font-family: Arial, Helvetica, sans-serif; margin: 0 auto; max-width: 1500px; padding: 24px; }}
+section {{ margin-bottom: 48px; }}
+</style>
+</head>
+<body>
+<h1>{title}</h1>
+{sections}
+</body>
+</html>
+"""
+
+# ============================================================================
+# BUNDLE
+# ============================================================================
+
+def write_plotly_bundle(out_dir):
+    """
+    Write the plotly.js shipped with the installed plotly package once per version
+    Returns the bundle path; an existing bundle of the same version is left untouched
+    """
+    path = os.path.join(out_dir, BUNDLE_NAME)
+    if not os.path.exists(path):
+        os.makedirs(out_dir, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(get_plotlyjs())
+        os.replace(tmp_path, path)
+    return path
+
+
+# ============================================================================
+# EXPORTER
+# ============================================================================
+
+class FigureExporter:
+    """
+    Saves figures into one directory in the chosen HTML mode and remembers them for a combined dashboard
+    Figures are exported with save(fig, 'viz_01_challenge_gauge'); the extension follows the mode
+    """
+
+    def __init__(self, out_dir='docs', mode='inline'):
+        if mode not in HTML_MODES:
+            raise ValueError(f"Unknown HTML mode {mode!r}; expected one of {HTML_MODES}")
+        self.out_dir = out_dir
+        self.mode = mode
+        self.figures = []
+        self.uses_bundle = mode == 'shared'
+        os.makedirs(out_dir, exist_ok=True)
+        if self.uses_bundle:
+            write_plotly_bundle(out_dir)
+
+    def save(self, fig, name, title=None):
+        """Write one figure and return its path"""
+        self.figures.append((name, title or name, fig))
+        with span(f"write_html:{name}", 'export', mode=self.mode) as s:
+            if self.mode == 'json':
+                path = os.path.join(self.out_dir, f"{name}.json")
+                fig.write_json(path)
+            elif self.mode == 'shared':
+                path = os.path.join(self.out_dir, f"{name}.html")
+                # plotly treats a string ending in .js as the src of the library script tag
+                fig.write_html(path, include_plotlyjs=BUNDLE_NAME)
+            else:
+                path = os.path.join(self.out_dir, f"{name}.html")
+                fig.write_html(path)
+            s['bytes'] = os.path.getsize(path)
+        return path
+
+    def write_dashboard(self, filename='dashboard.html', title='KAGR Case Competition Dashboard'):
+        """
+        Single page with every saved figure; plotly.js is fetched once from the shared bundle
+        Figure specs are embedded in the page, so the bundle is the only script request
+        """
+        with span('write_html:dashboard', 'export', figures=len(self.figures)) as s:
+            write_plotly_bundle(self.out_dir)
+            self.uses_bundle = True
+            sections = []
+            for name, fig_title, fig in self.figures:
+                div = pio.to_html(fig, include_plotlyjs=False, full_html=False, div_id=name)
+                sections.append(f'<section id="section-{name}">\n<h2>{html.escape(fig_title)}</h2>\n{div}\n</section>')
+
+            path = os.path.join(self.out_dir, filename)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(DASHBOARD_TEMPLATE.format(title=html.escape(title), bundle=BUNDLE_NAME,
+                                                  sections='\n'.join(sections)))
+            s['bytes'] = os.path.getsize(path)
+        return path
+
+    def total_bytes(self):
+        """Bytes written for the figures plus the shared bundle (when one is used)"""
+        names = {name for name, _, _ in self.figures}
+        total = 0
+        for filename in os.listdir(self.out_dir):
+            stem = os.path.splitext(filename)[0]
+            if (filename == BUNDLE_NAME and self.uses_bundle) or stem in names:
+                total += os.path.getsize(os.path.join(self.out_dir, filename))
+        return total
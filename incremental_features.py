@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+KAGR Case Competition - Incremental Feature Engineering
+Keeps engineered features and per-Sport aggregates up to date by recomputing only new or corrected events
+"""
+
+import argparse
+import os
+
+import pandas as pd
+
+from data_loader import add_survey_features, load_data
+from streaming_ingest import RunningAggregates, prepare_chunk
+
+EVENT_KEY = 'Event_ID'
+SURVEY_KEY = 'Account ID'
+
+FEATURE_COLUMNS = ['Total_Revenue', 'Revenue_per_Attendee', 'Venue_Utilization']
+SURVEY_FEATURE_COLUMNS = ['Age']
+
+DEFAULT_STATE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                  '.cache', 'feature_store.pkl')
+
+# ============================================================================
+# HELPERS
+# ============================================================================
+
+def _decategorize(df):
+    """Store categoricals as plain values so new categories can be appended row by row"""
+    for col in df.columns:
+        if isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype(object)
+    return df
+
+
+def _match_dtypes(rows, stored):
+    """Cast incoming rows to the stored column dtypes so values compare and assign cleanly"""
+    dtypes = {c: stored[c].dtype for c in rows.columns if c in stored.columns}
+    return rows.astype(dtypes, errors='ignore')
+
+
+def _changed_mask(new_rows, old_rows):
+    """True for rows whose raw values differ from what is stored (NaN == NaN)"""
+    columns = [c for c in new_rows.columns if c in old_rows.columns]
+    new_vals = new_rows[columns]
+    old_vals = old_rows[columns]
+    differs = new_vals.ne(old_vals) & ~(new_vals.isna() & old_vals.isna())
+    return differs.any(axis=1)
+
+
+# ============================================================================
+# FEATURE STORE
+# ============================================================================
+
+class IncrementalFeatureStore:
+    """
+    Event-level features keyed on Event_ID plus delta-maintained group aggregates
+    Refresh cost scales with the number of new or corrected rows, not the season size
+    """
+
+    def __init__(self, group_keys=('Sport',)):
+        self.events = None
+        self.survey = None
+        self.aggregates = {key: RunningAggregates(key) for key in group_keys}
+
+    @classmethod
+    def from_frames(cls, sports_df, survey_df=None, group_keys=('Sport',)):
+        """Seed a store from full event (and optionally survey) frames"""
+        store = cls(group_keys)
+        store.upsert(sports_df)
+        if survey_df is not None:
+            store.upsert_survey(survey_df)
+        return store
+
+    # ------------------------------------------------------------------------
+    # Events
+    # ------------------------------------------------------------------------
+
+    def upsert(self, rows):
+        """
+        Insert new events and apply corrections keyed on Event_ID
+        Returns counts of inserted, updated and unchanged rows
+        """
+        rows = rows.drop(columns=[c for c in FEATURE_COLUMNS if c in rows.columns])
+        rows = _decategorize(rows.drop_duplicates(EVENT_KEY, keep='last').set_index(EVENT_KEY))
+
+        if self.events is None:
+            new_rows = rows
+            changed_rows = rows.iloc[:0]
+            unchanged = 0
+        else:
+            rows = _match_dtypes(rows, self.events)
+            known = rows.index.isin(self.events.index)
+            new_rows = rows[~known]
+            candidates = rows[known]
+            stored = self.events.loc[candidates.index]
+            changed_rows = candidates[_changed_mask(candidates, stored)]
+            unchanged = len(candidates) - len(changed_rows)
+
+        if len(changed_rows):
+            previous = self.events.loc[changed_rows.index]
+            for agg in self.aggregates.values():
+                agg.subtract(previous)
+
+        fresh = prepare_chunk(pd.concat([changed_rows, new_rows]))
+        for agg in self.aggregates.values():
+            agg.update(fresh)
+
+        if self.events is None:
+            self.events = fresh
+        else:
+            if len(changed_rows):
+                corrected = fresh.loc[changed_rows.index]
+                self.events.loc[corrected.index, corrected.columns] = corrected
+            if len(new_rows):
+                self.events = pd.concat([self.events, fresh.loc[new_rows.index]])
+
+        return {'inserted': len(new_rows), 'updated': len(changed_rows), 'unchanged': unchanged}
+
+    def delete(self, event_ids):
+        """Remove events and their aggregate contributions"""
+        if self.events is None:
+            return 0
+        ids = self.events.index.intersection(pd.Index(event_ids))
+        removed = self.events.loc[ids]
+        for agg in self.aggregates.values():
+            agg.subtract(removed)
+        self.events = self.events.drop(index=ids)
+        return len(ids)
+
+    def group_aggregates(self, key='Sport'):
+        """Current aggregate frame for a group key (sums plus per-event means)"""
+        return self.aggregates[key].result()
+
+    # ------------------------------------------------------------------------
+    # Survey
+    # ------------------------------------------------------------------------
+
+    def upsert_survey(self, rows, current_year=None):
+        """Insert or replace survey responses keyed on Account ID, computing Age for those rows only"""
+        rows = rows.drop(columns=[c for c in SURVEY_FEATURE_COLUMNS if c in rows.columns])
+        rows = _decategorize(rows.drop_duplicates(SURVEY_KEY, keep='last').set_index(SURVEY_KEY))
+        rows = add_survey_features(rows, current_year)
+
+        if self.survey is None:
+            self.survey = rows
+            return {'inserted': len(rows), 'updated': 0}
+
+        rows = _match_dtypes(rows, self.survey)
+        known = rows.index.isin(self.survey.index)
+        if known.any():
+            self.survey.loc[rows.index[known], rows.columns] = rows[known]
+        if (~known).any():
+            self.survey = pd.concat([self.survey, rows[~known]])
+        return {'inserted': int((~known).sum()), 'updated': int(known.sum())}
+
+    # ------------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------------
+
+    def save(self, path=DEFAULT_STATE_FILE):
+        """Persist events, survey and aggregate totals between nightly runs"""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        state = {
+            'events': self.events,
+            'survey': self.survey,
+            'aggregates': {key: agg.totals for key, agg in self.aggregates.items()},
+        }
+        tmp_path = path + '.tmp'
+        pd.to_pickle(state, tmp_path)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path=DEFAULT_STATE_FILE):
+        """Restore a store saved with save()"""
+        state = pd.read_pickle(path)
+        store = cls(tuple(state['aggregates']))
+        store.events = state['events']
+        store.survey = state['survey']
+        for key, totals in state['aggregates'].items():
+            store.aggregates[key].totals = totals
+        return store
+
+
+def _read_updates(path):
+    """Read an update batch from CSV, Parquet or Excel"""
+    name = path.lower()
+    if name.endswith(('.parquet', '.pq')):
+        return pd.read_parquet(path)
+    if name.endswith(('.xlsx', '.xls')):
+        return pd.read_excel(path)
+    return pd.read_csv(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Apply appended or corrected events to the incremental feature store")
+    parser.add_argument('updates', nargs='*', help="CSV/Parquet/Excel files with event rows to upsert")
+    parser.add_argument('--state', default=DEFAULT_STATE_FILE, help="feature store file")
+    parser.add_argument('--rebuild', action='store_true', help="re-seed the store from the workbook")
+    args = parser.parse_args()
+
+    if args.rebuild or not os.path.exists(args.state):
+        print("📂 Seeding feature store from workbook...")
+        sports_df, survey_df = load_data()
+        store = IncrementalFeatureStore.from_frames(sports_df, survey_df)
+    else:
+        store = IncrementalFeatureStore.load(args.state)
+
+    for path in args.updates:
+        summary = store.upsert(_read_updates(path))
+        print(f"✅ {path}: {summary['inserted']} inserted, {summary['updated']} updated, "
+              f"{summary['unchanged']} unchanged")
+
+    store.save(args.state)
+    print(f"\n📊 {len(store.events)} events in store ({args.state})")
+    print(store.group_aggregates()[['Events', 'Total_Revenue', 'Avg_Utilization',
+                                    'Avg_Revenue_per_Attendee']].to_string(float_format=lambda x: f"{x:,.2f}"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+KAGR Case Competition - Revenue Initiatives
+The one table of initiative uplifts behind every revenue waterfall (generate_visualizations.py,
+create_presentation.py, the analysis notebook) and the Monte Carlo bands in revenue_simulation.py,
+plus the women's basketball sizing their callouts quote
+Standard library only, so the deck scripts can import it at startup
+"""
+
+# Current annual revenue ($M, midwest_state_sports total) and the NCAA settlement gap to close
+BASE_REVENUE = 94.36
+SETTLEMENT_TARGET = 20.5
+
+# Capacity utilization (%) the women's basketball revenue callouts assume
+WBB_TARGET_UTILIZATION = 60
+
+# ($M per year) most likely = the waterfall's point estimate; low/high span the other estimates in the repo
+# (exec summary, notebook, deck) widened for execution risk, most of all for the capital projects.
+# These are the seven costed initiatives of the deck's ROI table; off-peak discounts are part of dynamic pricing
+# there, not a separate line
+INITIATIVES = (
+    # name,                    low,  most likely, high
+    ('Dynamic Pricing',        3.0,  4.2,  4.8),
+    ("Women's BB Growth",      2.8,  4.0,  4.4),
+    ('Corporate Partnerships', 5.0,  7.5,  8.5),
+    ('Premium Seating',        0.6,  2.8,  3.2),
+    ('Digital Platform',       1.8,  2.8,  3.4),
+    ('Merchandise',            0.8,  1.9,  2.2),
+    ('Alumni Program',         0.5,  0.9,  1.1),
+)
+
+
+def waterfall_steps(initiatives=INITIATIVES):
+    """(name, most likely uplift) per initiative, in waterfall order"""
+    return [(row[0], row[2]) for row in initiatives]
+
+
+def projected_revenue(initiatives=INITIATIVES, base=BASE_REVENUE):
+    """Base revenue plus every initiative's most likely uplift"""
+    return base + sum(uplift for _, uplift in waterfall_steps(initiatives))
+
+
+def step_label(name, newline='\n'):
+    """Two-line axis label: 'Corporate Partnerships' -> 'Corporate\\nPartnerships'"""
+    return newline.join(name.rsplit(' ', 1))
+
+
+def womens_bb_opportunity(cube, survey, target=WBB_TARGET_UTILIZATION):
+    """
+    Women's against Men's Basketball from an AggregateCube and a SurveyEngine: survey interest (% of respondents),
+    mean capacity utilization (%), seats and empty seats per game, and the added revenue per season if the empty
+    seats filled to `target` % bring in the sport's current revenue per attendee
+    """
+    wbb, mbb = "Women's Basketball", "Men's Basketball"
+    interest = survey.interest_by_sport()
+    attendance = cube.value('Attendance', 'sum', Sport=wbb)
+    seasons = len(cube.slice('Academic_Year', 'Attendance', 'count'))
+    added_attendees = target / 100 * cube.value('Venue_Capacity', 'sum', Sport=wbb) - attendance
+    return {
+        'interest': float(interest.get(wbb, 0)),
+        'mens_interest': float(interest.get(mbb, 0)),
+        'utilization': cube.value('Venue_Utilization', Sport=wbb),
+        'mens_utilization': cube.value('Venue_Utilization', Sport=mbb),
+        'capacity': cube.value('Venue_Capacity', Sport=wbb),
+        'mens_capacity': cube.value('Venue_Capacity', Sport=mbb),
+        'empty_seats': cube.value('Venue_Capacity', Sport=wbb) - cube.value('Attendance', Sport=wbb),
+        'target': target,
+        'added_revenue': max(added_attendees, 0) * cube.value('Total_Revenue', 'sum', Sport=wbb) / attendance / seasons,
+    }
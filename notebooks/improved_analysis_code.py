@@ -9,9 +9,18 @@ import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 from matplotlib.patches import Wedge, Rectangle
+import os
+import sys
 import warnings
 warnings.filterwarnings('ignore')
 
+# Shared data loader lives at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data_loader import load_data, revenue_by_source
+from aggregate_cube import AggregateCube, load_cube
+from survey_engine import SurveyEngine
+from initiatives import BASE_REVENUE, SETTLEMENT_TARGET, step_label, waterfall_steps, womens_bb_opportunity
+
 # Professional Color Palette
 PRIMARY_BLUE = '#1f77b4'
 PRIMARY_GREEN = '#2ca02c'
@@ -189,10 +198,11 @@ def create_industry_benchmark_bullet_chart():
 # NEW ANALYSIS: Day of Week by Sport (Mentor Feedback)
 # ============================================================================
 
-def analyze_day_of_week_by_sport(sports_df):
+def analyze_day_of_week_by_sport(sports_df, cube=None):
     """
     Breakdown of attendance and revenue by day of week FOR EACH SPORT
     Addresses mentor feedback: not aggregate analysis
+    Reads Sport x Day_of_Week averages from the aggregate cube (built here if not passed)
     """
     # Ensure we have day of week
     if 'Day_of_Week' not in sports_df.columns:
@@ -204,11 +214,14 @@ def analyze_day_of_week_by_sport(sports_df):
     fig.suptitle('Attendance Patterns by Day of Week - Sport Specific Analysis',
                  fontsize=18, weight='bold')
 
+    if cube is None:
+        cube = AggregateCube(sports_df)
+    day_attendance = cube.slice(('Sport', 'Day_of_Week'), 'Attendance')
+
     sports = sports_df['Sport'].unique()
 
     for ax, sport in zip(axes.flat, sports):
-        sport_data = sports_df[sports_df['Sport'] == sport]
-        day_avg = sport_data.groupby('Day_of_Week')['Attendance'].mean().sort_values(ascending=False)
+        day_avg = day_attendance.loc[sport].dropna().sort_values(ascending=False)
 
         # Define day order
         day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
@@ -245,27 +258,23 @@ def analyze_day_of_week_by_sport(sports_df):
 # NEW ANALYSIS: Night vs Morning Games by Sport (Mentor Feedback)
 # ============================================================================
 
-def analyze_time_of_day_by_sport(sports_df):
+TIME_CATEGORIES = {
+    'Morning': 'Morning/Afternoon',
+    'Afternoon': 'Morning/Afternoon',
+    'Evening': 'Evening/Night',
+    'Night': 'Evening/Night'
+}
+
+
+def analyze_time_of_day_by_sport(sports_df, cube=None):
     """
     Compare morning/afternoon/night games by sport
     Especially important for football
+    Start_Time slots are bucketed into day vs. evening from the aggregate cube
     """
-    # Categorize game times
-    def categorize_time(time_str):
-        # Assuming time_str is like "7:00 PM", "2:30 PM", etc.
-        try:
-            hour = int(time_str.split(':')[0])
-            period = time_str.split(' ')[1] if ' ' in time_str else 'PM'
-
-            if period == 'AM' or (period == 'PM' and hour < 5):
-                return 'Morning/Afternoon'
-            else:
-                return 'Evening/Night'
-        except:
-            return 'Unknown'
-
-    if 'Game_Time' in sports_df.columns:
-        sports_df['Time_Category'] = sports_df['Game_Time'].apply(categorize_time)
+    if cube is None:
+        cube = AggregateCube(sports_df)
+    time_order = ['Morning/Afternoon', 'Evening/Night']
 
     fig, axes = plt.subplots(1, 2, figsize=(16, 7))
     fig.suptitle('Game Time Analysis: Evening vs. Day Games',
@@ -273,7 +282,8 @@ def analyze_time_of_day_by_sport(sports_df):
 
     # Chart 1: Revenue comparison
     ax1 = axes[0]
-    time_revenue = sports_df.groupby(['Sport', 'Time_Category'])['Total_Revenue'].mean().unstack()
+    time_revenue = cube.relabel('Sport', 'Start_Time', TIME_CATEGORIES,
+                                'Total_Revenue').unstack().reindex(columns=time_order)
     time_revenue.plot(kind='bar', ax=ax1, color=[PRIMARY_ORANGE, PRIMARY_PURPLE],
                       edgecolor='black', linewidth=1.5, width=0.7)
     ax1.set_title('Average Revenue: Day vs. Evening Games', fontsize=14, weight='bold')
@@ -286,7 +296,8 @@ def analyze_time_of_day_by_sport(sports_df):
 
     # Chart 2: Attendance comparison
     ax2 = axes[1]
-    time_attend = sports_df.groupby(['Sport', 'Time_Category'])['Attendance'].mean().unstack()
+    time_attend = cube.relabel('Sport', 'Start_Time', TIME_CATEGORIES,
+                               'Attendance').unstack().reindex(columns=time_order)
     time_attend.plot(kind='bar', ax=ax2, color=[PRIMARY_ORANGE, PRIMARY_PURPLE],
                      edgecolor='black', linewidth=1.5, width=0.7)
     ax2.set_title('Average Attendance: Day vs. Evening Games', fontsize=14, weight='bold')
@@ -317,28 +328,35 @@ def analyze_time_of_day_by_sport(sports_df):
 # IMPROVED: Women's Basketball Opportunity - Dual Axis Chart
 # ============================================================================
 
-def create_womens_basketball_opportunity_chart(sports_df, survey_df):
+def create_womens_basketball_opportunity_chart(sports_df, survey_df, cube=None):
     """
     Emphasize the interest vs. attendance gap for women's basketball
     This was a KEY mentor point
     """
     fig, ax1 = plt.subplots(figsize=(14, 8))
 
-    # Mock data - replace with your actual survey interest scores
     sports = ['Football', 'Mens Basketball', 'Womens Basketball',
               'Baseball', 'Softball', 'Volleyball']
-    interest_scores = [95, 88, 85, 65, 58, 52]  # From survey
-
-    # Get capacity utilization from sport_performance
-    capacity_util = []
-    for sport in sports:
-        sport_df = sports_df[sports_df['Sport'] == sport.replace(' ', '_')]
-        if len(sport_df) > 0:
-            avg_attend = sport_df['Attendance'].mean()
-            capacity = sport_df['Venue_Capacity'].iloc[0]
-            capacity_util.append((avg_attend / capacity) * 100)
-        else:
-            capacity_util.append(0)
+
+    sport_names = {
+        'Football': 'Football',
+        'Mens Basketball': "Men's Basketball",
+        'Womens Basketball': "Women's Basketball",
+        'Baseball': "Men's Baseball",
+        'Softball': "Women's Softball",
+        'Volleyball': "Women's Volleyball"
+    }
+
+    # Mean capacity utilization for every sport from one grouped pass (no per-sport filtering)
+    if cube is None:
+        cube = AggregateCube(sports_df)
+    util_by_sport = cube.slice('Sport', 'Venue_Utilization')
+    capacity_util = [float(util_by_sport.get(sport_names[sport], 0)) for sport in sports]
+
+    # % of survey respondents interested in each sport
+    survey = SurveyEngine(survey_df)
+    interest_by_sport = survey.interest_by_sport()
+    interest_scores = [round(float(interest_by_sport.get(sport_names[sport], 0))) for sport in sports]
 
     x = np.arange(len(sports))
     width = 0.35
@@ -361,15 +379,17 @@ def create_womens_basketball_opportunity_chart(sports_df, survey_df):
     bars2[2].set_linewidth(4)
 
     # Add THE KEY ANNOTATION
-    ax1.annotate('MAJOR OPPORTUNITY!\nHigh Interest (85) vs.\nLow Attendance (43.5%)',
-                 xy=(2, 85), xytext=(4, 90),
+    ax1.annotate(f'MAJOR OPPORTUNITY!\nHigh Interest ({interest_scores[2]}) vs.\nLow Attendance ({capacity_util[2]:.1f}%)',
+                 xy=(2, interest_scores[2]), xytext=(4, 90),
                  arrowprops=dict(arrowstyle='->', color='red', lw=3),
                  fontsize=13, color='red', weight='bold',
                  bbox=dict(boxstyle='round,pad=1', facecolor='yellow',
                           edgecolor='red', linewidth=3))
 
     ax1.set_xlabel('Sport', fontsize=13, weight='bold')
-    ax1.set_ylabel('Fan Interest Score (0-100)', fontsize=13, weight='bold', color=PRIMARY_BLUE)
+    ax1.set_ylabel('Fan Interest (% of survey respondents)', fontsize=13, weight='bold', color=PRIMARY_BLUE)
+    ax1.set_ylim(0, 100)
+    ax2.set_ylim(0, 100)
     ax2.set_ylabel('Capacity Utilization %', fontsize=13, weight='bold', color=GOOD)
     ax1.set_title('The Women\'s Basketball Paradox: High Interest, Low Attendance',
                   fontsize=16, weight='bold', pad=20)
@@ -383,12 +403,13 @@ def create_womens_basketball_opportunity_chart(sports_df, survey_df):
     ax1.grid(axis='y', alpha=0.3, linestyle='--')
     ax1.set_axisbelow(True)
 
-    # Add insight text box
-    insight_text = ("Insight: Women's Basketball has 85/100 interest score\\n"
-                   "(nearly matching Men's Basketball at 88), but only\\n"
-                   "43.5% capacity utilization vs. Men's 84%.\\n\\n"
-                   "Solution: Targeted social media campaigns + enhanced\\n"
-                   "game experience to convert interest into attendance.")
+    # Add insight text box (same survey and cube figures as the bars)
+    wbb = womens_bb_opportunity(cube, survey)
+    insight_text = (f"Insight: {wbb['interest']:.0f}% of fans are interested in Women's Basketball\n"
+                    f"(nearly matching Men's Basketball at {wbb['mens_interest']:.0f}%), but only\n"
+                    f"{wbb['utilization']:.1f}% capacity utilization vs. Men's {wbb['mens_utilization']:.0f}%.\n\n"
+                    "Solution: Targeted social media campaigns + enhanced\n"
+                    "game experience to convert interest into attendance.")
 
     ax1.text(0.02, 0.98, insight_text, transform=ax1.transAxes,
              fontsize=10, verticalalignment='top',
@@ -402,16 +423,15 @@ def create_womens_basketball_opportunity_chart(sports_df, survey_df):
 # IMPROVED: Merchandise Revenue - Normalized View
 # ============================================================================
 
-def create_normalized_merchandise_chart(sports_df):
+def create_normalized_merchandise_chart(sports_df, cube=None):
     """
     Normalize merchandise revenue to account for different revenue scales
     Addresses mentor feedback about misleading percentages
     """
-    sport_merch = sports_df.groupby('Sport').agg({
-        'Merchandise_Revenue': 'sum',
-        'Total_Revenue': 'sum',
-        'Attendance': 'sum'
-    })
+    if cube is None:
+        cube = AggregateCube(sports_df)
+    sport_merch = cube.slice('Sport', stat='sum')[
+        ['Merchandise_Revenue', 'Total_Revenue', 'Attendance']].copy()
 
     # Calculate merchandise per attendee (normalized metric)
     sport_merch['Merch_per_Attendee'] = (sport_merch['Merchandise_Revenue'] /
@@ -464,10 +484,10 @@ def create_normalized_merchandise_chart(sports_df):
     ax2.set_axisbelow(True)
 
     # Add explanation
-    explanation = ("Left Chart: Fair comparison - $/attendee\\n"
-                   "Right Chart: Shows merchandise importance\\n\\n"
-                   "Football appears low on right because total\\n"
-                   "revenue is so high, but left shows opportunity\\n"
+    explanation = ("Left Chart: Fair comparison - $/attendee\n"
+                   "Right Chart: Shows merchandise importance\n\n"
+                   "Football appears low on right because total\n"
+                   "revenue is so high, but left shows opportunity\n"
                    "to increase $/attendee to industry average.")
 
     ax2.text(0.98, 0.02, explanation, transform=ax2.transAxes,
@@ -488,18 +508,17 @@ def create_revenue_waterfall_chart():
     """
     fig, ax = plt.subplots(figsize=(16, 9))
 
-    initiatives = ['Current\\nRevenue', 'Dynamic\\nPricing', 'Women\\'s BB\\nGrowth',
-                   'Corporate\\nPartnerships', 'Premium\\nSeating', 'Merchandise',
-                   'Off-Peak\\nPromo', 'Alumni\\nProgram', 'Projected\\nRevenue']
+    steps = waterfall_steps()
+    initiatives = ['Current\nRevenue'] + [step_label(name) for name, _ in steps] + ['Projected\nRevenue']
 
-    values = [94.36, 4.2, 4.0, 7.5, 2.8, 1.9, 0.8, 0.9, 0]
+    values = [BASE_REVENUE] + [uplift for _, uplift in steps] + [0]
 
-    cumulative = [94.36]
+    cumulative = [BASE_REVENUE]
     for i in range(1, len(values)-1):
         cumulative.append(cumulative[-1] + values[i])
     cumulative.append(cumulative[-1])
 
-    colors = [PRIMARY_BLUE] + [PRIMARY_GREEN] * 7 + [PRIMARY_ORANGE]
+    colors = [PRIMARY_BLUE] + [PRIMARY_GREEN] * len(steps) + [PRIMARY_ORANGE]
 
     # Draw bars
     for i, (init, val, cum) in enumerate(zip(initiatives, values, cumulative)):
@@ -525,17 +544,19 @@ def create_revenue_waterfall_chart():
     ax.set_xticks(range(len(initiatives)))
     ax.set_xticklabels(initiatives, fontsize=11, weight='bold')
     ax.set_ylabel('Revenue (Millions $)', fontsize=14, weight='bold')
-    ax.set_title('Revenue Growth Roadmap: $94.4M → $119.5M (+$25.1M, 27% growth)',
+    new_revenue = cumulative[-1] - BASE_REVENUE
+    ax.set_title(f'Revenue Growth Roadmap: ${BASE_REVENUE:.1f}M → ${cumulative[-1]:.1f}M '
+                 f'(+${new_revenue:.1f}M, {new_revenue / BASE_REVENUE:.0%} growth)',
                  fontsize=16, weight='bold', pad=20)
 
     # Target line
-    target = 94.36 + 20.5
+    target = BASE_REVENUE + SETTLEMENT_TARGET
     ax.axhline(target, color=PRIMARY_RED, linestyle='--', linewidth=2.5,
                label=f'NCAA Settlement Target: ${target:.1f}M', alpha=0.7)
 
     # Exceeded by annotation
     exceeded = cumulative[-1] - target
-    ax.annotate(f'Exceeds target\\nby ${exceeded:.1f}M!',
+    ax.annotate(f'Exceeds target\nby ${exceeded:.1f}M!',
                 xy=(len(initiatives)-1, cumulative[-1]),
                 xytext=(len(initiatives)-2, cumulative[-1] + 5),
                 arrowprops=dict(arrowstyle='->', color=PRIMARY_GREEN, lw=3),
@@ -588,7 +609,7 @@ def create_corporate_benchmark_chart():
 
     # Gap annotation
     gap = avg - 9.2
-    ax.annotate(f'{gap:.1f}% below\\npeer average',
+    ax.annotate(f'{gap:.1f}% below\npeer average',
                 xy=(5, 9.2), xytext=(4, 6),
                 arrowprops=dict(arrowstyle='->', color='red', lw=2),
                 fontsize=11, color='red', weight='bold',
@@ -618,19 +639,13 @@ def create_corporate_benchmark_chart():
 """
 To use these functions in your notebook:
 
-1. Load your data:
-   sports_df = pd.read_excel("2025 KODING with KAGR Case Competition_Dataset.xlsx",
-                             sheet_name="midwest_state_sports")
-   survey_df = pd.read_excel("2025 KODING with KAGR Case Competition_Dataset.xlsx",
-                             sheet_name="Customer Experience Survey")
+1. Load your data (typed, with Total_Revenue / Revenue_per_Attendee /
+   Venue_Utilization / Age already added; parsed once per kernel):
+   sports_df, survey_df = load_data()
+   cube = load_cube()   # precomputed Sport x Day x Start_Time x Opponent x Year aggregates
 
 2. Calculate your metrics:
-   revenue_streams = {
-       'Ticket Revenue': sports_df['Ticket_Revenue'].sum(),
-       'Concession Revenue': sports_df['Concession_Revenue'].sum(),
-       'Parking Revenue': sports_df['Parking_Revenue'].sum(),
-       'Merchandise Revenue': sports_df['Merchandise_Revenue'].sum()
-   }
+   revenue_streams = revenue_by_source(sports_df)
    total_revenue = sum(revenue_streams.values())
 
    sport_performance = sports_df.groupby('Sport').agg({...})
@@ -639,10 +654,10 @@ To use these functions in your notebook:
    fig1 = create_revenue_donut_chart(revenue_streams, total_revenue)
    fig2 = create_sport_performance_with_benchmarks(sport_performance)
    fig3 = create_industry_benchmark_bullet_chart()
-   fig4 = analyze_day_of_week_by_sport(sports_df)
-   fig5 = analyze_time_of_day_by_sport(sports_df)
-   fig6 = create_womens_basketball_opportunity_chart(sports_df, survey_df)
-   fig7 = create_normalized_merchandise_chart(sports_df)
+   fig4 = analyze_day_of_week_by_sport(sports_df, cube)
+   fig5 = analyze_time_of_day_by_sport(sports_df, cube)
+   fig6 = create_womens_basketball_opportunity_chart(sports_df, survey_df, cube)
+   fig7 = create_normalized_merchandise_chart(sports_df, cube)
    fig8 = create_revenue_waterfall_chart()
    fig9 = create_corporate_benchmark_chart()
 
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+KAGR Case Competition - Static Export for Plotly Figures
+PNG renders of the nine visualizations through kaleido 0.2.1, whose wheel bundles its own headless Chromium, so
+decks show exactly what the interactive HTML shows with nothing downloaded at render time. Every figure goes through
+one long-lived kaleido process. kaleido is optional: without it callers keep the "open the HTML chart" placeholders
+"""
+
+import argparse
+import hashlib
+import importlib.metadata
+import importlib.util
+import os
+import sys
+import threading
+import time
+
+from data_loader import DATA_FILE, register_derived_cache
+from render_pool import DEFAULT_PPI
+from tracing import span
+
+# The exporter the renders are checked against: 0.2.1 is the last kaleido that ships Chromium inside the wheel
+# (kaleido >= 1 drives a separately downloaded Chrome)
+KALEIDO_VERSION = '0.2.1'
+KALEIDO_REQUIREMENT = f'kaleido=={KALEIDO_VERSION}'
+INSTALL_HINT = f'pip install "{KALEIDO_REQUIREMENT}"'
+
+# Plotly lays figures out in CSS pixels
+PX_PER_INCH = 96
+
+# Figures without a layout height get this aspect ratio (the 10" x 6" visualization box in create_powerpoint.py)
+STATIC_WIDTH_IN = 10
+STATIC_ASPECT = 10 / 6
+
+# ============================================================================
+# EXPORT
+# ============================================================================
+
+def exporter_version():
+    """Installed kaleido version, or None"""
+    if importlib.util.find_spec('kaleido') is None:
+        return None
+    return importlib.metadata.version('kaleido')
+
+
+_exporter = None
+_exporter_lock = threading.Lock()
+
+
+def exporter():
+    """
+    The process-wide kaleido scope: one Chromium subprocess, started on first use and shared by every figure
+    (and every render daemon request) until the process exits
+    Raises RuntimeError when kaleido is missing or is not the pinned version
+    """
+    global _exporter
+    with _exporter_lock:
+        if _exporter is None:
+            version = exporter_version()
+            if version != KALEIDO_VERSION:
+                found = f"kaleido {version} is installed" if version else "kaleido is not installed"
+                raise RuntimeError(f"Static export needs {KALEIDO_REQUIREMENT} ({found}): {INSTALL_HINT}")
+            import plotly
+            from kaleido.scopes.plotly import PlotlyScope
+
+            # plotly.js comes from the installed plotly package and MathJax is off, so nothing is fetched
+            plotlyjs = os.path.join(os.path.dirname(plotly.__file__), 'package_data', 'plotly.min.js')
+            _exporter = PlotlyScope(plotlyjs=plotlyjs, mathjax=False)
+        return _exporter
+
+
+def figure_png(fig, width_in=STATIC_WIDTH_IN, ppi=DEFAULT_PPI, quantize=False):
+    """
+    PNG bytes for a plotly figure, laid out width_in inches wide and rendered at width_in * ppi pixels
+    Raises RuntimeError when kaleido is missing or its Chromium fails to render
+    """
+    from render_pool import quantize_png
+
+    scope = exporter()
+    width_px = round(width_in * PX_PER_INCH)
+    height_px = fig.layout.height or round(width_px / STATIC_ASPECT)
+    with span('to_image', 'render') as s:
+        try:
+            png = scope.transform(fig.to_dict(), format='png', width=width_px, height=height_px,
+                                  scale=ppi / PX_PER_INCH)
+        except ValueError as exc:
+            raise RuntimeError(f"Static export failed: {exc}") from None
+        if quantize:
+            png = quantize_png(png)
+        s['bytes'] = len(png)
+    return png
+
+# ============================================================================
+# BATCHED EXPORT OF THE NINE VISUALIZATIONS
+# ============================================================================
+
+_inputs = {}
+register_derived_cache(_inputs.clear)
+
+
+def build_viz(name, file_path=DATA_FILE):
+    """Build one generate_visualizations figure; its inputs (the cube, the survey engine) load once per process"""
+    import generate_visualizations as gv
+
+    task = gv.TASKS_BY_NAME[name]
+    missing = [key for key in task.inputs if (key, file_path) not in _inputs]
+    if missing:
+        for key, value in gv.load_inputs(missing, file_path).items():
+            _inputs[key, file_path] = value
+    return task.build({key: _inputs[key, file_path] for key in task.inputs})
+
+
+def viz_key(task, data_hash, width_in, ppi, quantize):
+    """
+    Render-cache key for one visualization: the workbook, the task's builder (with what it calls and its style
+    constants), the plotly and kaleido versions, and the output size
+    """
+    from render_cache import _update_digest, function_fingerprint, style_constants
+
+    digest = hashlib.sha256()
+    _update_digest(digest, ('plotly_static', importlib.metadata.version('plotly'), exporter_version()))
+    _update_digest(digest, (data_hash if task.inputs else None, task.name))
+    _update_digest(digest, function_fingerprint(task.builder))
+    _update_digest(digest, style_constants(task.builder))
+    _update_digest(digest, (width_in, ppi, quantize))
+    return digest.hexdigest()
+
+
+def render_viz_images(names=None, width_in=STATIC_WIDTH_IN, ppi=DEFAULT_PPI, quantize=False,
+                      use_cache=True, file_path=DATA_FILE, cache=None):
+    """
+    PNG bytes keyed by output name (viz_01_challenge_gauge, ...); figures already in the render cache need
+    neither kaleido nor the workbook, the rest all go through the one kaleido process of exporter()
+    Raises RuntimeError when a figure must be rendered and the exporter is missing
+    """
+    import generate_visualizations as gv
+    from data_cache import workbook_hash
+    from render_cache import RenderCache
+
+    if cache is None and use_cache:
+        cache = RenderCache()
+    data_hash = workbook_hash(file_path)
+    images = {}
+    for task in gv.select_tasks(names):
+        key = viz_key(task, data_hash, width_in, ppi, quantize)
+        png = cache.get(key) if cache is not None else None
+        if png is None:
+            png = figure_png(build_viz(task.name, file_path), width_in, ppi, quantize)
+            if cache is not None:
+                cache.put(key, png)
+        images[task.output] = png
+    return images
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export the plotly visualizations as PNGs through kaleido")
+    parser.add_argument('charts', nargs='*', help="task names (default: all nine)")
+    parser.add_argument('--out', default='docs', help="output directory")
+    parser.add_argument('--width', type=float, default=STATIC_WIDTH_IN, help="slide width in inches")
+    parser.add_argument('--ppi', type=int, default=DEFAULT_PPI, help="pixels per inch of slide space")
+    parser.add_argument('--quantize', action='store_true', help="optimized 256-color PNGs")
+    parser.add_argument('--no-cache', action='store_true', help="re-render every figure")
+    parser.add_argument('--data', default=DATA_FILE, help="workbook path")
+    args = parser.parse_args(argv)
+
+    print("🎨 Rendering visualizations...")
+    start = time.perf_counter()
+    try:
+        images = render_viz_images(args.charts or None, args.width, args.ppi, args.quantize,
+                                   not args.no_cache, args.data)
+    except KeyError as exc:
+        print(f"❌ {exc.args[0]}")
+        return 2
+    except RuntimeError as exc:
+        print(f"❌ {exc}")
+        return 1
+    os.makedirs(args.out, exist_ok=True)
+    for name, png in images.items():
+        path = os.path.join(args.out, f"{name}.png")
+        with open(path, 'wb') as f:
+            f.write(png)
+        print(f"✅ {path} ({len(png) / 1024:.0f} KB)")
+    print(f"\n⏱️  {len(images)} figures in {time.perf_counter() - start:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
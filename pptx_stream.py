@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+KAGR Case Competition - Streaming PPTX Assembly
+Writes each finished slide, its notes and its media straight into the output zip and releases the image bytes,
+so peak memory is bounded by one slide instead of the whole deck. Images are deduplicated by SHA1 and a
+MediaCache shared across decks keeps their parsed metadata and deflated bytes, so a repeated chart or logo is
+stored once per package and compressed once per batch
+The writer reaches into python-pptx and zipfile internals, so before its first use in a process it checks that
+it still reproduces prs.save byte for byte, and raises instead of writing a different deck after an upgrade
+"""
+
+import functools
+import hashlib
+import io
+import os
+import time
+import zipfile
+import zlib
+from collections import OrderedDict
+
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.oxml import serialize_part_xml
+from pptx.opc.package import XmlPart
+from pptx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI
+from pptx.parts.image import Image, ImagePart
+
+# Slide-owned parts that no later slide can touch once the slide is finished
+SLIDE_OWNED_RELTYPES = (RT.IMAGE, RT.MEDIA, RT.VIDEO, RT.NOTES_SLIDE)
+
+MEDIA_CACHE_MAX_BYTES = int(os.environ.get('KAGR_MEDIA_CACHE_MB', 128)) * 1024 * 1024
+
+# The python-pptx release the writer was built against (the self-check covers any other)
+PPTX_TESTED_VERSION = '1.0.2'
+
+
+@functools.lru_cache(maxsize=None)
+def _hashed_class(part_class):
+    """
+    Subclass whose sha1 and native size are stored rather than recomputed from the blob
+    python-pptx reuses an existing image part when the sha1 matches and then scales the new picture from its
+    native size, so a repeated image still maps to the part already in the zip after its blob is released
+    """
+    return type(f"Hashed{part_class.__name__}", (part_class,), {
+        'sha1': property(lambda self: self._media_sha1),
+        '_native_size': property(lambda self: self._media_native_size),
+    })
+
+
+def _hash_part(part, sha1=None, native_size=None):
+    """Pin a binary part's sha1 and native size (computed now unless given) and switch it to the hashed class"""
+    if '_media_sha1' in vars(part):
+        return
+    if sha1 is None and hasattr(part, 'sha1'):
+        sha1 = part.sha1
+    if native_size is None and hasattr(type(part), '_native_size'):
+        native_size = part._native_size
+    part._media_sha1 = sha1
+    part._media_native_size = native_size
+    part.__class__ = _hashed_class(type(part))
+
+
+def _deflate(blob):
+    """Raw deflate stream exactly as zipfile.ZIP_DEFLATED writes it at the default level"""
+    compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+    return compressor.compress(blob) + compressor.flush()
+
+
+class _Precompressed:
+    """Stands in for a zip entry's compressor and emits an already-deflated payload"""
+
+    def __init__(self, payload):
+        self._payload = payload
+
+    def compress(self, data):
+        return b''
+
+    def flush(self):
+        return self._payload
+
+
+class MediaCache:
+    """
+    Parsed images and their deflated bytes keyed by SHA1, shared by every deck a process writes
+    Least recently used entries are dropped once the cache passes `max_bytes` (the latest entry is always kept)
+    """
+
+    def __init__(self, max_bytes=MEDIA_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._images = OrderedDict()  # sha1 -> pptx Image
+        self._native_sizes = {}
+        self._deflated = {}
+        self._bytes = 0
+
+    def image(self, image_file):
+        """(sha1, Image) for a path or file-like object; a repeated blob returns the cached Image"""
+        if isinstance(image_file, str):
+            with open(image_file, 'rb') as f:
+                blob = f.read()
+            filename = os.path.basename(image_file)
+        else:
+            image_file.seek(0)
+            blob = image_file.read()
+            filename = None
+        sha1 = hashlib.sha1(blob).hexdigest()
+        image = self._images.get(sha1)
+        if image is None:
+            self.misses += 1
+            image = Image(blob, filename)
+            self._images[sha1] = image
+            self._bytes += len(blob)
+            self._evict()
+        else:
+            self.hits += 1
+            self._images.move_to_end(sha1)
+        return sha1, image
+
+    def native_size(self, sha1, part):
+        """Native (EMU) size of an image part, read from the image header once per blob"""
+        if sha1 not in self._native_sizes:
+            self._native_sizes[sha1] = part._native_size
+        return self._native_sizes[sha1]
+
+    def deflated(self, sha1, blob):
+        """Deflated bytes of a blob, compressed once per blob"""
+        payload = self._deflated.get(sha1)
+        if payload is None:
+            payload = _deflate(blob)
+            if sha1 in self._images:
+                self._deflated[sha1] = payload
+                self._bytes += len(payload)
+                self._evict()
+        return payload
+
+    def _evict(self):
+        while self._bytes > self.max_bytes and len(self._images) > 1:
+            sha1, image = self._images.popitem(last=False)
+            self._bytes -= len(image.blob) + len(self._deflated.pop(sha1, b''))
+            self._native_sizes.pop(sha1, None)
+
+
+class StreamingPresentationWriter:
+    """
+    Streams a Presentation into `path` while it is being built
+
+        with StreamingPresentationWriter(prs, path):
+            ...add slides as usual...
+
+    Adding a slide flushes the previous one, so a slide must be complete before the next add_slide call.
+    Shared parts (presentation, masters, layouts, theme, properties) are written when the writer closes.
+    Pass the same MediaCache to every writer in a batch to share image parsing and compression across decks.
+    Raises RuntimeError when this python-pptx no longer matches prs.save (see self_check)
+    """
+
+    def __init__(self, prs, path, media=None, check=True):
+        if check:
+            self_check()
+        self.prs = prs
+        self.path = path
+        # Without a shared cache, keep nothing beyond the current image so memory stays bounded by one slide
+        self.media = media if media is not None else MediaCache(max_bytes=0)
+        self.slides_written = 0
+        self.media_bytes_written = 0
+        self.images_reused = 0
+        self._zip = zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_DEFLATED, strict_timestamps=False)
+        self._written = set()
+        self._pending = []
+
+        # One part per distinct image: a sha1 index instead of python-pptx's rehash-every-part scan
+        self._package = prs.part.package
+        self._image_parts = self._package._image_parts
+        self._image_index = {part.sha1: part for part in self._image_parts}
+        self._image_parts.get_or_add_image_part = self._get_or_add_image_part
+
+        slides = prs.slides
+        add_slide = slides.add_slide
+
+        def add_slide_and_flush(slide_layout):
+            self.flush()
+            slide = add_slide(slide_layout)
+            self._pending.append(slide)
+            return slide
+
+        slides.add_slide = add_slide_and_flush
+        self._slides = slides
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self._detach()
+            self._zip.close()
+
+    def _get_or_add_image_part(self, image_file):
+        """Existing part for an image already in this deck, else a new part with its sha1 and size pinned"""
+        sha1, image = self.media.image(image_file)
+        part = self._image_index.get(sha1)
+        if part is not None:
+            self.images_reused += 1
+            return part
+        part = ImagePart.new(self._package, image)
+        _hash_part(part, sha1, self.media.native_size(sha1, part))
+        self._image_index[sha1] = part
+        return part
+
+    # ------------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------------
+
+    def _write_media(self, part):
+        """Write a binary part from its cached deflated bytes (same zip entry writestr would produce)"""
+        zinfo = zipfile.ZipInfo(part.partname.membername, date_time=time.localtime(time.time())[:6])
+        zinfo.compress_type = zipfile.ZIP_DEFLATED
+        zinfo.external_attr = 0o600 << 16
+        with self._zip.open(zinfo, 'w') as dest:
+            dest._compressor = _Precompressed(self.media.deflated(part._media_sha1, part.blob))
+            dest.write(part.blob)  # still feeds the CRC and size
+
+    def _write_part(self, part):
+        """Write one part (and its rels item) unless it is already in the zip"""
+        if part.partname in self._written:
+            return False
+        if getattr(part, '_media_sha1', None) is not None:
+            self._write_media(part)
+        else:
+            self._zip.writestr(part.partname.membername, part.blob)
+        if part._rels:
+            self._zip.writestr(part.partname.rels_uri.membername, part.rels.xml)
+        self._written.add(part.partname)
+        return True
+
+    def _release(self, part):
+        """Drop a binary part's bytes once they are in the zip"""
+        if isinstance(part, XmlPart) or part._blob is None:
+            return
+        self.media_bytes_written += len(part._blob)
+        _hash_part(part)
+        part._blob = None
+
+    def flush(self):
+        """Write every finished slide with its notes and media, then release the media bytes"""
+        for slide in self._pending:
+            slide_part = slide.part
+            owned = [rel.target_part for rel in slide_part.rels.values()
+                     if not rel.is_external and rel.reltype in SLIDE_OWNED_RELTYPES]
+            self._write_part(slide_part)
+            for part in owned:
+                if self._write_part(part):
+                    self._release(part)
+            self.slides_written += 1
+        self._pending = []
+
+    def close(self):
+        """Flush the last slide, then write content types, package rels and every shared part"""
+        from pptx.opc.serialized import _ContentTypesItem
+
+        self.flush()
+        package = self.prs.part.package
+        parts = tuple(package.iter_parts())
+        self._zip.writestr(CONTENT_TYPES_URI.membername, serialize_part_xml(_ContentTypesItem.xml_for(parts)))
+        self._zip.writestr(PACKAGE_URI.rels_uri.membername, package._rels.xml)
+        for part in parts:
+            self._write_part(part)
+        self._detach()
+        self._zip.close()
+
+    def _detach(self):
+        """Restore the plain add_slide and image lookup"""
+        del self._slides.add_slide
+        del self._image_parts.get_or_add_image_part
+
+
+def _self_check_slides(prs, images):
+    from pptx.util import Inches
+
+    for i, png in enumerate(images):
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(9), Inches(0.6)).text_frame.text = f"Slide {i}"
+        slide.shapes.add_picture(io.BytesIO(png), Inches(0.5), Inches(1.2), width=Inches(4))
+        slide.notes_slide.notes_text_frame.text = f"Notes {i}"
+
+
+def _first_difference(expected, actual):
+    """Name of the first zip entry that differs between two packages (or is in only one), else None"""
+    with zipfile.ZipFile(expected) as a, zipfile.ZipFile(actual) as b:
+        names = sorted(set(a.namelist()) | set(b.namelist()))
+        for name in names:
+            if name not in a.namelist() or name not in b.namelist() or a.read(name) != b.read(name):
+                return name
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def self_check():
+    """
+    Build a small deck (a repeated image, notes) with prs.save and with the writer and compare every zip entry
+    Runs once per process; raises RuntimeError naming the first difference, so a python-pptx upgrade that moves
+    the internals used here fails loudly instead of producing a different file
+    """
+    import pptx
+    from PIL import Image as PILImage
+    from pptx import Presentation
+
+    images = []
+    for color in ('red', 'blue', 'red'):
+        buf = io.BytesIO()
+        PILImage.new('RGB', (8, 6), color).save(buf, format='PNG')
+        images.append(buf.getvalue())
+
+    saved = io.BytesIO()
+    prs = Presentation()
+    _self_check_slides(prs, images)
+    prs.save(saved)
+
+    hint = (f"python-pptx {pptx.__version__} (the writer was built against {PPTX_TESTED_VERSION}); build without "
+            f"--stream or install python-pptx=={PPTX_TESTED_VERSION}")
+    try:
+        streamed = io.BytesIO()
+        prs = Presentation()
+        with StreamingPresentationWriter(prs, streamed, check=False):
+            _self_check_slides(prs, images)
+        difference = _first_difference(saved, streamed)
+    except Exception as exc:
+        raise RuntimeError(f"Streaming writer failed its self-check ({type(exc).__name__}: {exc}) with {hint}") from exc
+    if difference is not None:
+        raise RuntimeError(f"Streaming writer output differs from prs.save in {difference} with {hint}")
+    return True
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+KAGR Case Competition - Content-Addressed Render Cache
+Stores chart PNG bytes on disk keyed on (builder code, input data, style constants, dpi) with size-bounded LRU eviction
+"""
+
+import dis
+import hashlib
+import importlib.util
+import inspect
+import os
+import sys
+
+CACHE_DIR = os.environ.get(
+    'KAGR_RENDER_CACHE_DIR',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'renders')
+)
+MAX_BYTES = int(float(os.environ.get('KAGR_RENDER_CACHE_MB', 512)) * 1024 * 1024)
+
+# Global matplotlib settings the builders' modules change at import time
+STYLE_RCPARAMS = ('font.family', 'font.sans-serif', 'axes.prop_cycle')
+
+# Bump to invalidate every entry after a change to how PNGs are produced
+CACHE_VERSION = 1
+
+# Code under this directory (outside installed packages) is fingerprinted along with the builders that use it
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# ============================================================================
+# FINGERPRINTING
+# ============================================================================
+
+def _update_digest(digest, value):
+    """Feed a stable byte representation of `value` into the digest"""
+    # A frame or array can only exist if its library is already loaded, so hashing never imports them
+    pd = sys.modules.get('pandas')
+    np = sys.modules.get('numpy')
+    if pd is not None and isinstance(value, pd.DataFrame):
+        digest.update(b'DataFrame')
+        digest.update(repr(list(value.columns)).encode())
+        digest.update(repr([str(t) for t in value.dtypes]).encode())
+        digest.update(pd.util.hash_pandas_object(value, index=True).values.tobytes())
+    elif pd is not None and isinstance(value, pd.Series):
+        digest.update(b'Series')
+        digest.update(repr((value.name, str(value.dtype))).encode())
+        digest.update(pd.util.hash_pandas_object(value, index=True).values.tobytes())
+    elif np is not None and isinstance(value, np.ndarray):
+        digest.update(b'ndarray')
+        digest.update(repr((value.dtype.str, value.shape)).encode())
+        digest.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, dict):
+        digest.update(b'dict')
+        for key in sorted(value, key=repr):
+            _update_digest(digest, key)
+            _update_digest(digest, value[key])
+    elif isinstance(value, (list, tuple)):
+        digest.update(type(value).__name__.encode())
+        for item in value:
+            _update_digest(digest, item)
+    elif hasattr(value, 'cache_token'):
+        # Objects such as the aggregate cube expose a content token instead of raw data
+        _update_digest(digest, value.cache_token())
+    else:
+        digest.update(repr(value).encode())
+
+
+def _in_repo(path):
+    path = os.path.abspath(path or '')
+    return path.startswith(REPO_DIR + os.sep) and 'site-packages' not in path
+
+
+def _code_objects(code):
+    """A code object and every function, lambda and comprehension nested in it"""
+    yield code
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            yield from _code_objects(const)
+
+
+def _file_digest(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _imported_repo_files(code):
+    """Source files of the repo modules a function imports in its body (found without importing them)"""
+    files = set()
+    for inner in _code_objects(code):
+        for instruction in dis.get_instructions(inner):
+            if instruction.opname != 'IMPORT_NAME':
+                continue
+            try:
+                spec = importlib.util.find_spec(instruction.argval.partition('.')[0])
+            except (ImportError, ValueError):
+                continue
+            if spec is not None and _in_repo(spec.origin):
+                files.add(spec.origin)
+    return files
+
+
+def function_fingerprint(func, _seen=None):
+    """
+    Builder identity: qualified name plus source (bytecode when source is unavailable), followed by what it uses
+    from this repo: the fingerprints of module-level functions it calls (recursively), the source of classes and
+    of modules it references or imports, and the values of the lower-case module globals it reads
+    """
+    try:
+        code = inspect.getsource(func)
+    except (OSError, TypeError):
+        code = func.__code__.co_code.hex()
+    parts = [f"{func.__module__}.{func.__qualname__}\n{code}"]
+
+    seen = _seen if _seen is not None else set()
+    seen.add(func)
+    names = sorted({name for inner in _code_objects(func.__code__) for name in inner.co_names})
+    for name in names:
+        if name not in func.__globals__:
+            continue
+        value = func.__globals__[name]
+        if inspect.isfunction(value):
+            if value not in seen and _in_repo(value.__code__.co_filename):
+                parts.append(function_fingerprint(value, seen))
+        elif inspect.isclass(value) or inspect.ismodule(value):
+            try:
+                path = inspect.getsourcefile(value)
+            except TypeError:
+                continue
+            if _in_repo(path):
+                parts.append(f"{name}: {_file_digest(path) if inspect.ismodule(value) else inspect.getsource(value)}")
+        elif not name.isupper() and not name.startswith('_') and _is_plain(value):
+            # Upper-case constants are covered by style_constants; private names are memos
+            parts.append(f"{name} = {value!r}")
+    for path in sorted(_imported_repo_files(func.__code__)):
+        parts.append(f"{os.path.basename(path)}: {_file_digest(path)}")
+    return '\n'.join(parts)
+
+
+def _is_plain(value):
+    """Plain data only: constants such as a list of builder functions would hash by memory address"""
+    if isinstance(value, (str, int, float, bool, type(None))):
+        return True
+    if isinstance(value, (list, tuple)):
+        return all(_is_plain(item) for item in value)
+    if isinstance(value, dict):
+        return all(_is_plain(key) and _is_plain(item) for key, item in value.items())
+    return False
+
+
+def style_constants(func):
+    """
+    Upper-case module constants visible to the builder (PRIMARY_BLUE, SPORT_COLORS, ...)
+    Private names are skipped: '_MEMO'.isupper() is True, but a module-level memo changes as it fills
+    """
+    module = sys.modules.get(func.__module__)
+    names = vars(module) if module is not None else func.__globals__
+    return {
+        name: value for name, value in names.items()
+        if name.isupper() and not name.startswith('_') and isinstance(value, (str, int, float, dict, list, tuple)) and _is_plain(value)
+    }
+
+
+def job_key(job):
+    """Content address for a ChartJob"""
+    import matplotlib
+
+    digest = hashlib.sha256()
+    _update_digest(digest, ('v', CACHE_VERSION, matplotlib.__version__))
+    _update_digest(digest, function_fingerprint(job.func))
+    _update_digest(digest, style_constants(job.func))
+    _update_digest(digest, {key: str(matplotlib.rcParams[key]) for key in STYLE_RCPARAMS})
+    _update_digest(digest, job.args)
+    _update_digest(digest, job.kwargs)
+    _update_digest(digest, job.inputs)
+    _update_digest(digest, (job.dpi, job.width_in, job.ppi, job.quantize))
+    return digest.hexdigest()
+
+
+# ============================================================================
+# CACHE
+# ============================================================================
+
+class RenderCache:
+    """
+    PNG bytes on disk, one file per content key
+    Hits refresh the file's mtime; when the directory exceeds max_bytes the least recently used files go first
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR, max_bytes=MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key[:2], f"{key}.png")
+
+    def get(self, key):
+        """PNG bytes for `key`, or None"""
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            self.misses += 1
+            return None
+        os.utime(path)
+        self.hits += 1
+        return data
+
+    def put(self, key, data):
+        """Store PNG bytes and evict down to the size bound"""
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        self.evict()
+
+    def entries(self):
+        """(mtime, size, path) for every cached PNG"""
+        result = []
+        if not os.path.isdir(self.cache_dir):
+            return result
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if name.endswith('.png'):
+                    path = os.path.join(root, name)
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue
+                    result.append((stat.st_mtime, stat.st_size, path))
+        return result
+
+    def evict(self):
+        """Delete least recently used entries until the cache fits in max_bytes"""
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return 0
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        return removed
+
+    def size_bytes(self):
+        return sum(size for _, size, _ in self.entries())
+
+    def clear(self):
+        for _, _, path in self.entries():
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Inspect or clear the chart render cache")
+    parser.add_argument('--clear', action='store_true', help="delete every cached render")
+    args = parser.parse_args()
+
+    cache = RenderCache()
+    if args.clear:
+        cache.clear()
+        print(f"🧹 Cleared {cache.cache_dir}")
+    else:
+        entries = cache.entries()
+        print(f"🗂️  {len(entries)} renders, {cache.size_bytes() / 1024 / 1024:.1f} MB "
+              f"of {cache.max_bytes / 1024 / 1024:.0f} MB in {cache.cache_dir}")
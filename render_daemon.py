@@ -0,0 +1,550 @@
+#!/usr/bin/env python3
+"""
+KAGR Case Competition - Render Daemon
+One long-running process keeps matplotlib (with its font cache), plotly, python-pptx, the slide template and the
+loaded workbook warm, and serves chart and deck builds over local HTTP, on a per-user Unix socket by default.
+Decks are only written inside the directory fixed when the daemon starts, and only JSON POSTs are accepted,
+so a web page cannot trigger builds or a shutdown. The same script is the client, which imports only the
+standard library.
+"""
+
+import argparse
+import contextlib
+import http.client
+import http.server
+import io
+import json
+import os
+import socket
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+import traceback
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = int(os.environ.get('KAGR_DAEMON_PORT', 8765))
+
+# Owner-only Unix socket unless --tcp (platforms without AF_UNIX always use TCP)
+UNIX_SOCKETS = hasattr(socket, 'AF_UNIX')
+DEFAULT_SOCKET = os.environ.get('KAGR_DAEMON_SOCKET') or (
+    os.path.join(os.environ.get('XDG_RUNTIME_DIR') or tempfile.gettempdir(), f"kagr-render-{os.getuid()}.sock")
+    if UNIX_SOCKETS else None)
+SOCKET_UMASK = 0o177
+
+# Host headers accepted over TCP (anything else is a DNS-rebinding page talking to 127.0.0.1)
+LOCAL_HOSTS = ('127.0.0.1', 'localhost', '[::1]')
+
+# Client-side wait for one build (a cold full deck renders every chart)
+REQUEST_TIMEOUT = 600
+MAX_REQUEST_BYTES = 1 << 16
+
+DECK_KINDS = ('presentation', 'school', 'sport')
+ENTITY_BY = {'school': 'University', 'sport': 'Sport'}
+
+# Full-slide width of an entity chart requested on its own
+ENTITY_CHART_WIDTH_IN = 9
+
+# ============================================================================
+# SERVICE (the warm state; everything heavy is imported here, never by the client)
+# ============================================================================
+
+class RenderService:
+    """
+    Chart and deck builds inside one warm process
+    Builds run one at a time: pyplot is not thread-safe, and each build gets its own rcParams context so that
+    one deck's style cannot leak into the next build or its render-cache key.
+    A changed workbook drops every in-process copy of the data before the next build.
+    """
+
+    def __init__(self, preload_data=True, workers=1, out_dir='.'):
+        self.preload_data = preload_data
+        self.workers = workers
+        self.out_dir = os.path.realpath(out_dir)
+        self.started = time.time()
+        self.builds = 0
+        self.reloads = 0
+        self.lock = threading.Lock()
+        self.cache = None
+        self._workbook = None
+        self._metrics = {}   # 'University' / 'Sport' -> {name: deck metrics}
+
+    def warm(self):
+        """Import, resolve fonts, parse the pptx template and (optionally) load the data, once"""
+        import batch_decks
+        import create_presentation
+        import matplotlib
+        import plotly.graph_objects  # noqa: F401 (imported to be warm)
+        import plotly_static  # noqa: F401
+        from render_cache import RenderCache
+
+        # Agg backend, the base .pptx in memory, the shared media cache, and a first default-style draw
+        batch_decks._init_worker()
+        # The deck style's Arial/Helvetica/DejaVu lookup, regular and bold
+        with matplotlib.rc_context():
+            plt = create_presentation.chart_pyplot()
+            fig, ax = plt.subplots()
+            ax.set_title('warm-up', weight='bold')
+            ax.text(0.5, 0.5, '$1.0M')
+            fig.canvas.draw()
+            plt.close(fig)
+
+        self.cache = RenderCache()
+        self._workbook = self._workbook_stat()
+        if self.preload_data:
+            self._load_data()
+
+    def _load_data(self):
+        from aggregate_cube import load_cube
+        from data_loader import DATA_FILE
+        from survey_engine import load_survey_engine
+
+        load_cube(DATA_FILE)
+        load_survey_engine(DATA_FILE)
+
+    @staticmethod
+    def _workbook_stat():
+        from data_loader import DATA_FILE
+
+        stat = os.stat(DATA_FILE)
+        return stat.st_size, stat.st_mtime_ns
+
+    def refresh(self):
+        """Forget the loaded frames, cube, survey engine and deck metrics if the workbook changed on disk"""
+        current = self._workbook_stat()
+        if current == self._workbook:
+            return False
+        import data_loader
+
+        data_loader.reset_cache()
+        self._metrics.clear()
+        self._workbook = current
+        self.reloads += 1
+        if self.preload_data:
+            self._load_data()
+        return True
+
+    # ------------------------------------------------------------------------
+    # Catalog
+    # ------------------------------------------------------------------------
+
+    def _entities(self, by):
+        """batch_decks metrics for every university or sport, computed once per workbook"""
+        import batch_decks
+        from data_loader import load_sports_data
+
+        if by not in ENTITY_BY.values():
+            raise ValueError(f"Unknown breakdown {by!r}; one of: {', '.join(ENTITY_BY.values())}")
+        if by not in self._metrics:
+            metrics = batch_decks.batch_metrics(load_sports_data(), by)
+            self._metrics[by] = {m['name']: m for m in metrics}
+        return self._metrics[by]
+
+    def entity_metrics(self, name, by):
+        """Metrics for one university or sport; the name may be omitted when there is only one"""
+        entities = self._entities(by)
+        if name is None and len(entities) == 1:
+            name = next(iter(entities))
+        if name not in entities:
+            raise KeyError(f"Unknown {by.lower()} {name!r}; one of: {', '.join(entities)}")
+        return entities[name]
+
+    def catalog(self):
+        import batch_decks
+        import create_presentation
+        import generate_visualizations as gv
+
+        with self.lock:
+            self.refresh()
+            return {
+                'visualizations': [task.name for task in gv.TASKS],
+                'presentation': [func.__name__ for func in create_presentation.CHART_BUILDERS],
+                'entity': list(batch_decks.CHARTS),
+                'schools': list(self._entities('University')),
+                'sports': list(self._entities('Sport')),
+                'decks': list(DECK_KINDS),
+            }
+
+    # ------------------------------------------------------------------------
+    # Builds
+    # ------------------------------------------------------------------------
+
+    def _chart_job(self, name, entity, by, width_in, ppi, quantize):
+        import batch_decks
+        import create_presentation
+        from render_pool import ChartJob
+
+        jobs = {job.name: job for job in create_presentation.chart_jobs(ppi=ppi, quantize=quantize)}
+        if name in jobs:
+            job = jobs[name]
+            if width_in:
+                job.width_in = width_in
+            return job
+        if name in batch_decks.CHARTS:
+            metrics = self.entity_metrics(entity, by)
+            return ChartJob(name, batch_decks.CHARTS[name], (metrics['charts'][name],),
+                            width_in=width_in or ENTITY_CHART_WIDTH_IN, ppi=ppi, quantize=quantize)
+        raise KeyError(f"Unknown chart {name!r}; see `render_daemon.py charts`")
+
+    def chart(self, name, entity=None, by='University', width_in=None, ppi=None, quantize=False):
+        """(PNG bytes, served from the render cache?) for one chart"""
+        import generate_visualizations as gv
+        import matplotlib
+        import plotly_static
+        from render_pool import DEFAULT_PPI, render_charts
+
+        with self.lock:
+            self.refresh()
+            hits = self.cache.hits
+            if name in gv.TASKS_BY_NAME:
+                # Exported through the daemon's one kaleido process; RuntimeError (503) when kaleido is missing
+                png, = plotly_static.render_viz_images([name], width_in or plotly_static.STATIC_WIDTH_IN,
+                                                       ppi or DEFAULT_PPI, quantize, cache=self.cache).values()
+            else:
+                job = self._chart_job(name, entity, by, width_in, ppi or DEFAULT_PPI, quantize)
+                with matplotlib.rc_context():
+                    png, = render_charts([job], workers=1, cache=self.cache)
+            self.builds += 1
+            return png, self.cache.hits > hits
+
+    def output_path(self, output):
+        """`output` resolved inside the daemon's out_dir; ValueError for anything else or a non-.pptx file"""
+        path = os.path.realpath(os.path.join(self.out_dir, output))
+        if os.path.commonpath([path, self.out_dir]) != self.out_dir or not path.endswith('.pptx'):
+            raise ValueError(f"Deck output must be a .pptx file inside {self.out_dir}, got {output!r}")
+        return path
+
+    def deck(self, kind, name=None, output=None, stream=False, ppi=None, quantize=False):
+        """Build a deck into `output` (a path inside out_dir); returns (path, the build's console output)"""
+        import batch_decks
+        import create_presentation
+        import matplotlib
+        from render_pool import DEFAULT_PPI
+
+        if kind not in DECK_KINDS:
+            raise ValueError(f"Unknown deck {kind!r}; one of: {', '.join(DECK_KINDS)}")
+        if output:
+            output = self.output_path(output)
+        log = io.StringIO()
+        with self.lock:
+            self.refresh()
+            with matplotlib.rc_context(), contextlib.redirect_stdout(log):
+                if kind == 'presentation':
+                    output = output or self.output_path(os.path.basename(create_presentation.OUTPUT_FILE))
+                    create_presentation.main(self.workers, output_file=output, stream=stream,
+                                             ppi=ppi or DEFAULT_PPI, quantize=quantize)
+                else:
+                    metrics = self.entity_metrics(name, ENTITY_BY[kind])
+                    output = output or self.output_path(f"{batch_decks.slugify(metrics['name'])}.pptx")
+                    batch_decks.build_deck(metrics, batch_decks.DECK_TEMPLATE, output)
+            self.builds += 1
+        return output, log.getvalue()
+
+    def status(self):
+        import data_loader
+
+        return {
+            'pid': os.getpid(),
+            'uptime_s': round(time.time() - self.started, 1),
+            'builds': self.builds,
+            'workbook_reloads': self.reloads,
+            'data_loaded': data_loader._load_typed.cache_info().currsize > 0,
+            'render_cache': {'hits': self.cache.hits, 'misses': self.cache.misses},
+            'busy': self.lock.locked(),
+            'out_dir': self.out_dir,
+        }
+
+# ============================================================================
+# HTTP SERVER
+# ============================================================================
+
+class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """The HTTP handler over a Unix socket (only processes of this user can connect)"""
+    daemon_threads = True
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    server_version = 'KAGRRenderDaemon/1'
+
+    def address_string(self):
+        return self.client_address[0] if self.client_address else 'unix'
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send(self, status, body, content_type='application/json', headers=None):
+        if content_type == 'application/json':
+            body = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _payload(self, *required):
+        length = int(self.headers.get('Content-Length') or 0)
+        if length > MAX_REQUEST_BYTES:
+            raise ValueError(f"Request body over {MAX_REQUEST_BYTES} bytes")
+        payload = json.loads(self.rfile.read(length) or b'{}')
+        if not isinstance(payload, dict):
+            raise ValueError(f"Request body must be a JSON object, not {type(payload).__name__}")
+        missing = [field for field in required if not payload.get(field)]
+        if missing:
+            raise ValueError(f"Missing field(s): {', '.join(missing)}")
+        return payload
+
+    def _refusal(self, route):
+        """Why a request is refused before routing, or None (HTML forms and no-cors fetches cannot send JSON)"""
+        if self.server.tcp and self.headers.get('Host', '').rsplit(':', 1)[0] not in LOCAL_HOSTS:
+            return 403, f"Host {self.headers.get('Host')!r} is not this machine"
+        if route[0] == 'POST':
+            content_type = self.headers.get('Content-Type', '').split(';')[0].strip().lower()
+            if content_type != 'application/json':
+                return 415, f"POST bodies must be application/json, got {content_type or 'none'!r}"
+        return None
+
+    def _dispatch(self, route):
+        service = self.server.service
+        start = time.perf_counter()
+        refusal = self._refusal(route)
+        if refusal:
+            return self._send(refusal[0], {'error': refusal[1]})
+        try:
+            if route == ('GET', '/status'):
+                return self._send(200, service.status())
+            if route == ('GET', '/charts'):
+                return self._send(200, service.catalog())
+            if route == ('POST', '/chart'):
+                p = self._payload('name')
+                png, cached = service.chart(p['name'], p.get('entity'), p.get('by', 'University'),
+                                            p.get('width_in'), p.get('ppi'), p.get('quantize', False))
+                elapsed = f"{(time.perf_counter() - start) * 1000:.1f}"
+                return self._send(200, png, 'image/png', {'X-Render-Cached': int(cached), 'X-Render-Ms': elapsed})
+            if route == ('POST', '/deck'):
+                p = self._payload('deck')
+                path, log = service.deck(p['deck'], p.get('name'), p.get('output'), p.get('stream', False),
+                                         p.get('ppi'), p.get('quantize', False))
+                return self._send(200, {'output': path, 'bytes': os.path.getsize(path), 'log': log,
+                                        'ms': round((time.perf_counter() - start) * 1000, 1)})
+            if route == ('POST', '/shutdown'):
+                # Read the (empty) body first: replying and closing with it unread breaks the client's pipe
+                self._payload()
+                self._send(200, {'stopping': os.getpid()})
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+                return None
+            return self._send(404, {'error': f"No route {route[0]} {route[1]}"})
+        except (KeyError, ValueError, TypeError) as exc:
+            message = exc.args[0] if isinstance(exc, KeyError) and exc.args else str(exc)
+            return self._send(400, {'error': message})
+        except RuntimeError as exc:
+            return self._send(503, {'error': str(exc)})
+        except Exception as exc:
+            traceback.print_exc()
+            return self._send(500, {'error': f"{type(exc).__name__}: {exc}"})
+
+    def do_GET(self):
+        self._dispatch(('GET', self.path))
+
+    def do_POST(self):
+        self._dispatch(('POST', self.path))
+
+
+def _socket_in_use(path):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(path)
+        except OSError:
+            return False
+    return True
+
+
+def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, socket_path=None, preload_data=True, workers=1, verbose=False,
+          out_dir='.'):
+    """Warm up, then answer requests until /shutdown or Ctrl-C; decks are written only inside out_dir"""
+    if socket_path and os.path.exists(socket_path):
+        if _socket_in_use(socket_path):
+            raise OSError(f"A daemon is already listening on {socket_path}")
+        os.remove(socket_path)   # left behind by a daemon that was killed
+
+    # Bound before warming up: early clients wait in the listen backlog instead of being refused
+    if socket_path:
+        # Created owner-only: there is no window in which another user could connect
+        umask = os.umask(SOCKET_UMASK)
+        try:
+            server = UnixHTTPServer(socket_path, _Handler)
+        finally:
+            os.umask(umask)
+        where = socket_path
+    else:
+        server = http.server.ThreadingHTTPServer((host, port), _Handler)
+        where = f"http://{host}:{port}"
+    server.tcp = not socket_path
+    service = RenderService(preload_data, workers, out_dir)
+    print("🔥 Warming up (imports, fonts, pptx template" + (", workbook)..." if preload_data else ")..."))
+    start = time.perf_counter()
+    service.warm()
+    print(f"✅ Warm in {time.perf_counter() - start:.1f}s")
+    server.service = service
+    server.verbose = verbose
+    print(f"🚀 Render daemon listening on {where} (pid {os.getpid()}), writing decks to {service.out_dir}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if socket_path and os.path.exists(socket_path):
+            os.remove(socket_path)
+    print("👋 Render daemon stopped")
+
+# ============================================================================
+# CLIENT
+# ============================================================================
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    """http.client over a Unix socket"""
+
+    def __init__(self, socket_path, timeout=REQUEST_TIMEOUT):
+        super().__init__('localhost', timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+def call(method, path, payload=None, host=DEFAULT_HOST, port=DEFAULT_PORT, socket_path=None,
+         timeout=REQUEST_TIMEOUT):
+    """
+    One request to the daemon -> (response, body bytes)
+    Raises ConnectionError when no daemon is listening and RuntimeError with the daemon's message when a build fails
+    """
+    if socket_path:
+        conn = UnixHTTPConnection(socket_path, timeout)
+    else:
+        conn = http.client.HTTPConnection(host, port, timeout=timeout)
+    try:
+        body = json.dumps(payload or {}).encode() if method == 'POST' else None
+        try:
+            conn.request(method, path, body=body, headers={'Content-Type': 'application/json'} if body else {})
+        except (ConnectionRefusedError, FileNotFoundError) as exc:
+            raise ConnectionError(f"No render daemon at {socket_path or f'{host}:{port}'} ({exc})") from None
+        response = conn.getresponse()
+        data = response.read()
+    finally:
+        conn.close()
+    if response.status >= 400:
+        raise RuntimeError(json.loads(data).get('error', f"HTTP {response.status}"))
+    return response, data
+
+
+def _client(args):
+    conn = {'host': args.host, 'port': args.port, 'socket_path': None if args.tcp else args.socket}
+    start = time.perf_counter()
+
+    if args.command == 'status':
+        _, data = call('GET', '/status', **conn)
+        for key, value in json.loads(data).items():
+            print(f"   {key:<18} {value}")
+    elif args.command == 'charts':
+        _, data = call('GET', '/charts', **conn)
+        for group, names in json.loads(data).items():
+            print(f"{group}: {', '.join(names)}")
+    elif args.command == 'chart':
+        by, entity = ('Sport', args.sport) if args.sport else ('University', args.school)
+        payload = {'name': args.name, 'entity': entity, 'by': by, 'width_in': args.width, 'ppi': args.ppi,
+                   'quantize': args.quantize}
+        response, png = call('POST', '/chart', payload, **conn)
+        out = args.out or f"{args.name}.png"
+        with open(out, 'wb') as f:
+            f.write(png)
+        how = 'cached' if response.getheader('X-Render-Cached') == '1' else 'rendered'
+        print(f"✅ {out} ({len(png) / 1024:.0f} KB, {how} in {float(response.getheader('X-Render-Ms')):.0f} ms, "
+              f"{(time.perf_counter() - start) * 1000:.0f} ms round trip)")
+    elif args.command == 'deck':
+        payload = {'deck': args.kind, 'name': args.name, 'output': args.output, 'stream': args.stream,
+                   'ppi': args.ppi, 'quantize': args.quantize}
+        _, data = call('POST', '/deck', payload, **conn)
+        result = json.loads(data)
+        if args.verbose:
+            print(result['log'], end='')
+        print(f"✅ {result['output']} ({result['bytes'] / 1024:.0f} KB, built in {result['ms']:.0f} ms, "
+              f"{(time.perf_counter() - start) * 1000:.0f} ms round trip)")
+    elif args.command == 'stop':
+        _, data = call('POST', '/shutdown', **conn)
+        print(f"👋 Stopping render daemon (pid {json.loads(data)['stopping']})")
+    return 0
+
+
+def main(argv=None):
+    connection = argparse.ArgumentParser(add_help=False)
+    connection.add_argument('--socket', default=DEFAULT_SOCKET,
+                            help="Unix socket path (default: %(default)s; env KAGR_DAEMON_SOCKET)")
+    connection.add_argument('--tcp', action='store_true', default=not UNIX_SOCKETS,
+                            help="use local TCP (--host/--port) instead of the Unix socket")
+    connection.add_argument('--host', default=DEFAULT_HOST, help="TCP host (default: %(default)s)")
+    connection.add_argument('--port', type=int, default=DEFAULT_PORT, help="TCP port (env KAGR_DAEMON_PORT)")
+
+    parser = argparse.ArgumentParser(description="Warm render daemon for charts and decks, and its client")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    serve_parser = commands.add_parser('serve', parents=[connection], help="start the daemon (foreground)")
+    serve_parser.add_argument('--no-preload', action='store_true', help="load the workbook on the first request")
+    serve_parser.add_argument('--workers', type=int, default=1,
+                              help="render processes for full-deck charts (default: render in the warm process)")
+    serve_parser.add_argument('--out-dir', default='.',
+                              help="the only directory decks are written to (default: the current directory)")
+    serve_parser.add_argument('-v', '--verbose', action='store_true', help="log every request")
+
+    commands.add_parser('status', parents=[connection], help="uptime, builds and render cache counters")
+    commands.add_parser('charts', parents=[connection], help="list chart names, schools and sports")
+    commands.add_parser('stop', parents=[connection], help="shut the daemon down")
+
+    chart_parser = commands.add_parser('chart', parents=[connection], help="render one chart to a PNG")
+    chart_parser.add_argument('name', help="visualization, presentation builder or entity chart (see `charts`)")
+    entity = chart_parser.add_mutually_exclusive_group()
+    entity.add_argument('--school', help="university for the entity charts (revenue_mix, utilization)")
+    entity.add_argument('--sport', help="sport for the entity charts")
+    chart_parser.add_argument('--width', type=float, help="slide width in inches")
+    chart_parser.add_argument('--ppi', type=int, help="pixels per inch of slide space")
+    chart_parser.add_argument('--quantize', action='store_true', help="optimized 256-color PNG")
+    chart_parser.add_argument('--out', help="PNG path (default: <name>.png)")
+
+    deck_parser = commands.add_parser('deck', parents=[connection], help="build a deck")
+    deck_parser.add_argument('kind', choices=DECK_KINDS,
+                             help="presentation: the competition deck; school/sport: the batch_decks template")
+    deck_parser.add_argument('--name', help="university or sport for school/sport decks")
+    deck_parser.add_argument('--output',
+                             help="deck file name, relative to the daemon's --out-dir (default: the usual name)")
+    deck_parser.add_argument('--stream', action='store_true', help="stream slides into the file (presentation)")
+    deck_parser.add_argument('--ppi', type=int, help="chart pixels per inch of slide space (presentation)")
+    deck_parser.add_argument('--quantize', action='store_true', help="256-color chart PNGs (presentation)")
+    deck_parser.add_argument('-v', '--verbose', action='store_true', help="print the build's output")
+
+    args = parser.parse_args(argv)
+    if args.command == 'serve':
+        try:
+            serve(args.host, args.port, None if args.tcp else args.socket, not args.no_preload, args.workers,
+                  args.verbose, args.out_dir)
+        except OSError as exc:
+            print(f"❌ Cannot listen: {exc}")
+            return 1
+        return 0
+
+    try:
+        return _client(args)
+    except RuntimeError as exc:
+        print(f"❌ {exc}")
+        return 1
+    except ConnectionError as exc:
+        print(f"❌ {exc}; start one with: python render_daemon.py serve")
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+KAGR Case Competition - Parallel Chart Rendering
+Fans independent matplotlib figure builders out across a process pool and returns PNG bytes in job order
+"""
+
+import argparse
+import io
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import tracing
+from tracing import span
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+NOTEBOOKS_DIR = os.path.join(REPO_DIR, 'notebooks')
+
+DEFAULT_DPI = 300
+
+# Pixels per inch of slide space when a job knows its placement width (sharp on a 4K projector/print)
+DEFAULT_PPI = int(os.environ.get('KAGR_SLIDE_PPI', 200))
+
+# savefig's padding around the tight bounding box
+TIGHT_PAD_INCHES = 0.1
+
+# ============================================================================
+# JOBS
+# ============================================================================
+
+class ChartJob:
+    """
+    One independent figure: a module-level builder plus its arguments
+    The builder must return a matplotlib Figure; it runs inside a worker process
+    `inputs` names data the builder reads on its own (e.g. the workbook hash) so the render cache can key on it
+    `width_in` is the width of the picture on the slide; when given, the PNG is rendered at exactly
+    width_in * ppi pixels wide instead of at `dpi`, and `quantize` stores it as a 256-color palette PNG
+    """
+
+    def __init__(self, name, func, args=(), kwargs=None, dpi=DEFAULT_DPI, inputs=(),
+                 width_in=None, ppi=DEFAULT_PPI, quantize=False):
+        self.name = name
+        self.func = func
+        self.args = tuple(args)
+        self.kwargs = dict(kwargs or {})
+        self.dpi = dpi
+        self.inputs = tuple(inputs)
+        self.width_in = width_in
+        self.ppi = ppi
+        self.quantize = quantize
+
+    def __repr__(self):
+        return f"ChartJob({self.name!r}, {self.func.__module__}.{self.func.__name__})"
+
+
+def _init_worker():
+    """Headless backend and import paths for the builders (repo root and notebooks/)"""
+    import matplotlib
+    matplotlib.use('Agg')
+    for path in (REPO_DIR, NOTEBOOKS_DIR):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+
+
+def placement_dpi(fig, width_in, ppi=DEFAULT_PPI):
+    """DPI at which the tight-cropped figure comes out width_in * ppi pixels wide"""
+    bbox = fig.get_tightbbox(fig.canvas.get_renderer())
+    return width_in * ppi / (bbox.width + 2 * TIGHT_PAD_INCHES)
+
+
+def quantize_png(png):
+    """Re-encode as an optimized 256-color palette PNG (flat chart colors survive; file shrinks ~3x)"""
+    from PIL import Image
+
+    image = Image.open(io.BytesIO(png)).convert('RGB')
+    buf = io.BytesIO()
+    image.quantize(colors=256, method=Image.Quantize.FASTOCTREE).save(buf, format='PNG', optimize=True)
+    return buf.getvalue()
+
+
+def figure_to_png(fig, dpi=DEFAULT_DPI, width_in=None, ppi=DEFAULT_PPI, quantize=False):
+    """
+    Serialize a figure like create_chart_image does and free it
+    With width_in, the DPI is chosen so the image has exactly the pixels its slide box can show
+    """
+    import matplotlib.pyplot as plt
+
+    with span('savefig', 'render') as s:
+        if width_in is not None:
+            dpi = placement_dpi(fig, width_in, ppi)
+        buf = io.BytesIO()
+        fig.savefig(buf, format='png', dpi=dpi, bbox_inches='tight', pad_inches=TIGHT_PAD_INCHES, facecolor='white')
+        plt.close(fig)
+        png = buf.getvalue()
+        if quantize:
+            png = quantize_png(png)
+        s['bytes'] = len(png)
+    return png
+
+
+def render_job(job):
+    """Build and rasterize one chart; runs in a worker (or inline when workers == 1)"""
+    with span(f"chart:{job.name}", 'chart'):
+        with span('build', 'chart'):
+            fig = job.func(*job.args, **job.kwargs)
+        return figure_to_png(fig, job.dpi, job.width_in, job.ppi, job.quantize)
+
+
+def _render_job_traced(job, allocations):
+    """render_job in a worker with its spans shipped back to the tracing parent alongside the PNG"""
+    tracing.enable(allocations)
+    png = render_job(job)
+    return png, tracing.drain()
+
+
+# ============================================================================
+# SCHEDULER
+# ============================================================================
+
+def render_charts(jobs, workers=None, cache=None):
+    """
+    Render every job and return PNG bytes in the same order as `jobs`
+    workers=None uses one process per core; workers=1 renders inline with no pool
+    With a RenderCache, unchanged charts are read back from disk and only misses are rendered
+    """
+    jobs = list(jobs)
+    with span('render_charts', 'render', jobs=len(jobs)) as s:
+        if cache is None:
+            return _render_all(jobs, workers)
+
+        from render_cache import job_key
+
+        keys = [job_key(job) for job in jobs]
+        images = [cache.get(key) for key in keys]
+        pending = [i for i, png in enumerate(images) if png is None]
+        s['cached'] = len(jobs) - len(pending)
+        for i, png in zip(pending, _render_all([jobs[i] for i in pending], workers)):
+            cache.put(keys[i], png)
+            images[i] = png
+        return images
+
+
+def _render_all(jobs, workers):
+    """Render every job, in a pool when there is more than one to do"""
+    if not jobs:
+        return []
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(jobs)))
+
+    if workers == 1:
+        _init_worker()
+        return [render_job(job) for job in jobs]
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        if not tracing.enabled():
+            return list(pool.map(render_job, jobs))
+        results = list(pool.map(_render_job_traced, jobs, [tracing.allocations_enabled()] * len(jobs)))
+    for _, events in results:
+        tracing.merge(events)
+    return [png for png, _ in results]
+
+
+# ============================================================================
+# JOB SETS FOR THE EXISTING BUILDERS
+# ============================================================================
+
+def notebook_chart_jobs(dpi=DEFAULT_DPI):
+    """The nine builders in notebooks/improved_analysis_code.py with their data inputs"""
+    _init_worker()
+    import pandas as pd
+    import improved_analysis_code as ia
+    from aggregate_cube import load_cube
+    from data_loader import load_data, revenue_by_source
+
+    sports_df, survey_df = load_data()
+    cube = load_cube()
+    revenue_streams = revenue_by_source(sports_df)
+    sport_performance = pd.DataFrame({
+        'Total_Revenue_Sum': cube.slice('Sport', 'Total_Revenue', 'sum')
+    })
+
+    return [
+        ChartJob('revenue_donut', ia.create_revenue_donut_chart,
+                 (revenue_streams, sum(revenue_streams.values())), dpi=dpi),
+        ChartJob('sport_performance', ia.create_sport_performance_with_benchmarks,
+                 (sport_performance,), dpi=dpi),
+        ChartJob('industry_benchmark_bullet', ia.create_industry_benchmark_bullet_chart, dpi=dpi),
+        ChartJob('day_of_week_by_sport', ia.analyze_day_of_week_by_sport, (sports_df, cube), dpi=dpi),
+        ChartJob('time_of_day_by_sport', ia.analyze_time_of_day_by_sport, (sports_df, cube), dpi=dpi),
+        ChartJob('womens_bb_opportunity', ia.create_womens_basketball_opportunity_chart,
+                 (sports_df, survey_df, cube), dpi=dpi),
+        ChartJob('normalized_merchandise', ia.create_normalized_merchandise_chart,
+                 (sports_df, cube), dpi=dpi),
+        ChartJob('revenue_waterfall', ia.create_revenue_waterfall_chart, dpi=dpi),
+        ChartJob('corporate_benchmark', ia.create_corporate_benchmark_chart, dpi=dpi),
+    ]
+
+
+def presentation_chart_jobs(dpi=DEFAULT_DPI):
+    """The chart builders used by create_presentation.py"""
+    _init_worker()
+    import create_presentation as cp
+
+    return cp.chart_jobs(dpi)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render the matplotlib charts in parallel")
+    parser.add_argument('--set', choices=['notebook', 'presentation', 'all'], default='all')
+    parser.add_argument('--workers', type=int, default=None, help="processes (default: one per core)")
+    parser.add_argument('--dpi', type=int, default=DEFAULT_DPI)
+    parser.add_argument('--out', default='charts', help="directory for the PNG files")
+    parser.add_argument('--no-cache', action='store_true', help="re-render every chart")
+    args = parser.parse_args()
+
+    jobs = []
+    if args.set in ('notebook', 'all'):
+        jobs += notebook_chart_jobs(args.dpi)
+    if args.set in ('presentation', 'all'):
+        jobs += presentation_chart_jobs(args.dpi)
+
+    print(f"🎨 Rendering {len(jobs)} charts with {args.workers or os.cpu_count()} workers...")
+    cache = None
+    if not args.no_cache:
+        from render_cache import RenderCache
+        cache = RenderCache()
+
+    start = time.perf_counter()
+    images = render_charts(jobs, args.workers, cache)
+    elapsed = time.perf_counter() - start
+
+    os.makedirs(args.out, exist_ok=True)
+    for i, (job, png) in enumerate(zip(jobs, images), 1):
+        path = os.path.join(args.out, f"{i:02d}_{job.name}.png")
+        with open(path, 'wb') as f:
+            f.write(png)
+        print(f"✅ {path} ({len(png) / 1024:,.0f} KB)")
+    if cache is not None:
+        print(f"\n🗂️  Render cache: {cache.hits} hits, {cache.misses} rendered")
+    print(f"⏱️  {elapsed:.1f}s total")
+
+
+if __name__ == "__main__":
+    main()
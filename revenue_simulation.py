@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+KAGR Case Competition - Monte Carlo Revenue Projection
+Samples every initiative's annual uplift from a triangular (low, most likely, high) distribution and runs
+millions of scenarios as chunked NumPy arrays: P10/P50/P90 waterfall bands and the chance of clearing the target
+"""
+
+import argparse
+import json
+import time
+
+import numpy as np
+
+from initiatives import BASE_REVENUE, INITIATIVES, SETTLEMENT_TARGET, step_label
+
+DEFAULT_SCENARIOS = 1_000_000
+DEFAULT_CHUNK = 250_000
+QUANTILES = (0.10, 0.50, 0.90)
+
+# ============================================================================
+# SAMPLING
+# ============================================================================
+
+def initiative_table(initiatives=INITIATIVES):
+    """(names, low, mode, high) as arrays, validated so that low <= mode <= high"""
+    names = [row[0] for row in initiatives]
+    low, mode, high = (np.array([row[i] for row in initiatives], dtype=np.float64) for i in (1, 2, 3))
+    bad = [name for name, lo, mo, hi in zip(names, low, mode, high) if not lo <= mo <= hi]
+    if bad:
+        raise ValueError(f"Initiative ranges must satisfy low <= most likely <= high: {', '.join(bad)}")
+    return names, low, mode, high
+
+
+def triangular_ppf(u, low, mode, high):
+    """Inverse CDF of the triangular distribution, broadcast column-wise over a (scenarios, initiatives) array"""
+    width = high - low
+    split = np.divide(mode - low, width, out=np.zeros_like(width), where=width > 0)
+    rising = u < split
+    # One square root per draw: the distance from whichever end of the range the draw falls under
+    offset = np.where(rising, u * (width * (mode - low)), (1 - u) * (width * (high - mode)))
+    np.sqrt(offset, out=offset)
+    return np.where(rising, low + offset, high - offset)
+
+
+def sample_uplifts(rng, n, low, mode, high):
+    """(n, initiatives) float32 uplifts in $M (float32 halves the work; $M need nowhere near 7 digits)"""
+    low, mode, high = (np.asarray(a, dtype=np.float32) for a in (low, mode, high))
+    return triangular_ppf(rng.random((n, len(low)), dtype=np.float32), low, mode, high)
+
+# ============================================================================
+# SIMULATION
+# ============================================================================
+
+class Projection:
+    """
+    Result of one simulation run
+    `bands` has one row per waterfall step (base, each initiative, projected total) with the uplift and the
+    cumulative revenue at each quantile; `p_target` is the share of scenarios whose total uplift clears the target
+    """
+
+    def __init__(self, bands, p_target, scenarios, seconds, base, target, seed):
+        self.bands = bands
+        self.p_target = p_target
+        self.scenarios = scenarios
+        self.seconds = seconds
+        self.base = base
+        self.target = target
+        self.seed = seed
+
+    def to_dict(self):
+        return {
+            'scenarios': self.scenarios,
+            'seed': self.seed,
+            'seconds': self.seconds,
+            'base': self.base,
+            'target': self.target,
+            'p_target': self.p_target,
+            'bands': self.bands.reset_index().to_dict(orient='records'),
+        }
+
+
+def simulate(n=DEFAULT_SCENARIOS, initiatives=INITIATIVES, base=BASE_REVENUE, target=SETTLEMENT_TARGET,
+             seed=None, chunk=DEFAULT_CHUNK):
+    """
+    Run `n` independent scenarios in chunks of `chunk` rows
+    Only the running cumulative revenue (float32, one row per step) is kept, so memory is ~4 bytes per
+    scenario per initiative; uplift quantiles come straight from each distribution's inverse CDF
+    """
+    import pandas as pd
+
+    start = time.perf_counter()
+    names, low, mode, high = initiative_table(initiatives)
+    rng = np.random.default_rng(seed)
+
+    # Step-major so each step's quantiles read one contiguous row
+    cumulative = np.empty((len(names), n), dtype=np.float32)
+    cleared = 0
+    for lo in range(0, n, chunk):
+        hi = min(lo + chunk, n)
+        uplift = np.cumsum(sample_uplifts(rng, hi - lo, low, mode, high), axis=1)
+        cleared += int(np.count_nonzero(uplift[:, -1] >= target))
+        cumulative[:, lo:hi] = uplift.T
+    cumulative += np.float32(base)
+
+    levels = np.asarray(QUANTILES)
+    cum_q = np.quantile(cumulative, levels, axis=1).astype(np.float64)  # (quantiles, initiatives)
+    uplift_q = triangular_ppf(levels[:, None], low, mode, high)
+    columns = [f"P{round(q * 100)}" for q in QUANTILES]
+
+    rows = [['Current Revenue', 'absolute'] + [base] * len(levels) + [base] * len(levels) + [base]]
+    means = (low + mode + high) / 3
+    for i, name in enumerate(names):
+        rows.append([name, 'relative'] + list(uplift_q[:, i]) + list(cum_q[:, i]) +
+                    [base + means[:i + 1].sum()])
+    rows.append(['Projected Revenue', 'total'] + list(cum_q[:, -1] - base) + list(cum_q[:, -1]) +
+                [base + means.sum()])
+    bands = pd.DataFrame(rows, columns=['Step', 'Measure'] + [f"Uplift_{c}" for c in columns] +
+                         [f"Cumulative_{c}" for c in columns] + ['Cumulative_Mean']).set_index('Step')
+
+    return Projection(bands, cleared / n, n, time.perf_counter() - start, base, target, seed)
+
+# ============================================================================
+# CHART
+# ============================================================================
+
+def plot_waterfall_bands(projection):
+    """Waterfall of median uplifts with P10-P90 whiskers on the running total and the settlement target line"""
+    import matplotlib.pyplot as plt
+
+    bands = projection.bands
+    steps = list(bands.index)
+    fig, ax = plt.subplots(figsize=(16, 9))
+
+    previous = 0.0
+    for i, (step, row) in enumerate(bands.iterrows()):
+        median = row['Cumulative_P50']
+        if row['Measure'] == 'relative':
+            ax.bar(i, median - previous, bottom=previous, color='#2ca02c', edgecolor='black', linewidth=1.5,
+                   width=0.7)
+            ax.text(i, (median + previous) / 2, f"+${median - previous:.1f}M", ha='center', va='center',
+                    fontsize=11, weight='bold', color='white')
+        else:
+            ax.bar(i, median, color='#1f77b4' if i == 0 else '#ff7f0e', edgecolor='black', linewidth=1.5,
+                   width=0.7)
+        ax.errorbar(i, median, yerr=[[median - row['Cumulative_P10']], [row['Cumulative_P90'] - median]],
+                    fmt='none', ecolor='black', elinewidth=2, capsize=8)
+        previous = median
+
+    total = bands.iloc[-1]
+    ax.text(len(steps) - 1, total['Cumulative_P90'] + 1.5,
+            f"P10 ${total['Cumulative_P10']:.1f}M\nP50 ${total['Cumulative_P50']:.1f}M\n"
+            f"P90 ${total['Cumulative_P90']:.1f}M", ha='center', va='bottom', fontsize=11, weight='bold')
+
+    target = projection.base + projection.target
+    ax.axhline(target, color='#d62728', linestyle='--', linewidth=2.5, alpha=0.7,
+               label=f"NCAA Settlement Target: ${target:.1f}M")
+    ax.set_xticks(range(len(steps)))
+    ax.set_xticklabels([step_label(step) for step in steps], fontsize=11, weight='bold')
+    ax.set_ylabel('Revenue (Millions $)', fontsize=14, weight='bold')
+    ax.set_ylim(projection.base * 0.8, total['Cumulative_P90'] * 1.08)
+    ax.set_title(f"Revenue Projection: {projection.scenarios:,} scenarios, "
+                 f"{projection.p_target:.1%} clear the ${projection.target:.1f}M target",
+                 fontsize=16, weight='bold', pad=20)
+    ax.legend(fontsize=12, loc='upper left')
+    ax.grid(axis='y', alpha=0.3)
+    fig.tight_layout()
+    return fig
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def parse_override(text):
+    """'Name=low,most_likely,high' -> (name, low, mode, high)"""
+    name, _, values = text.partition('=')
+    try:
+        low, mode, high = (float(v) for v in values.split(','))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected Name=low,most_likely,high, got {text!r}")
+    return name.strip(), low, mode, high
+
+
+def apply_overrides(initiatives, overrides):
+    """Replace (or add) initiatives by name"""
+    table = {row[0]: row for row in initiatives}
+    for row in overrides:
+        table[row[0]] = row
+    return tuple(table.values())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Monte Carlo projection of the revenue waterfall")
+    parser.add_argument('-n', '--scenarios', type=int, default=DEFAULT_SCENARIOS,
+                        help=f"number of scenarios (default {DEFAULT_SCENARIOS:,})")
+    parser.add_argument('--seed', type=int, default=None, help="random seed for a reproducible run")
+    parser.add_argument('--target', type=float, default=SETTLEMENT_TARGET, help="new revenue to clear, $M")
+    parser.add_argument('--set', dest='overrides', action='append', type=parse_override, default=[],
+                        metavar='NAME=LOW,LIKELY,HIGH', help="override (or add) one initiative's range, $M")
+    parser.add_argument('--json', help="write the bands and target probability to this file")
+    parser.add_argument('--plot', help="save the waterfall with P10-P90 bands to this PNG")
+    args = parser.parse_args(argv)
+
+    initiatives = apply_overrides(INITIATIVES, args.overrides)
+    print(f"🎲 Simulating {args.scenarios:,} scenarios across {len(initiatives)} initiatives...")
+    projection = simulate(args.scenarios, initiatives, target=args.target, seed=args.seed)
+
+    print(f"\n📊 Waterfall bands ($M):")
+    print(projection.bands.drop(columns='Measure').to_string(float_format=lambda x: f"{x:,.2f}"))
+    total = projection.bands.iloc[-1]
+    print(f"\n🎯 P(new revenue >= ${args.target:.1f}M): {projection.p_target:.1%}")
+    print(f"   New revenue P10/P50/P90: ${total['Uplift_P10']:.1f}M / ${total['Uplift_P50']:.1f}M / "
+          f"${total['Uplift_P90']:.1f}M")
+    print(f"⏱️  {projection.seconds:.2f}s")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(projection.to_dict(), f, indent=2)
+        print(f"✅ Wrote {args.json}")
+    if args.plot:
+        import matplotlib
+        matplotlib.use('Agg')
+        plot_waterfall_bands(projection).savefig(args.plot, dpi=150, bbox_inches='tight')
+        print(f"✅ Wrote {args.plot}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+KAGR Case Competition - Streaming Ingestion
+Reads large CSV/Parquet event exports in bounded-size chunks and folds them into running per-Sport/per-Venue aggregates
+"""
+
+import argparse
+import sys
+
+import numpy as np
+import pandas as pd
+
+from data_loader import COUNT_COLUMNS, REVENUE_COLUMNS, add_sports_features
+
+DEFAULT_CHUNKSIZE = 250_000
+DEFAULT_GROUP_KEYS = ('Sport', 'Venue')
+
+# Only the columns needed for the features and aggregates (plus any other group keys) are read from disk
+INPUT_COLUMNS = ['Sport', 'Venue', 'Attendance', 'Venue_Capacity'] + REVENUE_COLUMNS
+
+SUM_COLUMNS = ['Attendance', 'Venue_Capacity'] + REVENUE_COLUMNS
+
+# ============================================================================
+# CHUNK READERS
+# ============================================================================
+
+def _iter_csv(path, chunksize, columns):
+    """Yield DataFrame chunks from a CSV file"""
+    yield from pd.read_csv(path, usecols=lambda c: c in columns, chunksize=chunksize)
+
+
+def _iter_parquet(path, chunksize, columns):
+    """Yield DataFrame chunks from a Parquet file, one record batch at a time"""
+    import pyarrow.parquet as pq
+
+    parquet_file = pq.ParquetFile(path)
+    available = [c for c in columns if c in parquet_file.schema_arrow.names]
+    for batch in parquet_file.iter_batches(batch_size=chunksize, columns=available):
+        yield batch.to_pandas()
+
+
+def iter_chunks(path, chunksize=DEFAULT_CHUNKSIZE, columns=INPUT_COLUMNS):
+    """Yield bounded-size DataFrame chunks from a CSV or Parquet export"""
+    name = path.lower()
+    if name.endswith(('.parquet', '.pq')):
+        return _iter_parquet(path, chunksize, list(columns))
+    if name.endswith(('.csv', '.csv.gz', '.txt')):
+        return _iter_csv(path, chunksize, set(columns))
+    raise ValueError(f"Unsupported input format for streaming: {path}")
+
+
+def prepare_chunk(chunk):
+    """
+    Cast one chunk to the loader's compact count dtypes and add the engineered features
+    Revenues stay float64 (not the loader's float32) because the running totals are summed from them
+    """
+    for col in COUNT_COLUMNS:
+        if col in chunk.columns:
+            chunk[col] = chunk[col].fillna(0).astype(np.int32)
+    for col in REVENUE_COLUMNS:
+        if col in chunk.columns:
+            chunk[col] = chunk[col].fillna(0).astype(np.float64)
+    return add_sports_features(chunk)
+
+
+# ============================================================================
+# RUNNING AGGREGATES
+# ============================================================================
+
+def group_sums(chunk, key):
+    """Additive per-group sums and counts for one feature-engineered chunk"""
+    grouped = chunk.groupby(key, observed=True, sort=False)
+    # float64 sums of the float64 revenue columns; Total_Revenue adds up those sums rather than the float32
+    # per-event feature, so streamed totals match a float64 sum of the source to the cent
+    part = chunk[SUM_COLUMNS].astype(np.float64).groupby(
+        chunk[key], observed=True, sort=False).sum()
+    part['Total_Revenue'] = part[REVENUE_COLUMNS].sum(axis=1)
+    part['Events'] = grouped.size()
+    part['Utilization_Sum'] = grouped['Venue_Utilization'].sum()
+    part['Revenue_per_Attendee_Sum'] = grouped['Revenue_per_Attendee'].sum()
+    part['Revenue_per_Attendee_Count'] = grouped['Revenue_per_Attendee'].count()
+    return part
+
+
+class RunningAggregates:
+    """
+    Additive per-group accumulator
+    Only sums and counts are kept, so memory grows with the number of groups, never with the input
+    """
+
+    def __init__(self, key):
+        self.key = key
+        self.totals = None
+
+    def update(self, chunk):
+        """Fold one feature-engineered chunk into the running totals"""
+        part = group_sums(chunk, self.key)
+        if self.totals is None:
+            self.totals = part
+        else:
+            self.totals = self.totals.add(part, fill_value=0)
+
+    def subtract(self, chunk):
+        """Remove a previously folded chunk's contribution (used for corrections)"""
+        if self.totals is None or len(chunk) == 0:
+            return
+        part = group_sums(chunk, self.key)
+        self.totals = self.totals.sub(part, fill_value=0)
+        self.totals = self.totals[self.totals['Events'] > 0]
+
+    def result(self):
+        """Sums plus the per-event means used by the dashboards"""
+        if self.totals is None:
+            return pd.DataFrame()
+        df = self.totals.copy()
+        df['Events'] = df['Events'].astype(np.int64)
+        df['Avg_Attendance'] = df['Attendance'] / df['Events']
+        df['Avg_Utilization'] = df['Utilization_Sum'] / df['Events']
+        df['Avg_Revenue_per_Attendee'] = (df['Revenue_per_Attendee_Sum'] /
+                                          df['Revenue_per_Attendee_Count'].replace(0, np.nan))
+        df = df.drop(columns=['Utilization_Sum', 'Revenue_per_Attendee_Sum',
+                              'Revenue_per_Attendee_Count'])
+        return df.sort_values('Total_Revenue', ascending=False)
+
+
+def stream_aggregates(path, group_keys=DEFAULT_GROUP_KEYS, chunksize=DEFAULT_CHUNKSIZE):
+    """
+    Stream an event export and return {group key: aggregate DataFrame}
+    Peak memory is bounded by one chunk plus the (small) per-group totals
+    """
+    columns = INPUT_COLUMNS + [key for key in group_keys if key not in INPUT_COLUMNS]
+    aggregates = {key: RunningAggregates(key) for key in group_keys}
+    for chunk in iter_chunks(path, chunksize, columns):
+        missing = [key for key in group_keys if key not in chunk.columns]
+        if missing:
+            raise ValueError(f"{path} has no group key column(s) {missing}")
+        chunk = prepare_chunk(chunk)
+        for agg in aggregates.values():
+            agg.update(chunk)
+        del chunk
+    return {key: agg.result() for key, agg in aggregates.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stream a CSV/Parquet event export into per-Sport/per-Venue aggregates")
+    parser.add_argument('path', help="CSV or Parquet export with the midwest_state_sports schema")
+    parser.add_argument('--chunksize', type=int, default=DEFAULT_CHUNKSIZE,
+                        help=f"rows per chunk (default {DEFAULT_CHUNKSIZE:,})")
+    parser.add_argument('--by', nargs='+', default=list(DEFAULT_GROUP_KEYS),
+                        help="group keys to aggregate on")
+    args = parser.parse_args()
+
+    print(f"📂 Streaming {args.path} in chunks of {args.chunksize:,} rows...")
+    try:
+        results = stream_aggregates(args.path, args.by, args.chunksize)
+    except ValueError as exc:
+        print(f"❌ {exc}")
+        return 1
+
+    for key, df in results.items():
+        print(f"\n📊 By {key}:")
+        print(df[['Events', 'Attendance', 'Total_Revenue', 'Avg_Utilization',
+                  'Avg_Revenue_per_Attendee']].to_string(float_format=lambda x: f"{x:,.2f}"))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+KAGR Case Competition - Survey Analytics Engine
+Encodes the Customer Experience Survey once into compact answer matrices and precomputes weighted crosstabs
+over Customer Type x age band x companion, so any segment query is an array lookup
+"""
+
+import functools
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+from data_loader import DATA_FILE, SURVEY_FLAG_PREFIXES, SURVEY_SCORE_PREFIXES, load_data, register_derived_cache
+from tracing import span
+
+ALL = 'All'
+
+AGE_BINS = [0, 25, 35, 45, 55, 200]
+AGE_BANDS = ['18-24', '25-34', '35-44', '45-54', '55+']
+
+COMPANION_PREFIX = 'Attended with: '
+COMPANIONS = ['Friends', 'Family', 'Work Colleagues']
+NO_COMPANION = 'None of these'
+
+INTEREST_PREFIX = 'Sport Interest: '
+ATTENDED_QUESTION = 'Have you attended 1 or more games this year for your favorite sport(s)?'
+
+# Y/N-style answers; anything else (N/A, blank) counts as not answered
+ANSWER_CODES = {'Y': 1, 'YES': 1, 'N': 0, 'NO': 0}
+
+DIMENSIONS = ('Customer Type', 'Age Band', 'Companion')
+
+# ============================================================================
+# ENCODING
+# ============================================================================
+
+def encode_answers(series):
+    """int8 codes: 1 = Y/Yes, 0 = N/No, -1 = N/A or blank"""
+    cats = series.astype('category')
+    lut = np.array([ANSWER_CODES.get(str(c).strip().upper(), -1) for c in cats.cat.categories] + [-1],
+                   dtype=np.int8)
+    return lut[cats.cat.codes.to_numpy()]
+
+
+def _membership(codes, levels):
+    """(respondents, levels + 1) float one-hot with a trailing all-ones 'All' column; code -1 matches no level"""
+    member = np.zeros((len(codes), len(levels) + 1))
+    valid = codes >= 0
+    member[np.flatnonzero(valid), codes[valid]] = 1
+    member[:, -1] = 1
+    return member
+
+# ============================================================================
+# ENGINE
+# ============================================================================
+
+class SurveyEngine:
+    """
+    Every cell of Customer Type x Age Band x Companion (each with an 'All' level) holds, per question,
+    weighted yes/answered counts for the Y/N questions and weighted sums/answered counts for the scores.
+    Companion is multi-select: a respondent who came with friends and family sits in both cells, and
+    'None of these' holds respondents who ticked none of the three
+    """
+
+    def __init__(self, survey_df, weights=None):
+        self.respondents = len(survey_df)
+        self.weights = self._weights(survey_df, weights)
+
+        # One pass to encode the answers
+        self.flag_questions = [c for c in survey_df.columns if c.startswith(SURVEY_FLAG_PREFIXES) or
+                               c == ATTENDED_QUESTION]
+        self.score_questions = [c for c in survey_df.columns if c.startswith(SURVEY_SCORE_PREFIXES)]
+        self.flags = np.stack([encode_answers(survey_df[c]) for c in self.flag_questions], axis=1)
+        self.scores = survey_df[self.score_questions].to_numpy(dtype=np.float32)
+
+        # Segment membership
+        types = survey_df['Customer Type'].astype('category')
+        bands = pd.cut(survey_df['Age'], AGE_BINS, right=False, labels=AGE_BANDS)
+        companion = np.stack([encode_answers(survey_df[COMPANION_PREFIX + c]) for c in COMPANIONS], axis=1)
+        self.levels = {
+            'Customer Type': [str(c) for c in types.cat.categories] + [ALL],
+            'Age Band': AGE_BANDS + [ALL],
+            'Companion': COMPANIONS + [NO_COMPANION, ALL],
+        }
+        self._index = {dim: {level: i for i, level in enumerate(levels)} for dim, levels in self.levels.items()}
+        with_none = np.hstack([companion == 1, (companion != 1).all(axis=1, keepdims=True)]).astype(float)
+        members = [
+            _membership(types.cat.codes.to_numpy(), self.levels['Customer Type'][:-1]),
+            _membership(bands.cat.codes.to_numpy(), AGE_BANDS),
+            np.hstack([with_none, np.ones((self.respondents, 1))]),
+        ]
+
+        # Every cell of every question in one contraction over respondents
+        yes = (self.flags == 1).astype(float)
+        answered = (self.flags >= 0).astype(float)
+        score_answered = ~np.isnan(self.scores)
+        scores = np.where(score_answered, self.scores, 0).astype(float)
+        w = self.weights
+
+        def cells(values):
+            return np.einsum('r,rt,ra,rc,rq->tacq', w, *members, values, optimize=True)
+
+        self.respondent_counts = np.einsum('rt,ra,rc->tac', *members, optimize=True)
+        self.flag_yes = cells(yes)
+        self.flag_answered = cells(answered)
+        self.score_sum = cells(scores)
+        self.score_count = cells(score_answered.astype(float))
+
+    @staticmethod
+    def _weights(survey_df, weights):
+        """Per-respondent weights from None (all 1), a column name, or an array"""
+        if weights is None:
+            return np.ones(len(survey_df))
+        if isinstance(weights, str):
+            weights = survey_df[weights]
+        return np.asarray(weights, dtype=np.float64)
+
+    # ------------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------------
+
+    def _cell(self, customer_type=ALL, age_band=ALL, companion=ALL):
+        try:
+            return (self._index['Customer Type'][customer_type], self._index['Age Band'][age_band],
+                    self._index['Companion'][companion])
+        except KeyError as exc:
+            raise KeyError(f"Unknown segment level {exc.args[0]!r}; levels: {self.levels}") from None
+
+    @staticmethod
+    def _matches(question, questions):
+        """Positions of the questions a name picks: the full name, else suffixes ('Football'), else prefixes"""
+        if question in questions:
+            return [questions.index(question)]
+        suffixes = [i for i, q in enumerate(questions) if q.strip().endswith(question)]
+        return suffixes or [i for i, q in enumerate(questions) if q.strip().startswith(question)]
+
+    def _question(self, question, questions):
+        """Column position of a question: full name, unique suffix ('Football') or prefix ('Overall Satisfaction')"""
+        matches = self._matches(question, questions)
+        if len(matches) != 1:
+            raise KeyError(f"{'Ambiguous' if matches else 'Unknown'} survey question: {question!r}")
+        return matches[0]
+
+    def share(self, question, customer_type=ALL, age_band=ALL, companion=ALL):
+        """Weighted % answering Y/Yes among those who answered; NaN for an empty segment"""
+        q = self._question(question, self.flag_questions)
+        cell = self._cell(customer_type, age_band, companion)
+        answered = self.flag_answered[cell][q]
+        return float(self.flag_yes[cell][q] / answered * 100) if answered else np.nan
+
+    def mean(self, question, customer_type=ALL, age_band=ALL, companion=ALL):
+        """Weighted mean score (0-10) among those who answered; NaN for an empty segment"""
+        q = self._question(question, self.score_questions)
+        cell = self._cell(customer_type, age_band, companion)
+        count = self.score_count[cell][q]
+        return float(self.score_sum[cell][q] / count) if count else np.nan
+
+    def count(self, customer_type=ALL, age_band=ALL, companion=ALL):
+        """Unweighted respondents in a segment (small cells deserve a caveat)"""
+        return int(self.respondent_counts[self._cell(customer_type, age_band, companion)])
+
+    def crosstab(self, question, rows='Customer Type', columns='Age Band', include_all=True, **fixed):
+        """
+        Segment table for one question (share % for Y/N questions, mean for scores)
+        The third dimension is held at `fixed` (default 'All'), e.g. crosstab(q, companion='Family')
+        """
+        return self._table(self._stat_cube(question), rows, columns, include_all, fixed)
+
+    def sizes(self, rows='Customer Type', columns='Age Band', include_all=True, **fixed):
+        """Unweighted respondent counts laid out like crosstab()"""
+        return self._table(self.respondent_counts, rows, columns, include_all, fixed).astype(int)
+
+    def _stat_cube(self, question):
+        """Share % (Y/N questions) or mean (scores) for every cell of one question"""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            if self._matches(question, self.flag_questions):
+                q = self._question(question, self.flag_questions)
+                return self.flag_yes[..., q] / self.flag_answered[..., q] * 100
+            q = self._question(question, self.score_questions)
+            return self.score_sum[..., q] / self.score_count[..., q]
+
+    def _select(self, cube, keep, fixed):
+        """Index the cube, keeping the `keep` dimensions whole and holding the rest at `fixed` (default 'All')"""
+        keywords = {'Customer Type': 'customer_type', 'Age Band': 'age_band', 'Companion': 'companion'}
+        index = tuple(slice(None) if dim in keep else self._index[dim][fixed.get(keywords[dim], ALL)]
+                      for dim in DIMENSIONS)
+        return cube[index]
+
+    def _table(self, cube, rows, columns, include_all, fixed):
+        table = self._select(cube, (rows, columns), fixed)
+        if DIMENSIONS.index(rows) > DIMENSIONS.index(columns):
+            table = table.T
+        df = pd.DataFrame(table, index=pd.Index(self.levels[rows], name=rows),
+                          columns=pd.Index(self.levels[columns], name=columns))
+        return df if include_all else df.drop(index=ALL, columns=ALL)
+
+    # ------------------------------------------------------------------------
+    # Summaries used by the charts
+    # ------------------------------------------------------------------------
+
+    def interest_by_sport(self, **segment):
+        """% of respondents interested in each sport (Series indexed by sport name, survey column order)"""
+        sports = [q[len(INTEREST_PREFIX):] for q in self.flag_questions if q.startswith(INTEREST_PREFIX)]
+        return pd.Series([self.share(INTEREST_PREFIX + sport, **segment) for sport in sports],
+                         index=pd.Index(sports, name='Sport'), name='Interest_Pct')
+
+    def satisfaction_summary(self, by='Customer Type', **fixed):
+        """Mean of every score question per level of one dimension"""
+        index = pd.Index(self.levels[by], name=by)
+        return pd.DataFrame({q.strip(): self._select(self._stat_cube(q), (by,), fixed)
+                             for q in self.score_questions}, index=index)
+
+    def cache_token(self):
+        """Content hash of the precomputed cells, so render-cache keys follow the data"""
+        digest = hashlib.sha256(repr((self.flag_questions, self.score_questions, self.levels)).encode())
+        for array in (self.flag_yes, self.flag_answered, self.score_sum, self.score_count):
+            digest.update(np.ascontiguousarray(array).tobytes())
+        return digest.hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def _load_survey_engine(file_path):
+    """Build the engine for a workbook once per process"""
+    _, survey_df = load_data(file_path)
+    with span('aggregate:survey', 'data'):
+        return SurveyEngine(survey_df)
+
+
+register_derived_cache(_load_survey_engine.cache_clear)
+
+
+def load_survey_engine(file_path=DATA_FILE):
+    """Return the shared survey engine built from the shared typed survey frame"""
+    return _load_survey_engine(file_path)
+
+
+if __name__ == "__main__":
+    import time
+
+    _, survey_df = load_data()
+    start = time.perf_counter()
+    engine = SurveyEngine(survey_df)
+    elapsed = time.perf_counter() - start
+
+    cells = engine.respondent_counts.size
+    print(f"📋 {engine.respondents} respondents encoded, {cells} segments x "
+          f"{len(engine.flag_questions) + len(engine.score_questions)} questions in {elapsed * 1000:.1f} ms")
+    print("\n📊 Sport interest (% of respondents):")
+    print(engine.interest_by_sport().round(1).to_string())
+    print("\n📊 Overall satisfaction by Customer Type x Age Band:")
+    print(engine.crosstab('Overall Satisfaction with University Gameday Experience').round(2).to_string())
+    print("\n👥 Respondents by Customer Type x Companion:")
+    print(engine.sizes('Customer Type', 'Companion').to_string())
+    print("\n😊 Satisfaction means by Companion:")
+    print(engine.satisfaction_summary('Companion').T.round(2).to_string())
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+KAGR Case Competition - Pipeline Tracing
+Spans around the expensive steps (load, features, chart builds, savefig/write_html, prs.save) that record wall
+time, CPU time, allocations and output bytes as a Chrome trace (chrome://tracing or ui.perfetto.dev)
+"""
+
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+
+PROFILERS = ('cprofile', 'pyinstrument')
+
+# ============================================================================
+# TRACER
+# ============================================================================
+
+class Tracer:
+    """
+    Collects complete ('X') trace events for one process
+    With allocations=True, tracemalloc reports each span's peak and net Python/NumPy allocation growth;
+    nested spans fold their peaks into every enclosing span, so the outer numbers stay right
+    """
+
+    def __init__(self, allocations=True):
+        self.pid = os.getpid()
+        self.events = []
+        self.allocations = allocations
+        self._open = []   # peak allocation seen so far by each open span, innermost last
+        self._lock = threading.Lock()
+        if allocations:
+            import tracemalloc
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+
+    def _fold_peak(self):
+        import tracemalloc
+
+        _, peak = tracemalloc.get_traced_memory()
+        for frame in self._open:
+            frame['peak'] = max(frame['peak'], peak)
+        tracemalloc.reset_peak()
+
+    @contextlib.contextmanager
+    def span(self, name, category, args):
+        info = dict(args)
+        if self.allocations:
+            import tracemalloc
+
+            self._fold_peak()
+            start_alloc = tracemalloc.get_traced_memory()[0]
+            frame = {'peak': start_alloc}
+            self._open.append(frame)
+        start_cpu = time.process_time()
+        start = time.perf_counter_ns()
+        try:
+            yield info
+        finally:
+            wall_ns = time.perf_counter_ns() - start
+            info['cpu_ms'] = round((time.process_time() - start_cpu) * 1000, 3)
+            if self.allocations:
+                self._fold_peak()
+                self._open = [f for f in self._open if f is not frame]
+                info['alloc_peak_bytes'] = frame['peak'] - start_alloc
+                info['alloc_net_bytes'] = tracemalloc.get_traced_memory()[0] - start_alloc
+            with self._lock:
+                self.events.append({'name': name, 'cat': category, 'ph': 'X', 'ts': start // 1000,
+                                    'dur': wall_ns // 1000, 'pid': self.pid, 'tid': threading.get_native_id(),
+                                    'args': info})
+
+    def drain(self):
+        """Hand over (and forget) the events recorded so far, e.g. to ship them from a worker to the parent"""
+        with self._lock:
+            events, self.events = self.events, []
+        return events
+
+
+_TRACER = None
+
+
+def enable(allocations=True):
+    """Start recording spans in this process (a forked child gets a fresh tracer of its own)"""
+    global _TRACER
+    if _TRACER is None or _TRACER.pid != os.getpid():
+        _TRACER = Tracer(allocations)
+    return _TRACER
+
+
+def disable():
+    global _TRACER
+    _TRACER = None
+
+
+def enabled():
+    return _TRACER is not None and _TRACER.pid == os.getpid()
+
+
+def allocations_enabled():
+    return enabled() and _TRACER.allocations
+
+
+def span(name, category='pipeline', **args):
+    """
+    with span('prs.save', 'pptx') as s: ... s['bytes'] = n
+    A no-op yielding a scratch dict when tracing is off, so call sites never check
+    """
+    if not enabled():
+        return contextlib.nullcontext({})
+    return _TRACER.span(name, category, args)
+
+
+def traced(name=None, category='pipeline'):
+    """Decorator form of span() named after the function"""
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name or func.__name__, category):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def drain():
+    return _TRACER.drain() if enabled() else []
+
+
+def merge(events):
+    """Add events recorded in another process (render workers) to this process's trace"""
+    if enabled() and events:
+        with _TRACER._lock:
+            _TRACER.events.extend(events)
+
+# ============================================================================
+# OUTPUT
+# ============================================================================
+
+def write_trace(path, events):
+    """Chrome trace JSON; every process gets a name row (main process vs. render workers)"""
+    main_pid = os.getpid()
+    pids = sorted({event['pid'] for event in events})
+    names = [{'name': 'process_name', 'ph': 'M', 'pid': pid,
+              'args': {'name': 'main' if pid == main_pid else f"worker {pid}"}} for pid in pids]
+    with open(path, 'w') as f:
+        json.dump({'traceEvents': names + events, 'displayTimeUnit': 'ms'}, f)
+
+
+def summarize(events, top=12):
+    """Per span name: count, wall, CPU, peak allocation and bytes written, heaviest first"""
+    totals = {}
+    for event in events:
+        row = totals.setdefault(event['name'], {'count': 0, 'wall_ms': 0.0, 'cpu_ms': 0.0,
+                                                 'alloc_peak_bytes': None, 'bytes': 0})
+        row['count'] += 1
+        row['wall_ms'] += event['dur'] / 1000
+        row['cpu_ms'] += event['args'].get('cpu_ms', 0)
+        if 'alloc_peak_bytes' in event['args']:
+            row['alloc_peak_bytes'] = max(row['alloc_peak_bytes'] or 0, event['args']['alloc_peak_bytes'])
+        row['bytes'] += event['args'].get('bytes', 0)
+    return sorted(totals.items(), key=lambda item: -item[1]['wall_ms'])[:top]
+
+
+def print_summary(events, top=12):
+    print(f"   {'span':<44} {'n':>4} {'wall ms':>9} {'cpu ms':>9} {'alloc MB':>9} {'out KB':>9}")
+    for name, row in summarize(events, top):
+        alloc = '-' if row['alloc_peak_bytes'] is None else f"{row['alloc_peak_bytes'] / 1024 / 1024:.1f}"
+        print(f"   {name[:44]:<44} {row['count']:>4} {row['wall_ms']:>9.1f} {row['cpu_ms']:>9.1f} "
+              f"{alloc:>9} {row['bytes'] / 1024:>9.0f}")
+
+# ============================================================================
+# CLI SESSION
+# ============================================================================
+
+def add_arguments(parser):
+    """--trace / --trace-no-alloc / --profile for an entry point"""
+    parser.add_argument('--trace', metavar='PATH',
+                        help="write a Chrome trace (chrome://tracing, ui.perfetto.dev) of the load, chart and save steps")
+    parser.add_argument('--trace-no-alloc', action='store_true',
+                        help="skip allocation tracking (tracemalloc slows Python-heavy steps)")
+    parser.add_argument('--profile', choices=PROFILERS,
+                        help="also profile the whole run (cProfile .prof, or pyinstrument HTML if installed)")
+
+
+class Session:
+    """
+    Tracing and/or profiling for one CLI run: start() before the work, stop() after it (or use `with`)
+    The profile lands next to the trace (or as <name>.prof / <name>.html in the working directory)
+    """
+
+    def __init__(self, trace=None, profile=None, allocations=True, name='run'):
+        self.trace = trace
+        self.profile = profile
+        self.allocations = allocations
+        self.name = name
+        self._profiler = None
+        self._root = None
+
+    @classmethod
+    def from_args(cls, args, name):
+        return cls(args.trace, args.profile, not args.trace_no_alloc, name)
+
+    def _profile_path(self, ext):
+        stem = os.path.splitext(self.trace)[0] if self.trace else self.name
+        return stem + ext
+
+    def start(self):
+        if self.trace:
+            enable(self.allocations)
+            self._root = span(self.name, 'session')
+            self._root.__enter__()
+        if self.profile == 'pyinstrument':
+            try:
+                from pyinstrument import Profiler
+            except ImportError:
+                print("⚠️  pyinstrument is not installed; profiling with cProfile instead")
+                self.profile = 'cprofile'
+            else:
+                self._profiler = Profiler()
+        if self.profile == 'cprofile':
+            import cProfile
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        elif self._profiler is not None:
+            self._profiler.start()
+        return self
+
+    def stop(self):
+        if self._profiler is not None:
+            if self.profile == 'cprofile':
+                self._profiler.disable()
+                path = self._profile_path('.prof')
+                self._profiler.dump_stats(path)
+            else:
+                self._profiler.stop()
+                path = self._profile_path('.html')
+                with open(path, 'w', encoding='utf-8') as f:
+                    f.write(self._profiler.output_html())
+            self._profiler = None
+            print(f"🔬 Profile written to {path}")
+        if self._root is not None:
+            self._root.__exit__(None, None, None)
+            self._root = None
+            events = drain()
+            write_trace(self.trace, events)
+            disable()
+            print(f"\n⏱️  Trace written to {self.trace} ({len(events)} spans)")
+            print_summary(events)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False